@@ -6,6 +6,7 @@ for tests by utilizing pytest-django's database fixture.
 """
 
 import pytest
+from django.core.cache import cache
 
 
 @pytest.fixture(autouse=True)
@@ -24,3 +25,39 @@ def aaa_db(db):
         database setup for the tests.
     """
     pass
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """
+    Fixture to start every test with empty caches.
+
+    Database changes are rolled back between tests, but cached values
+    derived from them are not, so the Django cache and the process-local
+    Setting instance are cleared before each test.
+    """
+    from kns.core.models import Setting
+
+    cache.clear()
+    Setting.invalidate_cache()
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Fixture to assert the number of queries run by a block of code.
+
+    Returns
+    -------
+    callable
+        `assert_query_budget`, to be used as a context manager.
+
+    Examples
+    --------
+    >>> def test_index(client, query_budget):
+    ...     with query_budget(10):
+    ...         client.get("/profiles/")
+    """
+    from kns.core.tests.query_budget import assert_query_budget
+
+    return assert_query_budget
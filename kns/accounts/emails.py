@@ -4,11 +4,12 @@ Utility functions for sending emails related to user account management.
 
 from django.conf import settings
 from django.contrib.sites.shortcuts import get_current_site
-from django.core.mail import send_mail
 from django.template.loader import render_to_string
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
 
+from kns.core.outbox import queue_mail
+
 from .utils import generate_verification_token
 
 
@@ -32,7 +33,7 @@ def send_password_change_email(user_email):
     from_email = settings.DEFAULT_FROM_EMAIL
     recipient_list = [user_email]
 
-    send_mail(
+    queue_mail(
         subject,
         message,
         from_email,
@@ -82,8 +83,8 @@ def send_verification_email(request, user):
         },
     )
 
-    # Send the email
-    send_mail(
+    # Queue the email
+    queue_mail(
         subject=subject,
         message="",
         from_email=settings.DEFAULT_FROM_EMAIL,
@@ -137,8 +138,8 @@ def send_set_password_email(request, profile):
         },
     )
 
-    # Send the email
-    send_mail(
+    # Queue the email
+    queue_mail(
         subject=subject,
         message="",
         from_email=settings.DEFAULT_FROM_EMAIL,
@@ -189,8 +190,8 @@ def send_welcome_email(request, profile, leader):
         },
     )
 
-    # Send the email
-    send_mail(
+    # Queue the email
+    queue_mail(
         subject=subject,
         message="",
         from_email=settings.DEFAULT_FROM_EMAIL,
@@ -8,6 +8,8 @@ from django.urls import reverse
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
 
+from kns.core.outbox import send_queued_emails
+
 from ..forms import ChangePasswordForm, LoginForm, SetPasswordForm
 from ..utils import generate_verification_token
 
@@ -218,6 +220,10 @@ class AuthenticationViewsTests(TestCase):
         self.assertRedirects(response, reverse("accounts:index"))
         self.user.refresh_from_db()
         self.assertTrue(self.user.check_password("newpassword123"))
+
+        # The email is queued and sent by the outbox worker
+        self.assertEqual(len(mail.outbox), 0)
+        send_queued_emails()
         self.assertEqual(len(mail.outbox), 1)
 
     def test_change_password_view_post_incorrect_current_password(self):
@@ -348,7 +354,8 @@ class AuthenticationViewsTests(TestCase):
             ),
         )
 
-        # Check that the email was sent
+        # Check that the email was queued and is sent by the outbox worker
+        send_queued_emails()
         self.assertEqual(len(mail.outbox), 1)
         self.assertIn(
             "Verify your email address",
@@ -208,7 +208,7 @@ class PromoteToLeaderRole(models.Model):  # pragma: no cover
         """
 
         # Retrieve the setting that determines if role change approval is required
-        setting = Setting.get_or_create_setting()
+        setting = Setting.get_cached()
 
         # If the change_role_approval_required setting is False, no approval is needed
         if not setting.change_role_approval_required:
@@ -19,4 +19,8 @@ urlpatterns = [
         "",
         include("kns.classifications.api_urls"),
     ),
+    path(
+        "",
+        include("kns.discipleships.api_urls"),
+    ),
 ]
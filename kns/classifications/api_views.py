@@ -4,10 +4,13 @@ Views for the `classifications` apis app.
 
 from django.http import JsonResponse
 
+from kns.core.reference_data import reference_data_view
+
 from .models import Classification, Subclassification
 from .serializers import ClassificationSerializer, SubclassificationSerializer
 
 
+@reference_data_view("classifications")
 def classifications_list(request):
     """
     Retrieve a list of all classifications and return them as a JSON response.
@@ -39,6 +42,7 @@ def classifications_list(request):
     return JsonResponse(data, safe=False)
 
 
+@reference_data_view("classifications")
 def classification_detail(request, id):
     """
     Retrieve the details of a specific classification by its ID and return them as a JSON response.
@@ -67,6 +71,7 @@ def classification_detail(request, id):
     return JsonResponse(data, safe=False)
 
 
+@reference_data_view("classifications")
 def subclassifications_list(request):
     """
     Retrieve a list of all subclassifications and return them as a JSON response.
@@ -5,9 +5,12 @@ Models for the `classifications` app.
 from uuid import uuid4
 
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from tinymce import models as tinymce_models
 
 from kns.core.modelmixins import TimestampedModel
+from kns.core.reference_data import bump_reference_data_version
 from kns.profiles.models import Profile
 
 
@@ -229,3 +232,25 @@ class ProfileClassification(TimestampedModel, models.Model):
             return f"{full_name} - {self.classification.title} ({self.subclassification.title})"
 
         return f"{full_name} - {self.classification.title}"
+
+
+@receiver(post_save, sender=Classification)
+@receiver(post_delete, sender=Classification)
+@receiver(post_save, sender=Subclassification)
+@receiver(post_delete, sender=Subclassification)
+@receiver(post_save, sender=ClassificationSubclassification)
+@receiver(post_delete, sender=ClassificationSubclassification)
+def bump_classifications_version(sender, **kwargs):
+    """
+    Bump the version of the classifications reference data when a
+    classification, subclassification or link between them is saved or
+    deleted, invalidating the ETags of the classifications API.
+
+    Parameters
+    ----------
+    sender : type
+        The model class that triggered the signal.
+    **kwargs : dict
+        Additional keyword arguments passed by the signal.
+    """
+    bump_reference_data_version("classifications")
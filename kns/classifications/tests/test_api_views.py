@@ -128,3 +128,33 @@ class ClassificationViewsTestCase(TestCase):
 
         self.assertIn("Subclassification 1", subclassification_titles)
         self.assertIn("Subclassification 2", subclassification_titles)
+
+    def test_classifications_list_conditional_get(self):
+        """
+        Test that a request with a matching ETag gets a 304 without
+        querying the database.
+        """
+        url = reverse("api:classifications_list")
+        response = self.client.get(url)
+
+        self.assertIn("ETag", response)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_classifications_etag_changes_on_delete(self):
+        """
+        Test that deleting a subclassification invalidates the
+        classifications ETag.
+        """
+        url = reverse("api:classifications_list")
+        etag = self.client.get(url)["ETag"]
+
+        self.subclassification2.delete()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
@@ -4,7 +4,7 @@ Django admin site configuration for the `core` app.
 
 from django.contrib import admin
 
-from .models import FAQ, Notification, NotificationRecipient, Setting
+from .models import FAQ, Notification, NotificationRecipient, OutboxEmail, Setting
 
 # Registering the FAQ model with the admin site
 admin.site.register(FAQ)
@@ -57,3 +57,26 @@ class NotificationRecipientAdmin(admin.ModelAdmin):
         "recipient__user__username",
     )
     list_filter = ("is_read", "read_at")
+
+
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the OutboxEmail model.
+
+    This class lets admins monitor queued emails and find failed ones.
+    """
+
+    list_display = (
+        "id",
+        "subject",
+        "status",
+        "attempts",
+        "next_attempt_at",
+        "sent_at",
+    )
+    search_fields = (
+        "subject",
+        "recipient_list",
+    )
+    list_filter = ("status", "created_at")
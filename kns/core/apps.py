@@ -12,3 +12,9 @@ class CoreConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "kns.core"
+
+    def ready(self):
+        """
+        Register the system checks of the app.
+        """
+        from . import checks  # noqa: F401
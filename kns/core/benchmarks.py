@@ -0,0 +1,878 @@
+"""
+Benchmarks of the hot views and APIs.
+
+Every benchmark times a single operation, such as rendering the profiles
+index with a set of filters, against the data in the database, which is
+meant to be a network built by `generate_synthetic_network`. Requests
+are made with the Django test client, logged in as the leader of the
+root group so that the views see the whole network.
+
+`run_benchmarks` reports the latency percentiles of every benchmark
+along with the number of queries it runs. The `run_benchmarks`
+management command saves the results as JSON so that they can be
+compared between releases. It is the only importer of this module, which
+is why the module may use the test client: it is never loaded by the
+web application.
+
+Benchmarks are registered with the `benchmark` decorator on a function
+that receives the `BenchmarkEnvironment` and returns the callable to
+time. Queries registered with the `query_plan` decorator are both timed
+and explained, so that index changes show up as plan changes.
+"""
+
+import functools
+import math
+import statistics
+import time
+from datetime import date
+
+from django.contrib.sessions.backends.db import SessionStore
+from django.db import connection
+from django.http import HttpResponse
+from django.test import Client, RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from kns.custom_user.models import User
+from kns.discipleships.models import Discipleship
+from kns.groups.models import Group, GroupMember
+from kns.groups.utils import GroupStatistics
+from kns.onboarding.middleware import OnboardingMiddleware
+from kns.profiles.models import Profile
+from kns.skills.models import Skill
+
+BENCHMARKS = {}
+
+QUERY_PLANS = {}
+
+PERCENTILES = [50, 90, 95, 99]
+
+
+class BenchmarkError(Exception):
+    """
+    Raised when a benchmark cannot run or fails.
+    """
+
+
+def benchmark(name):
+    """
+    Register a benchmark.
+
+    Parameters
+    ----------
+    name : str
+        The unique name of the benchmark.
+
+    Returns
+    -------
+    callable
+        A decorator registering a function that receives the
+        `BenchmarkEnvironment` and returns the callable to time.
+    """
+
+    def decorator(function):
+        """
+        Register a function as the benchmark.
+
+        Parameters
+        ----------
+        function : callable
+            A function receiving the `BenchmarkEnvironment` and returning
+            the callable to time.
+
+        Returns
+        -------
+        callable
+            The function, unchanged.
+        """
+        BENCHMARKS[name] = function
+        return function
+
+    return decorator
+
+
+def query_plan(name):
+    """
+    Register a query whose plan is reported, and time it as the
+    `query[<name>]` benchmark.
+
+    Parameters
+    ----------
+    name : str
+        The unique name of the query.
+
+    Returns
+    -------
+    callable
+        A decorator registering a function that receives the
+        `BenchmarkEnvironment` and returns the QuerySet to explain.
+    """
+
+    def decorator(function):
+        """
+        Register a function as the query to explain and time.
+
+        Parameters
+        ----------
+        function : callable
+            A function receiving the `BenchmarkEnvironment` and returning
+            the QuerySet to explain.
+
+        Returns
+        -------
+        callable
+            The function, unchanged.
+        """
+        QUERY_PLANS[name] = function
+        benchmark(f"query[{name}]")(functools.partial(get_query_run, function))
+        return function
+
+    return decorator
+
+
+def get_query_run(get_queryset, environment):
+    """
+    Return a callable evaluating a query.
+
+    Parameters
+    ----------
+    get_queryset : callable
+        A function receiving the `BenchmarkEnvironment` and returning
+        the QuerySet to evaluate.
+    environment : BenchmarkEnvironment
+        The benchmark environment.
+
+    Returns
+    -------
+    callable
+        A callable evaluating a fresh copy of the QuerySet.
+    """
+    queryset = get_queryset(environment)
+
+    return lambda: list(queryset.all())
+
+
+class BenchmarkEnvironment:
+    """
+    The data and clients shared by the benchmarks.
+
+    Raises
+    ------
+    BenchmarkError
+        If there is no group tree to benchmark against.
+    """
+
+    def __init__(self):
+        """
+        Load the root group and log its leader in.
+        """
+        self.root_group = (
+            Group.objects.filter(parent=None)
+            .select_related("leader__user")
+            .order_by("-rght")
+            .first()
+        )
+
+        if self.root_group is None:
+            raise BenchmarkError(
+                "There are no groups to benchmark against. "
+                "Run `generate_synthetic_network` first."
+            )
+
+        self.leader = self.root_group.leader
+        self.user = self.leader.user
+
+        self.client = Client()
+        self.client.force_login(self.user)
+        self.request_factory = RequestFactory()
+
+    def get(self, url, data=None):
+        """
+        Return a callable requesting a page as the root group leader.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the page.
+        data : dict, optional
+            The query parameters of the request.
+
+        Returns
+        -------
+        callable
+            A callable making the request.
+        """
+
+        def request():
+            """
+            Request the page and check that it succeeded.
+
+            Returns
+            -------
+            HttpResponse
+                The response of the page.
+
+            Raises
+            ------
+            BenchmarkError
+                If the page does not return a 200 status code.
+            """
+            response = self.client.get(url, data)
+
+            if response.status_code != 200:
+                raise BenchmarkError(f"{url} returned {response.status_code}.")
+
+            return response
+
+        return request
+
+    def get_dataset(self):
+        """
+        Describe the data the benchmarks run against.
+
+        Returns
+        -------
+        dict
+            The number of rows of the main tables and the depth of the
+            group tree.
+        """
+        deepest_group = Group.objects.order_by("-level").first()
+
+        return {
+            "profiles": Profile.objects.count(),
+            "groups": Group.objects.count(),
+            "group_members": GroupMember.objects.count(),
+            "discipleships": Discipleship.objects.count(),
+            "group_tree_depth": deepest_group.level + 1,
+        }
+
+
+def percentile(values, percent):
+    """
+    Return a percentile of values using the nearest-rank method.
+
+    Parameters
+    ----------
+    values : list of float
+        The values, in any order.
+    percent : int
+        The percentile to return, between 0 and 100.
+
+    Returns
+    -------
+    float
+        The smallest value greater than or equal to `percent` percent of
+        the values.
+    """
+    values = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(values)), 1)
+
+    return values[rank - 1]
+
+
+def summarize(name, durations, queries):
+    """
+    Summarize the timings of a benchmark.
+
+    Parameters
+    ----------
+    name : str
+        The name of the benchmark.
+    durations : list of float
+        The duration of every timed run, in seconds.
+    queries : int
+        The number of queries of a single run.
+
+    Returns
+    -------
+    dict
+        The number of runs and queries, and the mean, minimum, maximum
+        and percentile latencies in milliseconds.
+    """
+    durations = [duration * 1000 for duration in durations]
+
+    result = {
+        "name": name,
+        "iterations": len(durations),
+        "queries": queries,
+        "mean_ms": round(statistics.mean(durations), 3),
+        "min_ms": round(min(durations), 3),
+        "max_ms": round(max(durations), 3),
+    }
+
+    for percent in PERCENTILES:
+        result[f"p{percent}_ms"] = round(percentile(durations, percent), 3)
+
+    return result
+
+
+def run_benchmark(name, function, iterations, warmup):
+    """
+    Time a single benchmark.
+
+    The queries are counted on the first warm-up run, so that capturing
+    them does not affect the timed runs.
+
+    Parameters
+    ----------
+    name : str
+        The name of the benchmark.
+    function : callable
+        The operation to time.
+    iterations : int
+        The number of timed runs.
+    warmup : int
+        The number of untimed runs made first. At least one is made.
+
+    Returns
+    -------
+    dict
+        The summary of the benchmark, see `summarize`.
+    """
+    with CaptureQueriesContext(connection) as context:
+        function()
+
+    # Later requests reset the query log the count is read from
+    queries = len(context)
+
+    for _ in range(warmup - 1):
+        function()
+
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+
+    return summarize(name, durations, queries)
+
+
+def is_selected(name, names):
+    """
+    Return whether a benchmark is selected to run.
+
+    Parameters
+    ----------
+    name : str
+        The name of the benchmark.
+    names : list of str or None
+        The strings one of which the name must contain, or None to
+        select every benchmark.
+
+    Returns
+    -------
+    bool
+        True if the benchmark is selected.
+    """
+    return not names or any(part in name for part in names)
+
+
+def run_benchmarks(names=None, iterations=20, warmup=2, explain=False):
+    """
+    Run the registered benchmarks.
+
+    Parameters
+    ----------
+    names : list of str, optional
+        Only run the benchmarks whose name contains one of these
+        strings. Defaults to every benchmark.
+    iterations : int, optional
+        The number of timed runs of every benchmark.
+    warmup : int, optional
+        The number of untimed runs made before timing.
+    explain : bool, optional
+        Whether to also report the plans of the selected queries.
+
+    Returns
+    -------
+    dict
+        The `dataset` the benchmarks ran against and their `results`,
+        and their `query_plans` if `explain` is True.
+
+    Raises
+    ------
+    BenchmarkError
+        If there is no data to benchmark against or a request fails.
+    """
+    # The test client is served as `testserver`
+    with override_settings(ALLOWED_HOSTS=["testserver"]):
+        environment = BenchmarkEnvironment()
+        results = []
+
+        for name, setup in BENCHMARKS.items():
+            if not is_selected(name, names):
+                continue
+
+            results.append(
+                run_benchmark(name, setup(environment), iterations, warmup),
+            )
+
+    report = {
+        "dataset": environment.get_dataset(),
+        "results": results,
+    }
+
+    if explain:
+        report["query_plans"] = [
+            {"name": name, "plan": get_queryset(environment).explain()}
+            for name, get_queryset in QUERY_PLANS.items()
+            if is_selected(f"query[{name}]", names)
+        ]
+
+    return report
+
+
+def compare_results(results, baseline):
+    """
+    Compare benchmark results with a baseline.
+
+    Parameters
+    ----------
+    results : list of dict
+        The results of the current run.
+    baseline : list of dict
+        The results of the run to compare with.
+
+    Returns
+    -------
+    list of dict
+        For every benchmark present in both runs, the relative change of
+        its median latency and the change in its number of queries.
+    """
+    baseline = {result["name"]: result for result in baseline}
+    changes = []
+
+    for result in results:
+        previous = baseline.get(result["name"])
+
+        if previous is None:
+            continue
+
+        changes.append(
+            {
+                "name": result["name"],
+                "p50_change": round(
+                    (result["p50_ms"] - previous["p50_ms"])
+                    / max(previous["p50_ms"], 0.001),
+                    3,
+                ),
+                "queries_change": result["queries"] - previous["queries"],
+            }
+        )
+
+    return changes
+
+
+def get_changed_plans(query_plans, baseline):
+    """
+    Return the queries whose plan differs from a baseline.
+
+    Parameters
+    ----------
+    query_plans : list of dict
+        The query plans of the current run.
+    baseline : list of dict
+        The query plans of the run to compare with.
+
+    Returns
+    -------
+    list of str
+        The names of the queries explained in both runs whose plan
+        changed.
+    """
+    baseline = {query_plan["name"]: query_plan["plan"] for query_plan in baseline}
+
+    return [
+        query_plan["name"]
+        for query_plan in query_plans
+        if query_plan["name"] in baseline
+        and query_plan["plan"] != baseline[query_plan["name"]]
+    ]
+
+
+PROFILES_INDEX_FILTERS = {
+    "all": lambda environment: {},
+    "search": lambda environment: {"search": "an"},
+    "sorted": lambda environment: {"sort_by": "last_name", "order": "desc"},
+    "basic_info": lambda environment: {
+        "role": "member",
+        "gender": "female",
+        "location_country": "NG",
+    },
+    "skills": lambda environment: {
+        "skills": list(Skill.objects.values_list("pk", flat=True)[:3]),
+    },
+}
+
+GROUPS_INDEX_FILTERS = {
+    "all": {},
+    "num_members": {"num_members": 5},
+    "num_leaders": {"num_leaders": 1},
+    "num_mentors": {"num_members": 1, "num_mentors": 1},
+}
+
+
+def register_filter_benchmarks():
+    """
+    Register a benchmark for every filter combination of the profiles
+    and groups indexes.
+    """
+    for key, get_params in PROFILES_INDEX_FILTERS.items():
+        benchmark(f"profiles_index[{key}]")(
+            lambda environment, get_params=get_params: environment.get(
+                reverse("profiles:index"),
+                get_params(environment),
+            )
+        )
+
+    for key, params in GROUPS_INDEX_FILTERS.items():
+        benchmark(f"groups_index[{key}]")(
+            lambda environment, params=params: environment.get(
+                reverse("groups:index"),
+                params,
+            )
+        )
+
+
+register_filter_benchmarks()
+
+
+@benchmark("group_statistics")
+def group_statistics(environment):
+    """
+    Compute the statistics of every group.
+
+    Parameters
+    ----------
+    environment : BenchmarkEnvironment
+        The benchmark environment.
+
+    Returns
+    -------
+    callable
+        A callable computing the statistics.
+    """
+    return lambda: GroupStatistics(Group.objects.all()).get_all_statistics()
+
+
+@benchmark("group_descendants[nested]")
+def group_descendants_nested(environment):
+    """
+    Load the whole tree under the root group.
+
+    Parameters
+    ----------
+    environment : BenchmarkEnvironment
+        The benchmark environment.
+
+    Returns
+    -------
+    callable
+        A callable making the request.
+    """
+    return environment.get(
+        reverse("api:group_descendants", kwargs={"pk": environment.root_group.pk}),
+    )
+
+
+@benchmark("group_descendants[max_depth]")
+def group_descendants_max_depth(environment):
+    """
+    Load the first two levels under the root group.
+
+    Parameters
+    ----------
+    environment : BenchmarkEnvironment
+        The benchmark environment.
+
+    Returns
+    -------
+    callable
+        A callable making the request.
+    """
+    return environment.get(
+        reverse("api:group_descendants", kwargs={"pk": environment.root_group.pk}),
+        {"max_depth": 2},
+    )
+
+
+@benchmark("group_descendants[paginated]")
+def group_descendants_paginated(environment):
+    """
+    Load the first page of the tree under the root group.
+
+    Parameters
+    ----------
+    environment : BenchmarkEnvironment
+        The benchmark environment.
+
+    Returns
+    -------
+    callable
+        A callable making the request.
+    """
+    return environment.get(
+        reverse("api:group_descendants", kwargs={"pk": environment.root_group.pk}),
+        {"limit": 50},
+    )
+
+
+@benchmark("profile_discipleships")
+def profile_discipleships(environment):
+    """
+    Render the discipleships of the root group leader.
+
+    Parameters
+    ----------
+    environment : BenchmarkEnvironment
+        The benchmark environment.
+
+    Returns
+    -------
+    callable
+        A callable making the request.
+    """
+    return environment.get(
+        reverse(
+            "discipleships:profile_discipleships",
+            kwargs={"profile_slug": environment.leader.slug},
+        ),
+    )
+
+
+def get_onboarding_middleware_run(environment, new_session):
+    """
+    Return a callable running the onboarding middleware on its own.
+
+    Parameters
+    ----------
+    environment : BenchmarkEnvironment
+        The benchmark environment.
+    new_session : bool
+        Whether every run starts with an empty session, i.e. without the
+        onboarding status cached in it. The user is then loaded again on
+        every run, as the authentication middleware does, so that their
+        profile is not cached either.
+
+    Returns
+    -------
+    callable
+        A callable running the middleware with a view that does nothing.
+    """
+    middleware = OnboardingMiddleware(lambda request: HttpResponse())
+    session = SessionStore()
+
+    def run():
+        """
+        Run the middleware on a request to the profiles index.
+
+        Returns
+        -------
+        HttpResponse
+            The response of the middleware.
+        """
+        request = environment.request_factory.get(reverse("profiles:index"))
+
+        if new_session:
+            request.user = User.objects.get(pk=environment.user.pk)
+            request.session = SessionStore()
+        else:
+            request.user = environment.user
+            request.session = session
+
+        return middleware(request)
+
+    return run
+
+
+@benchmark("onboarding_middleware[cached]")
+def onboarding_middleware_cached(environment):
+    """
+    Run the onboarding middleware with the status cached in the session.
+
+    Parameters
+    ----------
+    environment : BenchmarkEnvironment
+        The benchmark environment.
+
+    Returns
+    -------
+    callable
+        A callable running the middleware.
+    """
+    return get_onboarding_middleware_run(environment, new_session=False)
+
+
+@benchmark("onboarding_middleware[new_session]")
+def onboarding_middleware_new_session(environment):
+    """
+    Run the onboarding middleware on a new session.
+
+    Parameters
+    ----------
+    environment : BenchmarkEnvironment
+        The benchmark environment.
+
+    Returns
+    -------
+    callable
+        A callable running the middleware.
+    """
+    return get_onboarding_middleware_run(environment, new_session=True)
+
+
+@query_plan("profiles_by_role_and_country")
+def profiles_by_role_and_country(environment):
+    """
+    The profiles index filtered by role and country.
+
+    Parameters
+    ----------
+    environment : BenchmarkEnvironment
+        The benchmark environment.
+
+    Returns
+    -------
+    QuerySet
+        The query to explain and time.
+    """
+    return Profile.objects.filter(role="member", location_country="NG").order_by(
+        "created_at"
+    )[:12]
+
+
+@query_plan("profiles_by_gender_and_age")
+def profiles_by_gender_and_age(environment):
+    """
+    The profiles index filtered by gender and minimum age.
+
+    Parameters
+    ----------
+    environment : BenchmarkEnvironment
+        The benchmark environment.
+
+    Returns
+    -------
+    QuerySet
+        The query to explain and time.
+    """
+    return Profile.objects.filter(
+        gender="female",
+        date_of_birth__lte=date(2000, 1, 1),
+    ).order_by("created_at")[:12]
+
+
+@query_plan("mentors")
+def mentors(environment):
+    """
+    The profiles index filtered on the mentors.
+
+    Parameters
+    ----------
+    environment : BenchmarkEnvironment
+        The benchmark environment.
+
+    Returns
+    -------
+    QuerySet
+        The query to explain and time.
+    """
+    return Profile.objects.filter(is_mentor=True).order_by("created_at")[:12]
+
+
+@query_plan("profiles_by_last_name")
+def profiles_by_last_name(environment):
+    """
+    The profiles index sorted by last name.
+
+    Parameters
+    ----------
+    environment : BenchmarkEnvironment
+        The benchmark environment.
+
+    Returns
+    -------
+    QuerySet
+        The query to explain and time.
+    """
+    return Profile.objects.order_by("last_name", "first_name")[:12]
+
+
+@query_plan("groups_by_location")
+def groups_by_location(environment):
+    """
+    The groups index filtered by country and city.
+
+    Parameters
+    ----------
+    environment : BenchmarkEnvironment
+        The benchmark environment.
+
+    Returns
+    -------
+    QuerySet
+        The query to explain and time.
+    """
+    return Group.objects.filter(location_country="NG", location_city="Lagos")
+
+
+@query_plan("discipleships_by_discipler_and_group")
+def discipleships_by_discipler_and_group(environment):
+    """
+    The discipleships of a discipler at a stage.
+
+    Parameters
+    ----------
+    environment : BenchmarkEnvironment
+        The benchmark environment.
+
+    Returns
+    -------
+    QuerySet
+        The query to explain and time.
+    """
+    return Discipleship.objects.filter(
+        discipler=environment.leader,
+        group="group_member",
+    )
+
+
+@query_plan("discipleship_history")
+def discipleship_history(environment):
+    """
+    The discipleship history of a disciple with a discipler.
+
+    Parameters
+    ----------
+    environment : BenchmarkEnvironment
+        The benchmark environment.
+
+    Returns
+    -------
+    QuerySet
+        The query to explain and time.
+    """
+    discipleship = Discipleship.objects.order_by("pk").first()
+
+    return Discipleship.objects.filter(
+        disciple=discipleship.disciple_id,
+        discipler=discipleship.discipler_id,
+    ).order_by("created_at")
+
+
+@query_plan("ongoing_discipleships")
+def ongoing_discipleships(environment):
+    """
+    The discipleships index filtered on the ongoing discipleships.
+
+    Parameters
+    ----------
+    environment : BenchmarkEnvironment
+        The benchmark environment.
+
+    Returns
+    -------
+    QuerySet
+        The query to explain and time.
+    """
+    return Discipleship.objects.filter(completed_at__isnull=True)[:6]
@@ -0,0 +1,238 @@
+"""
+Helpers for the application caches.
+
+Every cached value belongs to a namespace (e.g. `"onboarding_steps"`).
+Keys are built as `<namespace>:<part>:<part>...` on top of the
+`KEY_PREFIX` and `VERSION` configured in `CACHES`, so several deployments
+can share one cache server. A namespace can also be versioned: bumping
+its version makes every key written under the previous version
+unreachable, which invalidates a whole group of values in one write.
+
+Hits and misses are counted per namespace in every process and can be
+read with `get_stats` for monitoring.
+"""
+
+from collections import Counter, defaultdict
+from uuid import uuid4
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+_stats = defaultdict(Counter)
+
+# Marks a miss, since `None` can be a cached value.
+_MISSING = object()
+
+
+def get_cache():
+    """
+    Return the cache backend used by the application.
+
+    Returns
+    -------
+    BaseCache
+        The `default` cache configured in `CACHES`.
+    """
+    return caches["default"]
+
+
+def make_key(namespace, *parts):
+    """
+    Build the cache key of a value in a namespace.
+
+    Parameters
+    ----------
+    namespace : str
+        The namespace of the value.
+    *parts
+        The parts identifying the value within the namespace.
+
+    Returns
+    -------
+    str
+        The cache key.
+    """
+    return ":".join(str(part) for part in (namespace, *parts))
+
+
+def _record(namespace, hit):
+    """
+    Count a cache hit or miss for a namespace.
+
+    Parameters
+    ----------
+    namespace : str
+        The namespace that was read.
+    hit : bool
+        Whether the value was found in the cache.
+    """
+    _stats[namespace]["hits" if hit else "misses"] += 1
+
+
+def get(namespace, *parts, default=None):
+    """
+    Read a value from the cache.
+
+    Parameters
+    ----------
+    namespace : str
+        The namespace of the value.
+    *parts
+        The parts identifying the value within the namespace.
+    default : object, optional
+        The value returned on a miss. Defaults to None.
+
+    Returns
+    -------
+    object
+        The cached value, or `default` if it is not cached.
+    """
+    value = get_cache().get(make_key(namespace, *parts), _MISSING)
+    _record(namespace, value is not _MISSING)
+
+    return default if value is _MISSING else value
+
+
+def set(namespace, *parts, value, timeout=DEFAULT_TIMEOUT):
+    """
+    Write a value to the cache.
+
+    Parameters
+    ----------
+    namespace : str
+        The namespace of the value.
+    *parts
+        The parts identifying the value within the namespace.
+    value : object
+        The value to cache.
+    timeout : int or None, optional
+        The number of seconds to keep the value, or None to keep it until
+        it is evicted or invalidated. Defaults to the `TIMEOUT` of the
+        cache.
+    """
+    get_cache().set(make_key(namespace, *parts), value, timeout=timeout)
+
+
+def get_or_set(namespace, *parts, default, timeout=DEFAULT_TIMEOUT):
+    """
+    Read a value from the cache, computing and caching it on a miss.
+
+    Parameters
+    ----------
+    namespace : str
+        The namespace of the value.
+    *parts
+        The parts identifying the value within the namespace.
+    default : callable or object
+        The value to cache on a miss. Callables are only called on a miss.
+    timeout : int or None, optional
+        The number of seconds to keep a computed value, or None to keep it
+        until it is evicted or invalidated. Defaults to the `TIMEOUT` of
+        the cache.
+
+    Returns
+    -------
+    object
+        The cached or newly computed value.
+    """
+    value = get(namespace, *parts, default=_MISSING)
+
+    if value is _MISSING:
+        value = default() if callable(default) else default
+        set(namespace, *parts, value=value, timeout=timeout)
+
+    return value
+
+
+def delete(namespace, *parts):
+    """
+    Remove a value from the cache.
+
+    Parameters
+    ----------
+    namespace : str
+        The namespace of the value.
+    *parts
+        The parts identifying the value within the namespace.
+    """
+    get_cache().delete(make_key(namespace, *parts))
+
+
+def get_version(namespace, *parts):
+    """
+    Return the current version of a versioned namespace.
+
+    Parameters
+    ----------
+    namespace : str
+        The versioned namespace.
+    *parts
+        Optional parts scoping the version, e.g. a tree id.
+
+    Returns
+    -------
+    str
+        The version to include in the keys of the namespace.
+    """
+    return get_or_set(
+        f"{namespace}_version",
+        *parts,
+        default=lambda: uuid4().hex,
+        timeout=None,
+    )
+
+
+def bump_version(namespace, *parts):
+    """
+    Invalidate every value written under the current version of a
+    versioned namespace.
+
+    A new random version is used instead of incrementing the old one, so
+    an evicted version key can never bring back stale values.
+
+    Parameters
+    ----------
+    namespace : str
+        The versioned namespace.
+    *parts
+        Optional parts scoping the version, e.g. a tree id.
+
+    Returns
+    -------
+    str
+        The new version.
+    """
+    version = uuid4().hex
+    set(f"{namespace}_version", *parts, value=version, timeout=None)
+
+    return version
+
+
+def get_stats():
+    """
+    Return the cache hit and miss counters of this process.
+
+    Returns
+    -------
+    dict
+        A mapping of namespace to a dictionary with `hits`, `misses` and
+        `hit_rate` keys.
+    """
+    stats = {}
+
+    for namespace, counter in sorted(_stats.items()):
+        total = counter["hits"] + counter["misses"]
+        stats[namespace] = {
+            "hits": counter["hits"],
+            "misses": counter["misses"],
+            "hit_rate": round(counter["hits"] / total, 3) if total else None,
+        }
+
+    return stats
+
+
+def reset_stats():
+    """
+    Reset the cache hit and miss counters of this process.
+    """
+    _stats.clear()
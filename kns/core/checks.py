@@ -0,0 +1,52 @@
+"""
+System checks for the `core` app.
+"""
+
+from django.conf import settings
+from django.core import checks
+
+LOCAL_CACHE_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+@checks.register(checks.Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    """
+    Warn when the default cache is not shared between processes.
+
+    The versions of the cached namespaces (e.g. the settings and the group
+    subtree statistics) are kept in the default cache. With a cache local
+    to each process, a version bumped by one process is not seen by the
+    others, which keep serving stale values.
+
+    Parameters
+    ----------
+    app_configs : list or None
+        The app configs to check, or None to check every app.
+    **kwargs
+        Other keyword arguments passed by the check framework.
+
+    Returns
+    -------
+    list of CheckMessage
+        A warning if the default cache is local to each process outside
+        of debug mode, otherwise an empty list.
+    """
+    backend = settings.CACHES.get("default", {}).get("BACKEND")
+
+    if settings.DEBUG or backend not in LOCAL_CACHE_BACKENDS:
+        return []
+
+    return [
+        checks.Warning(
+            "The default cache is local to each process.",
+            hint=(
+                "Configure a shared CACHE_BACKEND (e.g. Redis or Memcached) "
+                "so cache invalidations reach every process."
+            ),
+            obj=backend,
+            id="core.W001",
+        )
+    ]
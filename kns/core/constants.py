@@ -115,3 +115,37 @@ STATUS_CHOICES = [
 NOTIFICATION_TYPES = [
     ("group_move", "Group Move"),
 ]
+
+# How long a process keeps the Setting row in memory before checking the
+# shared cache for a newer version saved by another worker.
+SETTING_CACHE_TIMEOUT = 30
+SETTING_CACHE_NAMESPACE = "setting"
+
+REQUEST_INSTRUMENTATION_SAMPLE_PERCENT = 100
+
+OUTBOX_EMAIL_STATUSES = [
+    ("pending", "Pending"),
+    ("sent", "Sent"),
+    ("failed", "Failed"),
+]
+
+# Queued emails are sent in batches over one connection. A failed email
+# is retried after OUTBOX_RETRY_DELAY seconds, doubled on every attempt,
+# and given up on after OUTBOX_MAX_ATTEMPTS attempts. A claimed batch is
+# not handed to another worker for OUTBOX_CLAIM_TIMEOUT seconds, after
+# which the emails of a worker that died while sending are due again.
+OUTBOX_BATCH_SIZE = 100
+OUTBOX_MAX_ATTEMPTS = 5
+OUTBOX_RETRY_DELAY = 60
+OUTBOX_CLAIM_TIMEOUT = 10 * 60
+
+# The unread notification count of every profile is cached until one of
+# their notifications is created or read.
+UNREAD_NOTIFICATIONS_CACHE_NAMESPACE = "notifications_unread_count"
+UNREAD_NOTIFICATIONS_CACHE_TIMEOUT = 60 * 60
+
+# The total number of rows of a filtered directory is cached for
+# DIRECTORY_COUNT_CACHE_TIMEOUT seconds, so moving between its pages does
+# not count them again.
+DIRECTORY_COUNT_CACHE_NAMESPACE = "directory_count"
+DIRECTORY_COUNT_CACHE_TIMEOUT = 60
@@ -2,7 +2,7 @@
 Context processors for the `core` app.
 """
 
-from collections import defaultdict
+from django.utils.functional import SimpleLazyObject
 
 from .models import NotificationRecipient, Setting
 
@@ -21,7 +21,7 @@ def settings_context(request):
     dict
         A dictionary with a 'settings' key containing the settings instance.
     """
-    settings = Setting.get_or_create_setting()
+    settings = Setting.get_cached()
 
     return {
         "settings": settings,
@@ -30,10 +30,12 @@ def settings_context(request):
 
 def notifications_context(request):
     """
-    Add unread notifications to the context for authenticated users.
+    Add the number of unread notifications to the context for
+    authenticated users.
 
-    Retrieves unread notifications for the logged-in user and groups them
-    by time period (e.g., Today, Yesterday).
+    The count is lazy, so it is only loaded when a template renders it.
+    The notifications themselves are loaded by the notification drawer
+    from `core:notifications_drawer` when it is opened.
 
     Parameters
     ----------
@@ -43,31 +45,24 @@ def notifications_context(request):
     Returns
     -------
     dict
-        A dictionary containing:
-        - 'unread_notifications': a list of unread notifications.
-        - 'grouped_notifications': a dictionary grouping notifications by time period.
+        A dictionary containing 'unread_notifications_count', the number
+        of unread notifications.
     """
-    if request.user.is_authenticated:
-        # Get the unread notifications with related notification details
-        unread_notifications = NotificationRecipient.objects.filter(
-            recipient=request.user.profile,
-            is_read=False,
-        ).select_related("notification")[:10]
-
-        # Group notifications by time period (Today, Yesterday, etc.)
-        grouped_notifications = defaultdict(list)
-        for recipient_notification in unread_notifications:
-            notification = recipient_notification.notification
-            period = notification.time_period()  # Use the time_period method
-            grouped_notifications[period].append(notification)
-
-        # Convert defaultdict to a regular dict before passing to the template
-        grouped_notifications = dict(grouped_notifications)
-    else:
-        unread_notifications = []
-        grouped_notifications = {}
+
+    def get_unread_notifications_count():
+        """
+        Load the number of unread notifications of the user.
+
+        Returns
+        -------
+        int
+            The number of unread notifications, or 0 for anonymous users.
+        """
+        if not request.user.is_authenticated:
+            return 0
+
+        return NotificationRecipient.get_unread_count(request.user.profile)
 
     return {
-        "unread_notifications": unread_notifications,
-        "grouped_notifications": grouped_notifications,
+        "unread_notifications_count": SimpleLazyObject(get_unread_notifications_count),
     }
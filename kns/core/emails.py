@@ -4,10 +4,11 @@ Emails functions for the `core` app.
 
 from django.conf import settings
 from django.contrib.sites.shortcuts import get_current_site
-from django.core.mail import send_mail
 from django.template.loader import render_to_string
 from django.utils import timezone
 
+from .outbox import queue_mail
+
 
 def send_group_change_notification_email(
     request,
@@ -50,8 +51,8 @@ def send_group_change_notification_email(
         },
     )
 
-    # Send the email
-    send_mail(
+    # Queue the email
+    queue_mail(
         subject=subject,
         message="",
         from_email=settings.DEFAULT_FROM_EMAIL,
@@ -0,0 +1,269 @@
+"""
+Timing of the database, templates and context processors of a request.
+
+`RequestInstrumentationMiddleware` makes a `RequestMetrics` current for
+the requests it samples. While one is current, queries are recorded by
+the database execute wrapper, and `InstrumentedDjangoTemplates`, the
+template backend of the project, times template rendering and context
+processors. Outside of sampled requests the backend adds a single
+context variable lookup per render.
+"""
+
+import functools
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.template.backends.django import DjangoTemplates, Template
+
+current_metrics = ContextVar("current_metrics", default=None)
+
+
+class RequestMetrics:
+    """
+    The time spent in the parts of a single request.
+
+    The instance is also a database execute wrapper, see
+    `django.db.backends.base.base.BaseDatabaseWrapper.execute_wrapper`.
+
+    Attributes
+    ----------
+    timings : dict
+        The seconds spent in the database (`db`), rendering templates
+        (`template`) and running context processors (`context_processors`).
+        Template time includes the queries and context processors run
+        while rendering.
+    queries : Counter
+        The number of times every query, with its parameters, was run.
+    """
+
+    def __init__(self):
+        """
+        Initialize empty metrics.
+        """
+        self.timings = {"db": 0.0, "template": 0.0, "context_processors": 0.0}
+        self.queries = Counter()
+        self._measuring = set()
+
+    @property
+    def query_count(self):
+        """
+        Return the number of queries run.
+
+        Returns
+        -------
+        int
+            The number of queries run.
+        """
+        return sum(self.queries.values())
+
+    @property
+    def duplicate_query_count(self):
+        """
+        Return the number of queries repeating an earlier query with the
+        same parameters.
+
+        Returns
+        -------
+        int
+            The number of duplicate queries.
+        """
+        return sum(count - 1 for count in self.queries.values())
+
+    @contextmanager
+    def measure(self, name):
+        """
+        Add the time spent in a block to a timing.
+
+        Nested blocks of the same timing are only counted once.
+
+        Parameters
+        ----------
+        name : str
+            The name of the timing.
+        """
+        if name in self._measuring:
+            yield
+            return
+
+        self._measuring.add(name)
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.timings[name] += time.perf_counter() - start
+            self._measuring.discard(name)
+
+    def __call__(self, execute, sql, params, many, context):
+        """
+        Run and record a query.
+
+        Parameters
+        ----------
+        execute : callable
+            The function running the query.
+        sql : str
+            The SQL of the query.
+        params : list or tuple or dict
+            The parameters of the query.
+        many : bool
+            Whether the query is run through `executemany`.
+        context : dict
+            The connection and cursor the query is run on.
+
+        Returns
+        -------
+        object
+            The result of `execute`.
+        """
+        self.queries[(sql, repr(params))] += 1
+
+        with self.measure("db"):
+            return execute(sql, params, many, context)
+
+
+@contextmanager
+def measure(name):
+    """
+    Add the time spent in a block to a timing of the current request.
+
+    Nothing is measured when the request is not instrumented.
+
+    Parameters
+    ----------
+    name : str
+        The name of the timing.
+    """
+    metrics = current_metrics.get()
+
+    if metrics is None:
+        yield
+        return
+
+    with metrics.measure(name):
+        yield
+
+
+def measure_context_processor(processor):
+    """
+    Wrap a context processor to measure the time it takes.
+
+    Parameters
+    ----------
+    processor : callable
+        The context processor.
+
+    Returns
+    -------
+    callable
+        The measured context processor.
+    """
+
+    @functools.wraps(processor)
+    def wrapper(request):
+        """
+        Run the context processor, measuring the time it takes.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The request the template is rendered for.
+
+        Returns
+        -------
+        dict
+            The context added by the context processor.
+        """
+        with measure("context_processors"):
+            return processor(request)
+
+    return wrapper
+
+
+class InstrumentedTemplate(Template):
+    """
+    A template whose rendering is measured in instrumented requests.
+    """
+
+    def render(self, context=None, request=None):
+        """
+        Render the template.
+
+        Parameters
+        ----------
+        context : dict, optional
+            The context of the template.
+        request : HttpRequest, optional
+            The request the template is rendered for.
+
+        Returns
+        -------
+        SafeString
+            The rendered template.
+        """
+        with measure("template"):
+            return super().render(context, request)
+
+
+class InstrumentedDjangoTemplates(DjangoTemplates):
+    """
+    The Django template backend, measuring template rendering and
+    context processors in instrumented requests.
+
+    Parameters
+    ----------
+    params : dict
+        The `TEMPLATES` entry of the backend.
+    """
+
+    def __init__(self, params):
+        """
+        Initialize the backend and wrap its context processors.
+
+        Parameters
+        ----------
+        params : dict
+            The `TEMPLATES` entry of the backend.
+        """
+        super().__init__(params)
+
+        self.engine.template_context_processors = tuple(
+            measure_context_processor(processor)
+            for processor in self.engine.template_context_processors
+        )
+
+    def from_string(self, template_code):
+        """
+        Compile a template from a string.
+
+        Parameters
+        ----------
+        template_code : str
+            The source of the template.
+
+        Returns
+        -------
+        InstrumentedTemplate
+            The compiled template.
+        """
+        return InstrumentedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        """
+        Load a template by name.
+
+        Parameters
+        ----------
+        template_name : str
+            The name of the template.
+
+        Returns
+        -------
+        InstrumentedTemplate
+            The loaded template.
+        """
+        template = super().get_template(template_name)
+
+        return InstrumentedTemplate(template.template, self)
@@ -0,0 +1,689 @@
+"""
+Django management command to generate a synthetic network of profiles
+for load and benchmark testing.
+
+The command builds users and profiles, a group tree with a configurable
+depth and fan-out, memberships, skills, interests and vocations,
+discipleship chains down the tree, mentorships, and events with
+activities and registrations. Rows are written with `bulk_create`, so
+model `save()` methods and signals do not run; the stored group member
+counts and the MPTT tree fields are rebuilt once everything is inserted.
+
+The generated data only depends on the options, so the same seed always
+builds the same network and benchmark runs can be compared. All dates are
+relative to `--reference-date` instead of today, so this holds on any
+day. Reference
+data (skills, vocations, mentorship areas, ...) is loaded with
+`populate_db` if it is missing. The factories used to build events and
+activities require the development requirements.
+
+Usage:
+    python manage.py generate_synthetic_network [--profiles 1000]
+        [--depth 4] [--fan-out 3] [--events 20] [--seed 0]
+        [--reference-date 2025-01-01]
+"""
+
+import random
+from datetime import date, datetime, time, timedelta
+from uuid import UUID
+
+import factory.random
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from faker import Faker
+
+from kns.activities.models import Activity, ActivityRegistration
+from kns.activities.tests.factories import ActivityFactory, ActivityRegistrationFactory
+from kns.custom_user.models import User
+from kns.discipleships.models import Discipleship, DiscipleshipState
+from kns.events.models import Event
+from kns.events.tests.factories import EventFactory
+from kns.groups.models import Group, GroupMember
+from kns.groups.tests.factories import GroupFactory
+from kns.mentorships.models import Mentorship, MentorshipArea, ProfileMentorshipArea
+from kns.profiles.models import Profile
+from kns.skills.models import ProfileInterest, ProfileSkill, Skill
+from kns.vocations.models import ProfileVocation, Vocation
+
+# Countries (ISO codes) and cities the synthetic profiles and groups
+# are spread over.
+SYNTHETIC_LOCATIONS = {
+    "NG": ["Lagos", "Abuja", "Jos", "Bauchi", "Kano"],
+    "GH": ["Accra", "Kumasi", "Tamale"],
+    "KE": ["Nairobi", "Mombasa", "Kisumu"],
+    "GB": ["London", "Manchester"],
+    "US": ["Houston", "Atlanta", "Chicago"],
+}
+
+# Discipleship stages a disciple goes through, in order. Every stage but
+# the last one reached is completed.
+DISCIPLESHIP_STAGES = ["group_member", "first_12", "first_3"]
+
+# Date all generated dates are relative to, unless `--reference-date` is
+# given.
+DEFAULT_REFERENCE_DATE = date(2025, 1, 1)
+
+
+class Command(BaseCommand):
+    """
+    Django management command that bulk-inserts a deterministic synthetic
+    network of profiles, groups and their activity.
+    """
+
+    help = "Generates a synthetic network of profiles for load and benchmark testing."
+
+    def add_arguments(self, parser):
+        """
+        Add the command line arguments of the command.
+
+        Parameters
+        ----------
+        parser : ArgumentParser
+            The parser of the command.
+        """
+        parser.add_argument(
+            "--profiles",
+            type=int,
+            default=1000,
+            help="The number of profiles to create.",
+        )
+        parser.add_argument(
+            "--depth",
+            type=int,
+            default=4,
+            help="The number of levels of the group tree.",
+        )
+        parser.add_argument(
+            "--fan-out",
+            type=int,
+            default=3,
+            help="The number of child groups of every group above the last level.",
+        )
+        parser.add_argument(
+            "--events",
+            type=int,
+            default=20,
+            help="The number of events to create.",
+        )
+        parser.add_argument(
+            "--activities-per-event",
+            type=int,
+            default=3,
+            help="The number of activities of every event.",
+        )
+        parser.add_argument(
+            "--registrations-per-activity",
+            type=int,
+            default=10,
+            help="The number of registrations of every activity.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="The seed of the random generators.",
+        )
+        parser.add_argument(
+            "--reference-date",
+            type=date.fromisoformat,
+            default=DEFAULT_REFERENCE_DATE,
+            help="The date (YYYY-MM-DD) all generated dates are relative to.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="The number of rows inserted per query.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Generate the synthetic network in a single transaction.
+
+        Parameters
+        ----------
+        *args
+            Positional arguments passed to the command (not used in this
+            method).
+        **options
+            The command line options.
+
+        Raises
+        ------
+        CommandError
+            If the group tree needs more leaders than there are profiles,
+            or a network was already generated with the same seed.
+        """
+        self.seed = options["seed"]
+        self.reference_date = options["reference_date"]
+        self.batch_size = options["batch_size"]
+        self.email_prefix = f"synthetic.{self.seed}."
+
+        group_count = sum(
+            options["fan_out"] ** level for level in range(options["depth"])
+        )
+        if group_count >= options["profiles"]:
+            raise CommandError(
+                f"A tree of {group_count} groups needs more than "
+                f"{options['profiles']} profiles."
+            )
+
+        if User.objects.filter(email__startswith=self.email_prefix).exists():
+            raise CommandError(
+                f"A synthetic network was already generated with seed {self.seed}."
+            )
+
+        # The factories draw from both the factory_boy/Faker generators
+        # and the `random` module, so all of them are seeded.
+        self.random = random.Random(self.seed)
+        self.fake = Faker()
+        self.fake.seed_instance(self.seed)
+        factory.random.reseed_random(self.seed)
+        random.seed(self.seed)
+
+        with transaction.atomic():
+            profiles = self.create_profiles(options["profiles"])
+            self.ensure_reference_data()
+
+            groups = self.create_groups(
+                profiles,
+                depth=options["depth"],
+                fan_out=options["fan_out"],
+            )
+            members = self.create_memberships(profiles, groups)
+            self.create_profile_skills(profiles)
+            discipleships = self.create_discipleships(groups, members)
+            mentorships = self.create_mentorships(profiles)
+            events, activities, registrations = self.create_events(
+                profiles,
+                groups,
+                events=options["events"],
+                activities_per_event=options["activities_per_event"],
+                registrations_per_activity=options["registrations_per_activity"],
+            )
+
+            Group.objects.rebuild()
+            Group.objects.recount_members()
+            DiscipleshipState.objects.rebuild()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {len(profiles)} profiles, {len(groups)} groups, "
+                f"{len(members)} memberships, {discipleships} discipleships, "
+                f"{mentorships} mentorships, {events} events, "
+                f"{activities} activities and {registrations} registrations "
+                f"(seed {self.seed})."
+            )
+        )
+
+    def uuid(self):
+        """
+        Return a UUID drawn from the seeded generator.
+
+        Returns
+        -------
+        UUID
+            A random version 4 UUID.
+        """
+        return UUID(int=self.random.getrandbits(128), version=4)
+
+    def days_from_reference(self, start, end):
+        """
+        Return a random date between two offsets from the reference date.
+
+        Parameters
+        ----------
+        start : int
+            The earliest offset in days.
+        end : int
+            The latest offset in days.
+
+        Returns
+        -------
+        date
+            The drawn date.
+        """
+        return self.reference_date + timedelta(days=self.random.randint(start, end))
+
+    def location(self):
+        """
+        Return a random country and city.
+
+        Returns
+        -------
+        tuple of str
+            The country code and the city.
+        """
+        country = self.random.choice(sorted(SYNTHETIC_LOCATIONS))
+
+        return country, self.random.choice(SYNTHETIC_LOCATIONS[country])
+
+    def create_profiles(self, count):
+        """
+        Create the users and their onboarded profiles.
+
+        Parameters
+        ----------
+        count : int
+            The number of profiles to create.
+
+        Returns
+        -------
+        list of Profile
+            The created profiles.
+        """
+        # Synthetic users are only meant to be logged in by tests and
+        # benchmarks, so they get an unusable password.
+        password = make_password(None)
+
+        users = User.objects.bulk_create(
+            [
+                User(
+                    email=f"{self.email_prefix}{number}@example.com",
+                    password=password,
+                    agreed_to_terms=True,
+                    verified=True,
+                )
+                for number in range(count)
+            ],
+            batch_size=self.batch_size,
+        )
+
+        profiles = []
+        for user in users:
+            country, city = self.location()
+            birth_country, birth_city = self.location()
+
+            profile = Profile(
+                user=user,
+                email=user.email,
+                slug=self.uuid(),
+                is_onboarded=True,
+                role=self.random.choices(
+                    ["member", "external_person"],
+                    weights=[9, 1],
+                )[0],
+                first_name=self.fake.first_name()[:25],
+                last_name=self.fake.last_name()[:25],
+                gender=self.random.choice(["male", "female"]),
+                date_of_birth=self.fake.date_between(
+                    start_date=self.reference_date - timedelta(days=80 * 365),
+                    end_date=self.reference_date - timedelta(days=12 * 365),
+                ),
+                location_country=country,
+                location_city=city,
+                place_of_birth_country=birth_country,
+                place_of_birth_city=birth_city,
+                is_movement_training_facilitator=self.random.random() < 0.1,
+                is_skill_training_facilitator=self.random.random() < 0.1,
+            )
+
+            # bulk_create does not call save
+            profile.update_search_name()
+            profiles.append(profile)
+
+        return Profile.objects.bulk_create(profiles, batch_size=self.batch_size)
+
+    def ensure_reference_data(self):
+        """
+        Load the reference data used by the network if it is missing.
+        """
+        if not (
+            Skill.objects.exists()
+            and Vocation.objects.exists()
+            and MentorshipArea.objects.exists()
+        ):
+            call_command("populate_db")
+
+        self.skills = list(Skill.objects.order_by("pk"))
+        self.vocations = list(Vocation.objects.order_by("pk"))
+        self.mentorship_areas = list(MentorshipArea.objects.order_by("pk"))
+
+    def create_groups(self, profiles, depth, fan_out):
+        """
+        Create the group tree, one level at a time.
+
+        Each group is led by its own profile, taken from the start of
+        `profiles`. The MPTT fields are filled in by `Group.objects.rebuild()`
+        once every row is inserted.
+
+        Parameters
+        ----------
+        profiles : list of Profile
+            The profiles of the network.
+        depth : int
+            The number of levels of the tree.
+        fan_out : int
+            The number of children of every group above the last level.
+
+        Returns
+        -------
+        list of Group
+            The created groups, level by level.
+        """
+        leaders = iter(profiles)
+        groups = []
+        parents = [None]
+
+        for _ in range(depth):
+            level = []
+
+            for parent in parents:
+                for _ in range(1 if parent is None else fan_out):
+                    leader = next(leaders)
+                    leader.role = "leader"
+                    country, city = self.location()
+
+                    level.append(
+                        GroupFactory.build(
+                            name=f"{self.fake.company()[:40]} {len(groups) + len(level)}",
+                            slug=self.uuid(),
+                            description=self.fake.paragraph(nb_sentences=5),
+                            leader=leader,
+                            parent=parent,
+                            location_country=country,
+                            location_city=city,
+                            lft=0,
+                            rght=0,
+                            tree_id=0,
+                            level=0,
+                        )
+                    )
+
+            groups.extend(Group.objects.bulk_create(level, batch_size=self.batch_size))
+            parents = level
+
+        Profile.objects.bulk_update(
+            [group.leader for group in groups],
+            ["role"],
+            batch_size=self.batch_size,
+        )
+
+        return groups
+
+    def create_memberships(self, profiles, groups):
+        """
+        Add the leaders of child groups to their parent group and every
+        other profile to a random group.
+
+        Parameters
+        ----------
+        profiles : list of Profile
+            The profiles of the network.
+        groups : list of Group
+            The groups of the network.
+
+        Returns
+        -------
+        list of GroupMember
+            The created memberships.
+        """
+        members = [
+            GroupMember(profile=group.leader, group=group.parent)
+            for group in groups
+            if group.parent is not None
+        ]
+        members.extend(
+            GroupMember(profile=profile, group=self.random.choice(groups))
+            for profile in profiles[len(groups) :]
+        )
+
+        return GroupMember.objects.bulk_create(members, batch_size=self.batch_size)
+
+    def create_profile_skills(self, profiles):
+        """
+        Give every profile a few skills, interests and vocations.
+
+        Parameters
+        ----------
+        profiles : list of Profile
+            The profiles of the network.
+        """
+        skills, interests, vocations = [], [], []
+
+        for profile in profiles:
+            skills.extend(
+                ProfileSkill(profile=profile, skill=skill)
+                for skill in self.random.sample(self.skills, self.random.randint(0, 3))
+            )
+            interests.extend(
+                ProfileInterest(profile=profile, interest=skill)
+                for skill in self.random.sample(self.skills, self.random.randint(0, 3))
+            )
+            vocations.extend(
+                ProfileVocation(profile=profile, vocation=vocation)
+                for vocation in self.random.sample(
+                    self.vocations,
+                    self.random.randint(0, 2),
+                )
+            )
+
+        ProfileSkill.objects.bulk_create(skills, batch_size=self.batch_size)
+        ProfileInterest.objects.bulk_create(interests, batch_size=self.batch_size)
+        ProfileVocation.objects.bulk_create(vocations, batch_size=self.batch_size)
+
+    def create_discipleships(self, groups, members):
+        """
+        Create the discipleship chains of the network.
+
+        Every member is discipled by the leader of their group. Members
+        have gone through one to three stages, all but the last of them
+        completed. Every stage started 30 days after the previous one,
+        when the previous one was completed, and the current one started
+        30 days before the reference date. Leaders of child groups were
+        sent forth by the leader of the parent group, so the chains follow
+        the group tree.
+
+        Parameters
+        ----------
+        groups : list of Group
+            The groups of the network.
+        members : list of GroupMember
+            The memberships of the network.
+
+        Returns
+        -------
+        int
+            The number of discipleships created.
+        """
+        leaders = {group.pk: group.leader for group in groups}
+        child_group_leaders = {group.leader.pk for group in groups}
+        now = timezone.make_aware(datetime.combine(self.reference_date, time()))
+        discipleships = []
+        start_dates = []
+
+        for member in members:
+            discipler = leaders[member.group.pk]
+
+            if member.profile.pk in child_group_leaders:
+                stages = DISCIPLESHIP_STAGES + ["sent_forth"]
+            else:
+                stages = DISCIPLESHIP_STAGES[: self.random.randint(1, 3)]
+
+            for number, stage in enumerate(stages, 1):
+                completed = number < len(stages)
+
+                discipleships.append(
+                    Discipleship(
+                        disciple=member.profile,
+                        discipler=discipler,
+                        author=discipler,
+                        group=stage,
+                        slug=self.uuid(),
+                        completed_at=(
+                            now - timedelta(days=30 * (len(stages) - number))
+                            if completed
+                            else None
+                        ),
+                    )
+                )
+                start_dates.append(
+                    now - timedelta(days=30 * (len(stages) - number + 1))
+                )
+
+        created = Discipleship.objects.bulk_create(
+            discipleships,
+            batch_size=self.batch_size,
+        )
+
+        # `created_at` is set on insert (`auto_now_add`), so the start of
+        # every stage is written afterwards.
+        for discipleship, created_at in zip(created, start_dates):
+            discipleship.created_at = created_at
+
+        Discipleship.objects.bulk_update(
+            created,
+            ["created_at"],
+            batch_size=self.batch_size,
+        )
+
+        return len(created)
+
+    def create_mentorships(self, profiles):
+        """
+        Make a share of the profiles mentors and give them mentees.
+
+        Mentorships started in the year before the reference date.
+
+        Parameters
+        ----------
+        profiles : list of Profile
+            The profiles of the network.
+
+        Returns
+        -------
+        int
+            The number of mentorships created.
+        """
+        mentors = self.random.sample(profiles, max(1, len(profiles) // 20))
+        statuses = ["draft", "pending", "active", "completed", "cancelled"]
+        mentorship_areas = []
+        mentorships = []
+
+        for mentor in mentors:
+            mentor.is_mentor = True
+            areas = self.random.sample(self.mentorship_areas, 2)
+            mentorship_areas.extend(
+                ProfileMentorshipArea(profile=mentor, mentorship_area=area)
+                for area in areas
+            )
+
+            for mentee in self.random.sample(profiles, 3):
+                if mentee is mentor:
+                    continue
+
+                start_date = self.fake.date_between(
+                    start_date=self.reference_date - timedelta(days=365),
+                    end_date=self.reference_date,
+                )
+
+                mentorships.append(
+                    Mentorship(
+                        slug=self.uuid(),
+                        mentor=mentor,
+                        mentee=mentee,
+                        author=mentor,
+                        mentorship_area=self.random.choice(areas),
+                        status=self.random.choice(statuses),
+                        start_date=start_date,
+                        expected_end_date=start_date + timedelta(days=90),
+                        duration=90,
+                    )
+                )
+
+        Profile.objects.bulk_update(mentors, ["is_mentor"], batch_size=self.batch_size)
+        ProfileMentorshipArea.objects.bulk_create(
+            mentorship_areas,
+            batch_size=self.batch_size,
+        )
+
+        return len(
+            Mentorship.objects.bulk_create(mentorships, batch_size=self.batch_size)
+        )
+
+    def create_events(
+        self,
+        profiles,
+        groups,
+        events,
+        activities_per_event,
+        registrations_per_activity,
+    ):
+        """
+        Create events organised by group leaders, with activities and
+        registrations of random profiles.
+
+        Events and activities start in the month after the reference date,
+        and registration for the events closes around it.
+
+        Parameters
+        ----------
+        profiles : list of Profile
+            The profiles of the network.
+        groups : list of Group
+            The groups of the network.
+        events : int
+            The number of events to create.
+        activities_per_event : int
+            The number of activities of every event.
+        registrations_per_activity : int
+            The number of registrations of every activity.
+
+        Returns
+        -------
+        tuple of int
+            The number of events, activities and registrations created.
+        """
+        # Slugs are set here because `save()`, which usually sets them,
+        # does not run for bulk inserts. Dates are set here because the
+        # factories draw them relative to today.
+        created_events = Event.objects.bulk_create(
+            [
+                EventFactory.build(
+                    author=self.random.choice(groups).leader,
+                    slug=f"synthetic-event-{self.seed}-{number}",
+                    start_date=self.days_from_reference(1, 30),
+                    registration_deadline_date=self.days_from_reference(-5, 1),
+                )
+                for number in range(events)
+            ],
+            batch_size=self.batch_size,
+        )
+
+        activities = Activity.objects.bulk_create(
+            [
+                ActivityFactory.build(
+                    event=event,
+                    author=event.author,
+                    slug=f"synthetic-activity-{self.seed}-{self.uuid().hex}",
+                    start_date=self.days_from_reference(1, 30),
+                    start_time=time(self.random.randint(6, 18)),
+                )
+                for event in created_events
+                for _ in range(activities_per_event)
+            ],
+            batch_size=self.batch_size,
+        )
+
+        registrations = ActivityRegistration.objects.bulk_create(
+            [
+                ActivityRegistrationFactory.build(
+                    activity=activity,
+                    profile=profile,
+                    is_guest=False,
+                    confirmation_token=self.uuid(),
+                    rejection_token=self.uuid(),
+                )
+                for activity in activities
+                for profile in self.random.sample(
+                    profiles,
+                    min(registrations_per_activity, len(profiles)),
+                )
+            ],
+            batch_size=self.batch_size,
+        )
+
+        return len(created_events), len(activities), len(registrations)
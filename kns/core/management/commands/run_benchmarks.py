@@ -0,0 +1,156 @@
+"""
+Django management command to benchmark the hot views and APIs.
+
+The benchmarks run against the data in the database, which should be a
+network built by `generate_synthetic_network`. The latency percentiles
+and query counts of every benchmark are printed and saved as JSON, and
+can be compared with the results of a previous run.
+
+Usage:
+    python manage.py run_benchmarks [--iterations 20] [--warmup 2]
+        [--only profiles_index groups_index] [--explain]
+        [--output results.json] [--compare baseline.json]
+"""
+
+import json
+import platform
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from kns.core.benchmarks import (
+    BenchmarkError,
+    compare_results,
+    get_changed_plans,
+    run_benchmarks,
+)
+
+
+class Command(BaseCommand):
+    """
+    Django management command that benchmarks the hot views and APIs.
+    """
+
+    help = "Benchmarks the hot views and APIs against the synthetic network."
+
+    def add_arguments(self, parser):
+        """
+        Add the command line arguments of the command.
+
+        Parameters
+        ----------
+        parser : ArgumentParser
+            The parser of the command.
+        """
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=20,
+            help="The number of timed runs of every benchmark.",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=2,
+            help="The number of untimed runs made before timing.",
+        )
+        parser.add_argument(
+            "--only",
+            nargs="+",
+            help="Only run the benchmarks whose name contains one of these.",
+        )
+        parser.add_argument(
+            "--explain",
+            action="store_true",
+            help="Also save the plans of the benchmarked queries.",
+        )
+        parser.add_argument(
+            "--output",
+            default="benchmark_results.json",
+            help="The JSON file the results are saved to.",
+        )
+        parser.add_argument(
+            "--compare",
+            help="The JSON file of a previous run to compare the results with.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Run the benchmarks, then print and save their results.
+
+        Parameters
+        ----------
+        *args
+            Positional arguments passed to the command (not used in this
+            method).
+        **options
+            The command line options.
+
+        Raises
+        ------
+        CommandError
+            If the options are invalid or the benchmarks cannot run.
+        """
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be at least 1.")
+
+        baseline = None
+        if options["compare"]:
+            with open(options["compare"]) as file:
+                baseline = json.load(file)
+
+        try:
+            report = run_benchmarks(
+                names=options["only"],
+                iterations=options["iterations"],
+                warmup=options["warmup"],
+                explain=options["explain"],
+            )
+        except BenchmarkError as error:
+            raise CommandError(str(error))
+
+        report["environment"] = {
+            "created_at": timezone.now().isoformat(),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "database": connection.vendor,
+            "debug": settings.DEBUG,
+            "iterations": options["iterations"],
+            "warmup": options["warmup"],
+        }
+
+        for result in report["results"]:
+            self.stdout.write(
+                f"{result['name']:<40} {result['queries']:>4} queries  "
+                f"p50 {result['p50_ms']:>9.2f}ms  "
+                f"p95 {result['p95_ms']:>9.2f}ms  "
+                f"p99 {result['p99_ms']:>9.2f}ms"
+            )
+
+        if baseline is not None:
+            self.stdout.write(f"\nCompared with {options['compare']}:")
+
+            for change in compare_results(report["results"], baseline["results"]):
+                self.stdout.write(
+                    f"{change['name']:<40} p50 {change['p50_change']:>+8.1%}  "
+                    f"queries {change['queries_change']:>+4}"
+                )
+
+            if "query_plans" in report and "query_plans" in baseline:
+                for name in get_changed_plans(
+                    report["query_plans"],
+                    baseline["query_plans"],
+                ):
+                    self.stdout.write(f"The plan of query[{name}] changed.")
+
+        with open(options["output"], "w") as file:
+            json.dump(report, file, indent=2)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Saved {len(report['results'])} results to {options['output']}.",
+            ),
+        )
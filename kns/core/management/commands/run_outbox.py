@@ -0,0 +1,83 @@
+"""
+Django management command to send the emails queued in the outbox.
+
+By default the command sends every due email and exits, which suits a
+cron job. With `--loop` it keeps polling the outbox as a worker process.
+
+Usage:
+    python manage.py run_outbox [--batch-size 100] [--loop] [--interval 5]
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from kns.core import constants
+from kns.core.outbox import send_queued_emails
+
+
+class Command(BaseCommand):
+    """
+    Django management command that sends the queued emails in batches.
+    """
+
+    help = "Sends the emails queued in the outbox."
+
+    def add_arguments(self, parser):
+        """
+        Add the command line arguments of the command.
+
+        Parameters
+        ----------
+        parser : ArgumentParser
+            The parser of the command.
+        """
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=constants.OUTBOX_BATCH_SIZE,
+            help="The maximum number of emails sent per batch.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling the outbox instead of exiting once it is empty.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="The number of seconds to wait between polls with --loop.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Send batches of due emails until none are left.
+
+        Parameters
+        ----------
+        *args
+            Positional arguments passed to the command (not used in this
+            method).
+        **options
+            The command line options.
+        """
+        total_sent = total_failed = 0
+
+        while True:
+            sent, failed = send_queued_emails(batch_size=options["batch_size"])
+            total_sent += sent
+            total_failed += failed
+
+            # Only stop (or wait) once a batch did not fill up
+            if sent + failed < options["batch_size"]:
+                if not options["loop"]:
+                    break
+
+                time.sleep(options["interval"])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Sent {total_sent} emails, {total_failed} failed.",
+            ),
+        )
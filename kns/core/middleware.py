@@ -0,0 +1,178 @@
+"""
+Middlewares for the `core` app.
+"""
+
+import logging
+import random
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from .instrumentation import RequestMetrics, current_metrics
+from .models import Setting
+
+logger = logging.getLogger(__name__)
+
+
+class RequestInstrumentationMiddleware:
+    """
+    Middleware measuring where the time of a request goes.
+
+    For a sample of the requests it records the total time, the database
+    time, the number of queries and duplicate queries, and the time spent
+    rendering templates and running context processors. Every measured
+    request is logged as a single line, with the values also passed as
+    `extra` for structured log handlers. Staff users, and everyone when
+    `DEBUG` is on, also get them in a `Server-Timing` header.
+
+    The instrumentation is off by default. It is turned on either with
+    the `REQUEST_INSTRUMENTATION` environment variable, sampling
+    `REQUEST_INSTRUMENTATION_SAMPLE_PERCENT` percent of the requests, or
+    from the `Setting` model once the settings are loaded in the process,
+    e.g. by rendering a page.
+
+    Parameters
+    ----------
+    get_response : callable
+        The next middleware or view in the request/response cycle.
+    """
+
+    def __init__(self, get_response):
+        """
+        Initialize the middleware.
+
+        Parameters
+        ----------
+        get_response : callable
+            The next middleware or view in the request/response cycle.
+        """
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """
+        Measure the request if it is sampled.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The HTTP request object.
+
+        Returns
+        -------
+        HttpResponse
+            The HTTP response object from the next middleware or view.
+        """
+        if random.random() * 100 >= self.get_sample_percent():
+            return self.get_response(request)
+
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        start = time.perf_counter()
+
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(metrics))
+
+                response = self.get_response(request)
+        finally:
+            current_metrics.reset(token)
+
+        total = time.perf_counter() - start
+        self.log(request, response, metrics, total)
+
+        user = getattr(request, "user", None)
+        if settings.DEBUG or (user is not None and user.is_staff):
+            response["Server-Timing"] = self.get_server_timing(metrics, total)
+
+        return response
+
+    def get_sample_percent(self):
+        """
+        Return the percentage of requests to measure.
+
+        Returns
+        -------
+        int
+            The percentage of requests to measure, 0 when the
+            instrumentation is off.
+        """
+        if settings.REQUEST_INSTRUMENTATION:
+            return settings.REQUEST_INSTRUMENTATION_SAMPLE_PERCENT
+
+        # Only the settings already loaded by this process are used, so
+        # that deciding whether to measure a request never queries the
+        # database.
+        setting = Setting.get_loaded()
+
+        if setting is not None and setting.request_instrumentation_enabled:
+            return setting.request_instrumentation_sample_percent
+
+        return 0
+
+    def log(self, request, response, metrics, total):
+        """
+        Log the metrics of a request.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The HTTP request object.
+        response : HttpResponse
+            The HTTP response object.
+        metrics : RequestMetrics
+            The metrics of the request.
+        total : float
+            The total time of the request, in seconds.
+        """
+        resolver_match = request.resolver_match
+
+        values = {
+            "view": resolver_match.view_name if resolver_match else None,
+            "method": request.method,
+            "status": response.status_code,
+            "total_ms": round(total * 1000, 2),
+            "db_ms": round(metrics.timings["db"] * 1000, 2),
+            "queries": metrics.query_count,
+            "duplicate_queries": metrics.duplicate_query_count,
+            "template_ms": round(metrics.timings["template"] * 1000, 2),
+            "context_processors_ms": round(
+                metrics.timings["context_processors"] * 1000,
+                2,
+            ),
+        }
+
+        logger.info(
+            " ".join(f"{key}={value}" for key, value in values.items()),
+            extra={"request_metrics": values},
+        )
+
+    def get_server_timing(self, metrics, total):
+        """
+        Return the `Server-Timing` header of a request.
+
+        Parameters
+        ----------
+        metrics : RequestMetrics
+            The metrics of the request.
+        total : float
+            The total time of the request, in seconds.
+
+        Returns
+        -------
+        str
+            The value of the header.
+        """
+        return ", ".join(
+            [
+                f"total;dur={total * 1000:.2f}",
+                f"db;dur={metrics.timings['db'] * 1000:.2f};"
+                f'desc="{metrics.query_count} queries, '
+                f'{metrics.duplicate_query_count} duplicates"',
+                f"template;dur={metrics.timings['template'] * 1000:.2f}",
+                "context-processors;"
+                f"dur={metrics.timings['context_processors'] * 1000:.2f}",
+            ]
+        )
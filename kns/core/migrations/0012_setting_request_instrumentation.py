@@ -0,0 +1,34 @@
+# Generated by Django 5.1 on 2026-10-16 20:45
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0011_outboxemail"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="setting",
+            name="request_instrumentation_enabled",
+            field=models.BooleanField(
+                choices=[(True, "Yes"), (False, "No")],
+                default=False,
+                help_text="Specifies if the database, template and context processor time of requests is measured and logged.",
+                verbose_name="Request Instrumentation Enabled",
+            ),
+        ),
+        migrations.AddField(
+            model_name="setting",
+            name="request_instrumentation_sample_percent",
+            field=models.PositiveIntegerField(
+                default=100,
+                help_text="The percentage of requests measured when instrumentation is on.",
+                validators=[django.core.validators.MaxValueValidator(100)],
+                verbose_name="Request Instrumentation Sample Percent",
+            ),
+        ),
+    ]
@@ -2,14 +2,20 @@
 Models for the `core` app.
 """
 
+import time
 from datetime import timedelta
 
+from django.apps import apps
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
-from django.db import models
+from django.core.mail import EmailMultiAlternatives
+from django.core.validators import MaxValueValidator
+from django.db import connection, models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone
 from django.utils.timesince import timesince
 
-from . import constants, modelmixins
+from . import cache, constants, modelmixins
 
 
 class FAQ(models.Model):
@@ -36,6 +42,14 @@ class FAQ(models.Model):
         return self.question
 
 
+# Process-local copy of the Setting row, see `Setting.get_cached`.
+_cached_setting = {
+    "setting": None,
+    "version": None,
+    "checked_at": 0.0,
+}
+
+
 class Setting(models.Model):
     """
     A model representing the various settings and configurations
@@ -186,6 +200,21 @@ class Setting(models.Model):
         verbose_name="Maximum Skills Per Training",
         help_text="The maximum number of skills allowed per training.",
     )
+    request_instrumentation_enabled = models.BooleanField(
+        default=False,
+        choices=constants.BOOLEAN_CHOICES,
+        verbose_name="Request Instrumentation Enabled",
+        help_text=(
+            "Specifies if the database, template and context processor time "
+            "of requests is measured and logged."
+        ),
+    )
+    request_instrumentation_sample_percent = models.PositiveIntegerField(
+        default=constants.REQUEST_INSTRUMENTATION_SAMPLE_PERCENT,
+        validators=[MaxValueValidator(100)],
+        verbose_name="Request Instrumentation Sample Percent",
+        help_text="The percentage of requests measured when instrumentation is on.",
+    )
 
     def clean(self):
         """
@@ -219,6 +248,8 @@ class Setting(models.Model):
             self.pk = existing_setting.pk
         super().save(*args, **kwargs)
 
+        Setting.invalidate_cache()
+
     @classmethod
     def get_or_create_setting(cls):
         """
@@ -235,6 +266,75 @@ class Setting(models.Model):
             setting = cls.objects.create()
             return setting
 
+    @classmethod
+    def get_cached(cls):
+        """
+        Retrieve the Setting instance from the process-local cache.
+
+        The instance is kept in memory for `SETTING_CACHE_TIMEOUT`
+        seconds. After that, the version in the shared cache is checked
+        and the row is only reloaded from the database if another process
+        has saved the settings in the meantime.
+
+        The returned instance is shared, so it must be treated as
+        read-only. Use `get_or_create_setting` to modify the settings.
+
+        Returns
+        -------
+        Setting
+            The cached Setting instance.
+        """
+        now = time.monotonic()
+
+        if (
+            _cached_setting["setting"] is not None
+            and now - _cached_setting["checked_at"] < constants.SETTING_CACHE_TIMEOUT
+        ):
+            return _cached_setting["setting"]
+
+        # Read the version before the row so a concurrent save is seen as
+        # a newer version on the next check.
+        version = cache.get_version(constants.SETTING_CACHE_NAMESPACE)
+
+        if _cached_setting["setting"] is None or _cached_setting["version"] != version:
+            _cached_setting["setting"] = cls.get_or_create_setting()
+            _cached_setting["version"] = version
+
+        _cached_setting["checked_at"] = now
+
+        return _cached_setting["setting"]
+
+    @classmethod
+    def get_loaded(cls):
+        """
+        Return the Setting instance already in the process-local cache.
+
+        Unlike `get_cached`, this never reads the shared cache or the
+        database, so it can be used on every request. The instance is
+        loaded and refreshed by the callers of `get_cached`, such as the
+        `settings_context` context processor.
+
+        Returns
+        -------
+        Setting or None
+            The cached Setting instance, or None if it is not loaded.
+        """
+        return _cached_setting["setting"]
+
+    @classmethod
+    def invalidate_cache(cls):
+        """
+        Invalidate the cached Setting instance in every process.
+
+        The local copy is dropped immediately, and a new version is
+        written to the shared cache so other processes reload the row on
+        their next check.
+        """
+        _cached_setting["setting"] = None
+        _cached_setting["version"] = None
+
+        cache.bump_version(constants.SETTING_CACHE_NAMESPACE)
+
     def __str__(self):
         """
         Return a string representation of the Setting model.
@@ -259,6 +359,23 @@ class Setting(models.Model):
         """
 
 
+@receiver(post_delete, sender=Setting)
+def invalidate_deleted_setting(sender, instance, **kwargs):
+    """
+    Invalidate the cached Setting instance when the settings are deleted.
+
+    Parameters
+    ----------
+    sender : type
+        The model class that triggered the signal (Setting).
+    instance : Setting
+        The Setting instance being deleted.
+    **kwargs : dict
+        Additional keyword arguments passed by the signal.
+    """
+    Setting.invalidate_cache()
+
+
 class Notification(modelmixins.TimestampedModel, models.Model):
     """
     Model representing a notification in the application.
@@ -352,6 +469,114 @@ class Notification(modelmixins.TimestampedModel, models.Model):
             recipient=recipient,
         )
 
+    def add_recipients(self, recipients):
+        """
+        Add several recipients to the notification in a single query.
+
+        Recipients that already received the notification are skipped.
+
+        Parameters
+        ----------
+        recipients : iterable of Profile
+            The user profiles to be added as recipients of the notification.
+        """
+        recipients = list(recipients)
+
+        NotificationRecipient.objects.bulk_create(
+            [
+                NotificationRecipient(notification=self, recipient=recipient)
+                for recipient in recipients
+            ],
+            ignore_conflicts=True,
+        )
+
+        # bulk_create does not send post_save
+        NotificationRecipient.invalidate_unread_counts(
+            {recipient.pk for recipient in recipients}
+        )
+
+    def add_recipients_from_queryset(self, profile_ids):
+        """
+        Add every profile selected by a queryset as a recipient with a
+        single `INSERT ... SELECT`, without loading the profiles.
+
+        Recipients that already received the notification are skipped.
+
+        Parameters
+        ----------
+        profile_ids : QuerySet
+            A queryset selecting one column of profile ids, e.g.
+            `GroupMember.objects.values("profile_id")`.
+
+        Returns
+        -------
+        int
+            The number of recipients added.
+        """
+        Profile = apps.get_model("profiles", "Profile")
+
+        quote_name = connection.ops.quote_name
+        meta = NotificationRecipient._meta
+        table = quote_name(meta.db_table)
+        notification_column = quote_name(meta.get_field("notification").column)
+        recipient_column = quote_name(meta.get_field("recipient").column)
+        is_read_column = quote_name(meta.get_field("is_read").column)
+        profile_table = quote_name(Profile._meta.db_table)
+        profile_pk = quote_name(Profile._meta.pk.column)
+
+        select_sql, select_params = profile_ids.query.sql_with_params()
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} "
+                f"({notification_column}, {recipient_column}, {is_read_column}) "
+                f"SELECT %s, profile.{profile_pk}, %s "
+                f"FROM {profile_table} profile "
+                f"WHERE profile.{profile_pk} IN ({select_sql}) "
+                f"AND NOT EXISTS (SELECT 1 FROM {table} existing "
+                f"WHERE existing.{notification_column} = %s "
+                f"AND existing.{recipient_column} = profile.{profile_pk})",
+                [self.pk, False, *select_params, self.pk],
+            )
+            added = cursor.rowcount
+
+        # The recipients are not known here, so every count is invalidated
+        NotificationRecipient.invalidate_all_unread_counts()
+
+        return added
+
+    def add_group_recipients(self, group, include_descendants=True):
+        """
+        Add every member and leader of a group, and by default of all its
+        descendant groups, as recipients in a single query.
+
+        Parameters
+        ----------
+        group : Group
+            The group whose members and leaders receive the notification.
+        include_descendants : bool, optional
+            Whether to include the groups below `group`. Defaults to True.
+
+        Returns
+        -------
+        int
+            The number of recipients added.
+        """
+        Group = apps.get_model("groups", "Group")
+        GroupMember = apps.get_model("groups", "GroupMember")
+
+        if include_descendants:
+            groups = group.get_descendants(include_self=True)
+        else:
+            groups = Group.objects.filter(pk=group.pk)
+
+        members = GroupMember.objects.filter(group__in=groups).values("profile_id")
+        leaders = groups.values("leader_id")
+
+        return self.add_recipients_from_queryset(
+            members.order_by().union(leaders.order_by()),
+        )
+
     def icon(self):
         """
         Return the specific icon for the notification depending on its type.
@@ -464,3 +689,184 @@ class NotificationRecipient(models.Model):
             self.is_read = True
             self.read_at = timezone.now()
             self.save()
+
+    @classmethod
+    def mark_all_as_read(cls, recipient, notification_ids=None):
+        """
+        Mark all, or the selected, unread notifications of a profile as
+        read in a single UPDATE.
+
+        Parameters
+        ----------
+        recipient : Profile
+            The profile whose notifications are marked as read.
+        notification_ids : iterable of int, optional
+            The ids of the notifications to mark. Defaults to None, which
+            marks every unread notification of the profile.
+
+        Returns
+        -------
+        int
+            The number of notifications marked as read.
+        """
+        unread = cls.objects.filter(recipient=recipient, is_read=False)
+
+        if notification_ids is not None:
+            unread = unread.filter(notification_id__in=notification_ids)
+
+        marked = unread.update(is_read=True, read_at=timezone.now())
+
+        if marked:
+            cls.invalidate_unread_counts([recipient.pk])
+
+        return marked
+
+    @classmethod
+    def get_unread_count(cls, recipient):
+        """
+        Return the number of unread notifications of a profile.
+
+        The count is cached until a notification of the profile is
+        created or read.
+
+        Parameters
+        ----------
+        recipient : Profile
+            The profile whose unread notifications are counted.
+
+        Returns
+        -------
+        int
+            The number of unread notifications.
+        """
+        return cache.get_or_set(
+            constants.UNREAD_NOTIFICATIONS_CACHE_NAMESPACE,
+            cache.get_version(constants.UNREAD_NOTIFICATIONS_CACHE_NAMESPACE),
+            recipient.pk,
+            default=lambda: cls.objects.filter(
+                recipient=recipient,
+                is_read=False,
+            ).count(),
+            timeout=constants.UNREAD_NOTIFICATIONS_CACHE_TIMEOUT,
+        )
+
+    @classmethod
+    def invalidate_unread_counts(cls, recipient_ids):
+        """
+        Invalidate the cached unread notification counts of some profiles.
+
+        Parameters
+        ----------
+        recipient_ids : iterable of int
+            The ids of the profiles.
+        """
+        version = cache.get_version(constants.UNREAD_NOTIFICATIONS_CACHE_NAMESPACE)
+
+        for recipient_id in recipient_ids:
+            cache.delete(
+                constants.UNREAD_NOTIFICATIONS_CACHE_NAMESPACE,
+                version,
+                recipient_id,
+            )
+
+    @classmethod
+    def invalidate_all_unread_counts(cls):
+        """
+        Invalidate the cached unread notification counts of every profile.
+        """
+        cache.bump_version(constants.UNREAD_NOTIFICATIONS_CACHE_NAMESPACE)
+
+
+@receiver(post_save, sender=NotificationRecipient)
+@receiver(post_delete, sender=NotificationRecipient)
+def invalidate_recipient_unread_count(sender, instance, **kwargs):
+    """
+    Invalidate the cached unread notification count of a profile when one
+    of their notifications is created, updated or deleted.
+
+    Parameters
+    ----------
+    sender : type
+        The model class that triggered the signal (NotificationRecipient).
+    instance : NotificationRecipient
+        The NotificationRecipient instance being saved or deleted.
+    **kwargs : dict
+        Additional keyword arguments passed by the signal.
+    """
+    NotificationRecipient.invalidate_unread_counts([instance.recipient_id])
+
+
+class OutboxEmail(modelmixins.TimestampedModel, models.Model):
+    """
+    Model representing an email queued for sending.
+
+    Emails are written to the outbox inside the request and sent by the
+    `run_outbox` management command, so requests never wait on the mail
+    server.
+    """
+
+    subject = models.CharField(max_length=255)
+    message = models.TextField(blank=True)
+    html_message = models.TextField(blank=True)
+    from_email = models.CharField(max_length=254)
+    recipient_list = models.JSONField(default=list)
+
+    status = models.CharField(
+        max_length=10,
+        choices=constants.OUTBOX_EMAIL_STATUSES,
+        default="pending",
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        """
+        Meta options for the OutboxEmail model.
+
+        Indexes the lookup of pending emails that are due.
+        """
+
+        ordering = ["next_attempt_at"]
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"]),
+        ]
+
+    def __str__(self):
+        """
+        Return a string representation of the OutboxEmail instance.
+
+        Returns
+        -------
+        str
+            A string with the subject and status of the email.
+        """
+        return f"{self.subject} ({self.status})"
+
+    def to_message(self, connection=None):
+        """
+        Build the email message to send.
+
+        Parameters
+        ----------
+        connection : BaseEmailBackend, optional
+            The connection the message will be sent with.
+
+        Returns
+        -------
+        EmailMultiAlternatives
+            The email message, with the HTML alternative if there is one.
+        """
+        message = EmailMultiAlternatives(
+            subject=self.subject,
+            body=self.message,
+            from_email=self.from_email,
+            to=self.recipient_list,
+            connection=connection,
+        )
+
+        if self.html_message:
+            message.attach_alternative(self.html_message, "text/html")
+
+        return message
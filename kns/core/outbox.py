@@ -0,0 +1,217 @@
+"""
+Database-backed outbox for outgoing emails.
+
+`queue_mail` is a drop-in replacement for `django.core.mail.send_mail`
+that stores the email instead of sending it, so requests don't wait on
+the mail server. `send_queued_emails`, run by the `run_outbox`
+management command, sends due emails in batches over one connection
+and retries failures with an exponential backoff.
+
+Emails are only queued when the `OUTBOX_ENABLED` setting is on; otherwise
+`queue_mail` sends them right away, so mail keeps going out where no
+worker is running.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import get_connection, send_mail
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from . import constants
+from .models import OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+
+def queue_mail(subject, message, from_email, recipient_list, html_message=None):
+    """
+    Queue an email for sending by the outbox worker.
+
+    If `OUTBOX_ENABLED` is off, the email is sent right away with
+    `send_mail` instead.
+
+    Parameters
+    ----------
+    subject : str
+        The subject of the email.
+    message : str
+        The plain text body of the email.
+    from_email : str
+        The sender of the email.
+    recipient_list : list of str
+        The email addresses of the recipients.
+    html_message : str, optional
+        The HTML body of the email.
+
+    Returns
+    -------
+    OutboxEmail or None
+        The queued email, or None if it was sent right away.
+    """
+    if not settings.OUTBOX_ENABLED:
+        send_mail(
+            subject,
+            message,
+            from_email,
+            recipient_list,
+            html_message=html_message,
+        )
+        return None
+
+    return OutboxEmail.objects.create(
+        subject=subject,
+        message=message,
+        from_email=from_email,
+        recipient_list=list(recipient_list),
+        html_message=html_message or "",
+    )
+
+
+def get_retry_delay(attempts):
+    """
+    Return how long to wait before retrying a failed email.
+
+    Parameters
+    ----------
+    attempts : int
+        The number of attempts made so far.
+
+    Returns
+    -------
+    timedelta
+        The delay before the next attempt.
+    """
+    return timedelta(seconds=constants.OUTBOX_RETRY_DELAY * 2 ** (attempts - 1))
+
+
+def claim_queued_emails(batch_size=constants.OUTBOX_BATCH_SIZE):
+    """
+    Claim a batch of due emails for sending.
+
+    The batch is selected with `SELECT ... FOR UPDATE SKIP LOCKED` where
+    the database supports it, and its next attempt is pushed back by
+    `OUTBOX_CLAIM_TIMEOUT` before the transaction ends. The rows are only
+    locked while they are claimed, so other workers skip the batch without
+    waiting on the mail server.
+
+    Parameters
+    ----------
+    batch_size : int, optional
+        The maximum number of emails to claim.
+
+    Returns
+    -------
+    list of OutboxEmail
+        The claimed emails.
+    """
+    now = timezone.now()
+
+    with transaction.atomic():
+        emails = list(
+            OutboxEmail.objects.select_for_update(skip_locked=True).filter(
+                status="pending",
+                next_attempt_at__lte=now,
+            )[:batch_size]
+        )
+
+        OutboxEmail.objects.filter(pk__in=[email.pk for email in emails]).update(
+            next_attempt_at=now + timedelta(seconds=constants.OUTBOX_CLAIM_TIMEOUT),
+        )
+
+    return emails
+
+
+def record_failure(email, error):
+    """
+    Record a failed attempt to send an email and schedule its retry.
+
+    Parameters
+    ----------
+    email : OutboxEmail
+        The email that could not be sent.
+    error : Exception
+        The error raised while sending the email.
+    """
+    email.attempts += 1
+    email.last_error = str(error)
+    email.next_attempt_at = timezone.now() + get_retry_delay(email.attempts)
+
+    if email.attempts >= constants.OUTBOX_MAX_ATTEMPTS:
+        email.status = "failed"
+
+    email.save(
+        update_fields=[
+            "attempts",
+            "last_error",
+            "next_attempt_at",
+            "status",
+            "updated_at",
+        ]
+    )
+
+
+def send_queued_emails(batch_size=constants.OUTBOX_BATCH_SIZE):
+    """
+    Send a batch of due emails from the outbox.
+
+    The batch is claimed in a short transaction with
+    `claim_queued_emails`, so several workers can run at once, and sent
+    outside of it. All emails of the batch are sent over a single
+    connection. Each email is passed to `send_messages` on its own so one
+    failure does not resend or hold back the others. If the connection
+    cannot be opened, the whole batch is retried later.
+
+    Parameters
+    ----------
+    batch_size : int, optional
+        The maximum number of emails to send.
+
+    Returns
+    -------
+    tuple of int
+        The number of emails sent and the number that failed.
+    """
+    emails = claim_queued_emails(batch_size)
+
+    if not emails:
+        return 0, 0
+
+    try:
+        connection = get_connection()
+        connection.open()
+    except Exception as error:
+        logger.warning("Failed to open the outbox connection: %s", error)
+
+        for email in emails:
+            record_failure(email, error)
+
+        return 0, len(emails)
+
+    sent_ids = []
+    failed = 0
+
+    try:
+        for email in emails:
+            try:
+                connection.send_messages([email.to_message(connection)])
+            except Exception as error:
+                logger.warning("Failed to send outbox email %s: %s", email.pk, error)
+                record_failure(email, error)
+                failed += 1
+            else:
+                sent_ids.append(email.pk)
+    finally:
+        connection.close()
+
+    OutboxEmail.objects.filter(pk__in=sent_ids).update(
+        status="sent",
+        attempts=F("attempts") + 1,
+        sent_at=timezone.now(),
+        updated_at=timezone.now(),
+    )
+
+    return len(sent_ids), failed
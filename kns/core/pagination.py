@@ -0,0 +1,486 @@
+"""
+Pagination of the profile, group and discipleship directories.
+
+`DirectoryPaginator` is a Django `Paginator` with two improvements for
+large, filtered querysets:
+
+- The total count is cached per query for `DIRECTORY_COUNT_CACHE_TIMEOUT`
+  seconds, so moving between pages does not count the filtered rows
+  again.
+- Besides numbered pages, it serves keyset (cursor) pages. A cursor holds
+  the sort values of the last (or first) row of a page, and the next (or
+  previous) page is loaded with a `WHERE` on the sort fields instead of
+  skipping rows with `OFFSET`, so page N costs the same as page 1.
+
+The sort fields always end with `pk`, which makes the order total. Every
+page carries the cursors of the pages around it, so the previous and next
+links of a directory always use keyset pagination, while the numbered
+links can still jump to any page.
+"""
+
+import json
+import operator
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date
+from functools import reduce
+from hashlib import md5
+
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+from . import cache, constants
+
+
+class InvalidCursor(Exception):
+    """
+    Raised when a cursor cannot be decoded or belongs to another ordering.
+    """
+
+
+def get_cached_count(queryset):
+    """
+    Return the number of rows of a queryset, cached per query.
+
+    Parameters
+    ----------
+    queryset : QuerySet
+        The queryset to count.
+
+    Returns
+    -------
+    int
+        The number of rows, possibly up to `DIRECTORY_COUNT_CACHE_TIMEOUT`
+        seconds old.
+    """
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+
+    key = md5(repr((sql, params)).encode(), usedforsecurity=False).hexdigest()
+
+    return cache.get_or_set(
+        constants.DIRECTORY_COUNT_CACHE_NAMESPACE,
+        key,
+        default=queryset.count,
+        timeout=constants.DIRECTORY_COUNT_CACHE_TIMEOUT,
+    )
+
+
+def reverse_ordering(ordering):
+    """
+    Return an ordering with the direction of every field reversed.
+
+    Parameters
+    ----------
+    ordering : list of str
+        The field names, prefixed with `-` for a descending order.
+
+    Returns
+    -------
+    list of str
+        The reversed ordering.
+    """
+    return [field[1:] if field.startswith("-") else f"-{field}" for field in ordering]
+
+
+def encode_value(value):
+    """
+    Encode a sort value that JSON does not support.
+
+    Parameters
+    ----------
+    value : object
+        The value to encode.
+
+    Returns
+    -------
+    str
+        The value in ISO 8601 format, with its full precision.
+
+    Raises
+    ------
+    TypeError
+        If the value is not a date or datetime.
+    """
+    if isinstance(value, date):
+        return value.isoformat()
+
+    raise TypeError(f"Cannot encode {type(value).__name__} in a cursor.")
+
+
+class DirectoryPage(Page):
+    """
+    A page of a directory, with the cursors of the pages around it.
+
+    Parameters
+    ----------
+    object_list : list or QuerySet
+        The objects of the page.
+    number : int
+        The number of the page.
+    paginator : DirectoryPaginator
+        The paginator of the page.
+    has_next : bool, optional
+        Whether there is a next page. Defaults to comparing the number of
+        the page with the number of pages.
+    has_previous : bool, optional
+        Whether there is a previous page. Defaults to whether the page is
+        not the first one.
+    """
+
+    def __init__(
+        self,
+        object_list,
+        number,
+        paginator,
+        has_next=None,
+        has_previous=None,
+    ):
+        """
+        Initialize the page.
+
+        Parameters
+        ----------
+        object_list : list or QuerySet
+            The objects of the page.
+        number : int
+            The number of the page.
+        paginator : DirectoryPaginator
+            The paginator of the page.
+        has_next : bool, optional
+            Whether there is a next page.
+        has_previous : bool, optional
+            Whether there is a previous page.
+        """
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def has_next(self):
+        """
+        Return whether there is a page after this one.
+
+        Returns
+        -------
+        bool
+            True if there is a next page.
+        """
+        if self._has_next is None:
+            return super().has_next()
+
+        return self._has_next
+
+    def has_previous(self):
+        """
+        Return whether there is a page before this one.
+
+        Returns
+        -------
+        bool
+            True if there is a previous page.
+        """
+        if self._has_previous is None:
+            return super().has_previous()
+
+        return self._has_previous
+
+    @cached_property
+    def next_cursor(self):
+        """
+        The cursor of the next page.
+
+        Returns
+        -------
+        str or None
+            The cursor, or None if this is the last page.
+        """
+        if not self.has_next() or not len(self):
+            return None
+
+        return self.paginator.encode_cursor(self[len(self) - 1], self.number + 1)
+
+    @cached_property
+    def previous_cursor(self):
+        """
+        The cursor of the previous page.
+
+        Returns
+        -------
+        str or None
+            The cursor, or None if this is the first page.
+        """
+        if not self.has_previous() or not len(self):
+            return None
+
+        return self.paginator.encode_cursor(
+            self[0],
+            self.number - 1,
+            backwards=True,
+        )
+
+
+class DirectoryPaginator(Paginator):
+    """
+    A paginator with a cached count, serving numbered and keyset pages.
+
+    Parameters
+    ----------
+    object_list : QuerySet
+        The rows to paginate.
+    per_page : int
+        The number of rows per page.
+    ordering : list of str
+        The sort fields, prefixed with `-` for a descending order. `pk` is
+        added as the last field if it is missing. Only non-null fields of
+        the model itself can be used.
+    """
+
+    def __init__(self, object_list, per_page, ordering):
+        """
+        Initialize the paginator.
+
+        Parameters
+        ----------
+        object_list : QuerySet
+            The rows to paginate.
+        per_page : int
+            The number of rows per page.
+        ordering : list of str
+            The sort fields, prefixed with `-` for a descending order.
+        """
+        self.ordering = list(ordering)
+
+        if self.ordering[-1].lstrip("-") != "pk":
+            self.ordering.append("-pk" if self.ordering[-1][0] == "-" else "pk")
+
+        super().__init__(object_list.order_by(*self.ordering), per_page)
+
+    @cached_property
+    def count(self):
+        """
+        The total number of rows, cached per query.
+
+        Returns
+        -------
+        int
+            The number of rows.
+        """
+        return get_cached_count(self.object_list)
+
+    def _get_page(self, *args, **kwargs):
+        """
+        Return a page of the paginator.
+
+        Parameters
+        ----------
+        *args
+            Positional arguments passed to `DirectoryPage`.
+        **kwargs
+            Keyword arguments passed to `DirectoryPage`.
+
+        Returns
+        -------
+        DirectoryPage
+            The page.
+        """
+        return DirectoryPage(*args, **kwargs)
+
+    def get_field(self, name):
+        """
+        Return a model field of the ordering.
+
+        Parameters
+        ----------
+        name : str
+            The name of the field, without direction.
+
+        Returns
+        -------
+        Field
+            The model field.
+        """
+        opts = self.object_list.model._meta
+
+        return opts.pk if name == "pk" else opts.get_field(name)
+
+    def encode_cursor(self, row, number, backwards=False):
+        """
+        Return the cursor of the page next to a row.
+
+        Parameters
+        ----------
+        row : Model
+            The last row of a page, or the first one if `backwards`.
+        number : int
+            The number of the page the cursor points to.
+        backwards : bool, optional
+            Whether the cursor points to the rows before `row`.
+
+        Returns
+        -------
+        str
+            The cursor.
+        """
+        values = [getattr(row, field.lstrip("-")) for field in self.ordering]
+        data = json.dumps(
+            [self.ordering, values, number, backwards],
+            default=encode_value,
+            separators=(",", ":"),
+        )
+
+        return urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor):
+        """
+        Read a cursor of this paginator.
+
+        Parameters
+        ----------
+        cursor : str
+            The cursor.
+
+        Returns
+        -------
+        tuple
+            The sort values of the row, the number of the page and whether
+            the cursor points to the rows before the row.
+
+        Raises
+        ------
+        InvalidCursor
+            If the cursor is malformed or belongs to another ordering.
+        """
+        try:
+            data = urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            ordering, values, number, backwards = json.loads(data)
+            values = [
+                self.get_field(field.lstrip("-")).to_python(value)
+                for field, value in zip(ordering, values, strict=True)
+            ]
+        except Exception as error:
+            raise InvalidCursor("The cursor is invalid.") from error
+
+        if ordering != self.ordering or not isinstance(number, int) or number < 1:
+            raise InvalidCursor("The cursor belongs to another ordering.")
+
+        return values, number, bool(backwards)
+
+    def get_seek_filter(self, values, backwards):
+        """
+        Return the filter selecting the rows after (or before) a row.
+
+        Parameters
+        ----------
+        values : list
+            The sort values of the row.
+        backwards : bool
+            Whether to select the rows before the row.
+
+        Returns
+        -------
+        Q
+            The filter.
+        """
+        conditions = []
+        equal = Q()
+
+        # (a, b) > (x, y) is a > x OR (a = x AND b > y), with < for the
+        # fields sorted the other way
+        for field, value in zip(self.ordering, values):
+            name = field.lstrip("-")
+            lookup = "gt" if field.startswith("-") == backwards else "lt"
+
+            conditions.append(equal & Q(**{f"{name}__{lookup}": value}))
+            equal &= Q(**{name: value})
+
+        return reduce(operator.or_, conditions)
+
+    def cursor_page(self, cursor):
+        """
+        Return the page a cursor points to.
+
+        Only the rows of the page, plus one to know whether there are more,
+        are loaded.
+
+        Parameters
+        ----------
+        cursor : str
+            The cursor of the page.
+
+        Returns
+        -------
+        DirectoryPage
+            The page.
+
+        Raises
+        ------
+        InvalidCursor
+            If the cursor is malformed or belongs to another ordering.
+        """
+        values, number, backwards = self.decode_cursor(cursor)
+
+        rows = self.object_list.filter(self.get_seek_filter(values, backwards))
+
+        if backwards:
+            rows = rows.order_by(*reverse_ordering(self.ordering))
+
+        rows = list(rows[: self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+
+        if backwards:
+            rows.reverse()
+
+            return DirectoryPage(
+                rows,
+                number if has_more else 1,
+                self,
+                has_next=True,
+                has_previous=has_more,
+            )
+
+        return DirectoryPage(rows, number, self, has_next=has_more, has_previous=True)
+
+
+def get_directory_page(request, queryset, per_page, ordering):
+    """
+    Return the page of a directory requested with `cursor` or `page`.
+
+    A valid `cursor` is served with keyset pagination. Otherwise the
+    numbered `page` is served, falling back to the first page for an
+    invalid number and to the last page for a number past the end.
+
+    Parameters
+    ----------
+    request : HttpRequest
+        The request for the directory.
+    queryset : QuerySet
+        The filtered rows of the directory.
+    per_page : int
+        The number of rows per page.
+    ordering : list of str
+        The sort fields, prefixed with `-` for a descending order.
+
+    Returns
+    -------
+    DirectoryPage
+        The requested page.
+    """
+    paginator = DirectoryPaginator(queryset, per_page, ordering)
+    cursor = request.GET.get("cursor")
+
+    if cursor:
+        try:
+            return paginator.cursor_page(cursor)
+        except InvalidCursor:
+            pass
+
+    try:
+        return paginator.page(request.GET.get("page"))
+    except PageNotAnInteger:
+        return paginator.page(1)
+    except EmptyPage:
+        return paginator.page(paginator.num_pages)
@@ -0,0 +1,164 @@
+"""
+Versioning of read-mostly reference data for conditional GET support.
+
+Reference data such as levels and classifications almost never changes,
+but it is fetched by forms on every load. Each kind of reference data
+has a version, bumped by save/delete signals on its models, from which
+the ETag and Last-Modified headers of its API responses are derived.
+Clients revalidate with `If-None-Match`/`If-Modified-Since` and receive
+a 304 without the view querying or serializing anything.
+
+The versions are versioned namespaces of `kns.core.cache`, kept in the
+shared default cache so a change made by one worker is seen by every
+other worker.
+"""
+
+from django.utils import timezone
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+
+from . import cache
+
+
+def get_reference_data_version(namespace):
+    """
+    Return the current version of a kind of reference data.
+
+    Parameters
+    ----------
+    namespace : str
+        The name of the reference data, e.g. `"levels"`.
+
+    Returns
+    -------
+    dict
+        A dictionary with the `etag` and `last_modified` of the data.
+    """
+    etag = cache.get_version("reference_data", namespace)
+    last_modified = cache.get_or_set(
+        "reference_data_last_modified",
+        namespace,
+        etag,
+        default=lambda: timezone.now().replace(microsecond=0),
+        timeout=None,
+    )
+
+    return {"etag": etag, "last_modified": last_modified}
+
+
+def bump_reference_data_version(namespace):
+    """
+    Mark a kind of reference data as changed.
+
+    Parameters
+    ----------
+    namespace : str
+        The name of the reference data, e.g. `"levels"`.
+    """
+    cache.bump_version("reference_data", namespace)
+
+
+def reference_data_view(namespace):
+    """
+    Decorate a view serving reference data with conditional GET support.
+
+    The response carries an ETag and Last-Modified header derived from
+    the version of the reference data, and `Cache-Control: no-cache` so
+    browsers revalidate instead of guessing freshness. Requests whose
+    validators match get a 304 before the view runs.
+
+    Parameters
+    ----------
+    namespace : str
+        The name of the reference data served by the view.
+
+    Returns
+    -------
+    callable
+        The view decorator.
+    """
+
+    def get_version(request):
+        """
+        Return the version of the reference data, looked up once per
+        request.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The request being processed.
+
+        Returns
+        -------
+        dict
+            A dictionary with the `etag` and `last_modified` of the data.
+        """
+        versions = request.__dict__.setdefault("_reference_data_versions", {})
+
+        if namespace not in versions:
+            versions[namespace] = get_reference_data_version(namespace)
+
+        return versions[namespace]
+
+    def etag_func(request, *args, **kwargs):
+        """
+        Return the ETag of the reference data.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The request being processed.
+        *args : tuple
+            Positional arguments of the view.
+        **kwargs : dict
+            Keyword arguments of the view.
+
+        Returns
+        -------
+        str
+            The ETag of the current version of the data.
+        """
+        return get_version(request)["etag"]
+
+    def last_modified_func(request, *args, **kwargs):
+        """
+        Return the last modification time of the reference data.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The request being processed.
+        *args : tuple
+            Positional arguments of the view.
+        **kwargs : dict
+            Keyword arguments of the view.
+
+        Returns
+        -------
+        datetime
+            The time the current version of the data was created.
+        """
+        return get_version(request)["last_modified"]
+
+    def decorator(view_func):
+        """
+        Add conditional GET support to a view.
+
+        Parameters
+        ----------
+        view_func : callable
+            The view serving the reference data.
+
+        Returns
+        -------
+        callable
+            The decorated view.
+        """
+        return cache_control(no_cache=True)(
+            condition(
+                etag_func=etag_func,
+                last_modified_func=last_modified_func,
+            )(view_func)
+        )
+
+    return decorator
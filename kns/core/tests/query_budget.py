@@ -0,0 +1,151 @@
+"""
+Query budget assertions for tests.
+
+`assert_query_budget` records the SQL run inside a block and fails when
+more queries than the declared budget were run, or when the same query
+shape was repeated more often than allowed, which is how N+1 patterns
+show up. The failure message lists the repeated shapes so the offending
+relation is easy to find.
+
+Use `QueryBudgetMixin` in `TestCase` classes and the `query_budget`
+fixture in pytest-style tests.
+"""
+
+import re
+from collections import Counter
+from contextlib import contextmanager
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# Literals are replaced so queries differing only in their parameters
+# share a shape.
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"IN \((?:\?(?:, )?)+\)")
+
+
+def get_query_shape(sql):
+    """
+    Return the shape of a query, i.e. its SQL without literal values.
+
+    Parameters
+    ----------
+    sql : str
+        The SQL of the query.
+
+    Returns
+    -------
+    str
+        The SQL with strings and numbers replaced by `?` and `IN` lists
+        collapsed to `IN (...)`.
+    """
+    shape = _STRING_RE.sub("?", sql)
+    shape = _NUMBER_RE.sub("?", shape)
+
+    return _IN_LIST_RE.sub("IN (...)", shape)
+
+
+def get_repeated_shapes(queries, max_repeats):
+    """
+    Return the query shapes run more than `max_repeats` times.
+
+    Parameters
+    ----------
+    queries : list of dict
+        The queries captured by `CaptureQueriesContext`.
+    max_repeats : int
+        The number of times a shape may be run.
+
+    Returns
+    -------
+    list of tuple
+        `(shape, count)` pairs, most repeated first.
+    """
+    counts = Counter(get_query_shape(query["sql"]) for query in queries)
+
+    return [
+        (shape, count) for shape, count in counts.most_common() if count > max_repeats
+    ]
+
+
+def format_report(queries, budget, repeated_shapes):
+    """
+    Build the failure message of a query budget assertion.
+
+    Parameters
+    ----------
+    queries : list of dict
+        The queries captured by `CaptureQueriesContext`.
+    budget : int
+        The declared number of queries.
+    repeated_shapes : list of tuple
+        `(shape, count)` pairs of the repeated query shapes.
+
+    Returns
+    -------
+    str
+        The failure message.
+    """
+    lines = [f"{len(queries)} queries run, budget is {budget}."]
+
+    if repeated_shapes:
+        lines.append("Repeated queries (possible N+1):")
+        lines.extend(f"  {count}x {shape}" for shape, count in repeated_shapes)
+
+    lines.append("Queries:")
+    lines.extend(
+        f"  {number}. {query['sql']}" for number, query in enumerate(queries, 1)
+    )
+
+    return "\n".join(lines)
+
+
+@contextmanager
+def assert_query_budget(budget, max_repeats=1, using=connection):
+    """
+    Assert that a block runs at most `budget` queries and repeats no
+    query shape more than `max_repeats` times.
+
+    Parameters
+    ----------
+    budget : int
+        The maximum number of queries.
+    max_repeats : int, optional
+        The number of times the same query shape may run. Defaults to 1,
+        so any repeated query fails the assertion.
+    using : BaseDatabaseWrapper, optional
+        The database connection to record.
+
+    Yields
+    ------
+    CaptureQueriesContext
+        The recorded queries.
+
+    Raises
+    ------
+    AssertionError
+        If the budget is exceeded or a query shape is repeated too often.
+    """
+    with CaptureQueriesContext(using) as context:
+        yield context
+
+    queries = context.captured_queries
+    repeated_shapes = get_repeated_shapes(queries, max_repeats)
+
+    if len(queries) > budget or repeated_shapes:
+        raise AssertionError(format_report(queries, budget, repeated_shapes))
+
+
+class QueryBudgetMixin:
+    """
+    Mixin adding `assertQueryBudget` to `TestCase` classes.
+    """
+
+    def assertQueryBudget(self, budget, max_repeats=1):
+        """
+        Return a context manager asserting the query budget of a block.
+
+        See `assert_query_budget`.
+        """
+        return assert_query_budget(budget, max_repeats=max_repeats)
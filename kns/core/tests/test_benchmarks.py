@@ -0,0 +1,241 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from ..benchmarks import (
+    BENCHMARKS,
+    BenchmarkEnvironment,
+    BenchmarkError,
+    compare_results,
+    get_changed_plans,
+    percentile,
+    run_benchmarks,
+    summarize,
+)
+
+
+class TestBenchmarkHelpers(TestCase):
+    def test_percentile(self):
+        """
+        Percentiles use the nearest rank.
+        """
+        values = [5, 1, 4, 2, 3]
+
+        self.assertEqual(percentile(values, 0), 1)
+        self.assertEqual(percentile(values, 50), 3)
+        self.assertEqual(percentile(values, 90), 5)
+        self.assertEqual(percentile(values, 100), 5)
+
+    def test_summarize(self):
+        """
+        Durations are summarized in milliseconds.
+        """
+        result = summarize("faq", [0.001, 0.002, 0.003, 0.010], queries=2)
+
+        self.assertEqual(result["name"], "faq")
+        self.assertEqual(result["iterations"], 4)
+        self.assertEqual(result["queries"], 2)
+        self.assertEqual(result["mean_ms"], 4)
+        self.assertEqual(result["min_ms"], 1)
+        self.assertEqual(result["max_ms"], 10)
+        self.assertEqual(result["p50_ms"], 2)
+        self.assertEqual(result["p99_ms"], 10)
+
+    def test_compare_results(self):
+        """
+        Only benchmarks present in both runs are compared.
+        """
+        results = [
+            {"name": "a", "p50_ms": 15, "queries": 4},
+            {"name": "b", "p50_ms": 1, "queries": 1},
+        ]
+        baseline = [{"name": "a", "p50_ms": 10, "queries": 5}]
+
+        self.assertEqual(
+            compare_results(results, baseline),
+            [{"name": "a", "p50_change": 0.5, "queries_change": -1}],
+        )
+
+    def test_get_changed_plans(self):
+        """
+        Only queries explained in both runs are compared.
+        """
+        query_plans = [
+            {"name": "a", "plan": "SEARCH USING INDEX"},
+            {"name": "b", "plan": "SCAN"},
+            {"name": "c", "plan": "SCAN"},
+        ]
+        baseline = [
+            {"name": "a", "plan": "SCAN"},
+            {"name": "b", "plan": "SCAN"},
+        ]
+
+        self.assertEqual(get_changed_plans(query_plans, baseline), ["a"])
+
+    def test_no_groups(self):
+        """
+        The benchmarks need a group tree to run against.
+        """
+        with self.assertRaisesMessage(BenchmarkError, "generate_synthetic_network"):
+            BenchmarkEnvironment()
+
+    def test_not_loaded_by_the_application(self):
+        """
+        The benchmarks, which use the test client, are not imported by the
+        application itself.
+        """
+        code = (
+            "import sys, django; django.setup(); "
+            "import project.urls; "
+            "print('kns.core.benchmarks' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            text=True,
+            env={**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE},
+        )
+
+        self.assertEqual(result.stdout.strip(), "False")
+
+
+class TestRunBenchmarks(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command(
+            "generate_synthetic_network",
+            profiles=30,
+            depth=3,
+            fan_out=2,
+            events=1,
+            activities_per_event=1,
+            registrations_per_activity=2,
+            stdout=StringIO(),
+        )
+
+    def test_run_benchmarks(self):
+        """
+        Every benchmark runs and reports its latencies and query count.
+        """
+        report = run_benchmarks(iterations=2, warmup=1)
+
+        self.assertEqual(report["dataset"]["profiles"], 30)
+        self.assertEqual(report["dataset"]["groups"], 7)
+        self.assertEqual(report["dataset"]["group_tree_depth"], 3)
+        self.assertEqual(
+            [result["name"] for result in report["results"]],
+            list(BENCHMARKS),
+        )
+
+        for result in report["results"]:
+            self.assertEqual(result["iterations"], 2)
+            self.assertLessEqual(result["p50_ms"], result["max_ms"])
+
+            # Only the onboarding status cached in the session is free
+            if result["name"] == "onboarding_middleware[cached]":
+                self.assertEqual(result["queries"], 0)
+            else:
+                self.assertGreater(result["queries"], 0, result["name"])
+
+    def test_only(self):
+        """
+        Benchmarks can be selected by name.
+        """
+        report = run_benchmarks(names=["groups_index", "statistics"], iterations=1)
+
+        self.assertEqual(
+            [result["name"] for result in report["results"]],
+            [
+                "groups_index[all]",
+                "groups_index[num_members]",
+                "groups_index[num_leaders]",
+                "groups_index[num_mentors]",
+                "group_statistics",
+            ],
+        )
+
+    def test_explain(self):
+        """
+        The plans of the selected queries are reported.
+        """
+        report = run_benchmarks(names=["query[mentors]"], iterations=1, explain=True)
+
+        self.assertEqual(
+            [result["name"] for result in report["results"]],
+            ["query[mentors]"],
+        )
+        self.assertEqual(
+            [query_plan["name"] for query_plan in report["query_plans"]],
+            ["mentors"],
+        )
+        self.assertIn("profile_mentor_idx", report["query_plans"][0]["plan"])
+
+    def test_failed_request(self):
+        """
+        A benchmarked page that does not load fails the run.
+        """
+        request = BenchmarkEnvironment().get("/does-not-exist/")
+
+        with self.assertRaisesMessage(BenchmarkError, "returned 404"):
+            request()
+
+    def test_command(self):
+        """
+        The command saves the results as JSON and compares them with a
+        previous run.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            baseline = os.path.join(directory, "baseline.json")
+            output = os.path.join(directory, "results.json")
+            out = StringIO()
+
+            call_command(
+                "run_benchmarks",
+                only=["group_statistics", "query[mentors]"],
+                iterations=1,
+                explain=True,
+                output=baseline,
+                stdout=StringIO(),
+            )
+            call_command(
+                "run_benchmarks",
+                only=["group_statistics", "query[mentors]"],
+                iterations=1,
+                explain=True,
+                output=output,
+                compare=baseline,
+                stdout=out,
+            )
+
+            with open(output) as file:
+                report = json.load(file)
+
+        self.assertEqual(report["environment"]["iterations"], 1)
+        self.assertEqual(report["results"][0]["name"], "group_statistics")
+        self.assertIn(f"Compared with {baseline}", out.getvalue())
+        self.assertEqual(report["query_plans"][0]["name"], "mentors")
+        self.assertIn("Saved 2 results", out.getvalue())
+
+    def test_command_errors(self):
+        """
+        The command rejects invalid options and reports benchmark errors.
+        """
+        with self.assertRaisesMessage(CommandError, "at least 1"):
+            call_command("run_benchmarks", iterations=0)
+
+        with self.assertRaisesMessage(CommandError, "returned"):
+            BENCHMARKS["broken"] = lambda environment: environment.get("/nowhere/")
+
+            try:
+                call_command("run_benchmarks", only=["broken"], stdout=StringIO())
+            finally:
+                del BENCHMARKS["broken"]
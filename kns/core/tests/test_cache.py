@@ -0,0 +1,123 @@
+import tempfile
+
+from django.test import TestCase, override_settings
+
+from .. import cache
+
+
+class TestCacheHelpers(TestCase):
+    def setUp(self):
+        cache.reset_stats()
+
+    def test_make_key(self):
+        """
+        Test that keys are built from the namespace and the parts.
+        """
+        self.assertEqual(cache.make_key("onboarding_steps", 1), "onboarding_steps:1")
+        self.assertEqual(cache.make_key("setting"), "setting")
+
+    def test_get_and_set(self):
+        """
+        Test that a value written to a namespace can be read back.
+        """
+        self.assertIsNone(cache.get("things", 1))
+        self.assertEqual(cache.get("things", 1, default="missing"), "missing")
+
+        cache.set("things", 1, value=[1, 2])
+
+        self.assertEqual(cache.get("things", 1), [1, 2])
+        self.assertIsNone(cache.get("things", 2))
+
+    def test_cached_none_is_a_hit(self):
+        """
+        Test that a cached None is returned instead of the default.
+        """
+        cache.set("things", 1, value=None)
+
+        self.assertIsNone(cache.get("things", 1, default="missing"))
+        self.assertEqual(cache.get_stats()["things"]["hits"], 1)
+
+    def test_get_or_set(self):
+        """
+        Test that the default is only computed on a miss.
+        """
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return "value"
+
+        self.assertEqual(cache.get_or_set("things", 1, default=compute), "value")
+        self.assertEqual(cache.get_or_set("things", 1, default=compute), "value")
+        self.assertEqual(len(calls), 1)
+
+        self.assertEqual(cache.get_or_set("things", 2, default="plain"), "plain")
+
+    def test_delete(self):
+        """
+        Test that a deleted value is no longer cached.
+        """
+        cache.set("things", 1, value="value")
+        cache.delete("things", 1)
+
+        self.assertIsNone(cache.get("things", 1))
+
+    def test_versions(self):
+        """
+        Test that bumping a version replaces it, per scope.
+        """
+        version = cache.get_version("things", 1)
+
+        self.assertEqual(cache.get_version("things", 1), version)
+        self.assertNotEqual(cache.get_version("things", 2), version)
+
+        new_version = cache.bump_version("things", 1)
+
+        self.assertNotEqual(new_version, version)
+        self.assertEqual(cache.get_version("things", 1), new_version)
+
+    def test_stats(self):
+        """
+        Test that hits and misses are counted per namespace.
+        """
+        cache.get("things", 1)
+        cache.set("things", 1, value="value")
+        cache.get("things", 1)
+        cache.get("things", 1)
+        cache.get("other", 1)
+
+        self.assertEqual(
+            cache.get_stats(),
+            {
+                "other": {"hits": 0, "misses": 1, "hit_rate": 0.0},
+                "things": {"hits": 2, "misses": 1, "hit_rate": 0.667},
+            },
+        )
+
+        cache.reset_stats()
+
+        self.assertEqual(cache.get_stats(), {})
+
+    def test_file_based_cache(self):
+        """
+        Test that the helpers work with the file-based backend, which is
+        shared between processes.
+        """
+        with tempfile.TemporaryDirectory() as location:
+            with override_settings(
+                CACHES={
+                    "default": {
+                        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                        "LOCATION": location,
+                        "KEY_PREFIX": "kns-tests",
+                    },
+                },
+            ):
+                version = cache.get_version("things")
+                cache.set("things", version, value="value")
+
+                self.assertEqual(cache.get("things", version), "value")
+
+                cache.bump_version("things")
+
+                self.assertIsNone(cache.get("things", cache.get_version("things")))
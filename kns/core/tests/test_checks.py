@@ -0,0 +1,32 @@
+from django.test import SimpleTestCase, override_settings
+
+from ..checks import check_shared_cache
+
+LOCMEM = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+SHARED = {"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache"}}
+
+
+class TestSharedCacheCheck(SimpleTestCase):
+    @override_settings(CACHES=LOCMEM, DEBUG=False)
+    def test_warns_about_a_local_cache(self):
+        """
+        Test that a cache local to each process is reported outside of
+        debug mode.
+        """
+        messages = check_shared_cache(None)
+
+        self.assertEqual([message.id for message in messages], ["core.W001"])
+
+    @override_settings(CACHES=LOCMEM, DEBUG=True)
+    def test_allows_a_local_cache_in_debug_mode(self):
+        """
+        Test that a local cache is accepted in debug mode.
+        """
+        self.assertEqual(check_shared_cache(None), [])
+
+    @override_settings(CACHES=SHARED, DEBUG=False)
+    def test_allows_a_shared_cache(self):
+        """
+        Test that a shared cache is accepted.
+        """
+        self.assertEqual(check_shared_cache(None), [])
@@ -0,0 +1,49 @@
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory, TestCase
+
+from kns.custom_user.models import User
+
+from ..context_processors import notifications_context
+from .factories import NotificationFactory
+
+
+class TestNotificationsContext(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+        self.user = User.objects.create_user(
+            email="testuser@example.com",
+            password="password123",
+        )
+        self.profile = self.user.profile
+
+        self.notification = NotificationFactory(sender=self.profile)
+        self.notification.add_recipient(recipient=self.profile)
+
+    def get_context(self, user):
+        request = self.factory.get("/")
+        request.user = user
+
+        return notifications_context(request)
+
+    def test_context_is_lazy(self):
+        """
+        Nothing is loaded until the unread count is rendered, and the
+        notifications are never loaded.
+        """
+        with self.assertNumQueries(0):
+            context = self.get_context(self.user)
+
+        self.assertNotIn("grouped_notifications", context)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(context["unread_notifications_count"], 1)
+
+    def test_anonymous_user(self):
+        """
+        Anonymous users have no notifications.
+        """
+        context = self.get_context(AnonymousUser())
+
+        with self.assertNumQueries(0):
+            self.assertFalse(context["unread_notifications_count"])
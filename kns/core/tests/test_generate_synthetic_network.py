@@ -0,0 +1,187 @@
+from datetime import date, datetime, time, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import transaction
+from django.db.models import F
+from django.test import TestCase
+from django.utils import timezone
+
+from kns.activities.models import Activity, ActivityRegistration
+from kns.discipleships.models import Discipleship, DiscipleshipState
+from kns.events.models import Event
+from kns.groups.models import Group, GroupMember
+from kns.mentorships.models import Mentorship
+from kns.profiles.models import Profile
+
+
+def generate(**options):
+    out = StringIO()
+    call_command(
+        "generate_synthetic_network",
+        profiles=40,
+        depth=3,
+        fan_out=2,
+        events=2,
+        activities_per_event=2,
+        registrations_per_activity=3,
+        stdout=out,
+        **options,
+    )
+
+    return out.getvalue()
+
+
+class TestGenerateSyntheticNetworkCommand(TestCase):
+    def test_generates_the_network(self):
+        """
+        The command builds the profiles, a valid group tree and the
+        activity of the network.
+        """
+        output = generate()
+
+        self.assertIn("Generated 40 profiles, 7 groups", output)
+        self.assertEqual(Profile.objects.count(), 40)
+
+        # The tree has the requested shape and valid MPTT fields
+        root = Group.objects.get(parent=None)
+        self.assertEqual(root.get_descendant_count(), 6)
+        self.assertEqual(root.get_children().count(), 2)
+        self.assertEqual(
+            Group.objects.filter(level=2).count(),
+            4,
+        )
+        self.assertEqual(
+            set(Group.objects.values_list("leader__role", flat=True)),
+            {"leader"},
+        )
+
+        # Everyone but the root leader belongs to a group, and the stored
+        # member counts match the memberships
+        self.assertEqual(GroupMember.objects.count(), 39)
+        for group in Group.objects.all():
+            self.assertEqual(group.member_count, group.members.count())
+
+        # Every member has an ongoing discipleship with their group leader
+        for member in GroupMember.objects.select_related("group"):
+            discipleship = Discipleship.objects.get(
+                disciple=member.profile_id,
+                completed_at__isnull=True,
+            )
+            self.assertEqual(discipleship.discipler_id, member.group.leader_id)
+
+        self.assertEqual(
+            Discipleship.objects.filter(group="sent_forth").count(),
+            6,
+        )
+
+        # Stages start before the reference date and are completed after
+        # they started
+        reference_time = timezone.make_aware(datetime.combine(date(2025, 1, 1), time()))
+        self.assertFalse(
+            Discipleship.objects.filter(created_at__gte=F("completed_at")).exists()
+        )
+        self.assertFalse(
+            Discipleship.objects.filter(
+                created_at__gt=reference_time - timedelta(days=29),
+            ).exists()
+        )
+
+        # Every member has a current discipleship state
+        self.assertEqual(DiscipleshipState.objects.count(), 39)
+        self.assertTrue(Mentorship.objects.exists())
+        self.assertEqual(Event.objects.count(), 2)
+        self.assertEqual(Activity.objects.count(), 4)
+        self.assertEqual(ActivityRegistration.objects.count(), 12)
+
+    def test_same_seed_builds_the_same_network(self):
+        """
+        The network only depends on the options.
+        """
+
+        def snapshot():
+            return (
+                list(
+                    Profile.objects.values_list("first_name", "role", "location_city")
+                ),
+                list(Group.objects.values_list("name", "leader__email", "lft")),
+                list(GroupMember.objects.values_list("profile__email", "group__name")),
+                list(Activity.objects.order_by("pk").values_list("slug", flat=True)),
+                list(Discipleship.objects.order_by("pk").values_list("created_at")),
+                list(Mentorship.objects.order_by("pk").values_list("start_date")),
+                list(
+                    Event.objects.order_by("pk").values_list(
+                        "start_date",
+                        "registration_deadline_date",
+                    )
+                ),
+                list(
+                    Activity.objects.order_by("pk").values_list(
+                        "start_date",
+                        "start_time",
+                    )
+                ),
+            )
+
+        with transaction.atomic():
+            generate(seed=3)
+            first = snapshot()
+            transaction.set_rollback(True)
+
+        generate(seed=3)
+
+        self.assertEqual(snapshot(), first)
+
+    def test_dates_are_relative_to_the_reference_date(self):
+        """
+        Dates are drawn around the reference date instead of today.
+        """
+        generate(reference_date=date(2020, 6, 1))
+
+        self.assertEqual(
+            Discipleship.objects.filter(completed_at__isnull=True)
+            .values_list("created_at__date", flat=True)
+            .distinct()
+            .get(),
+            date(2020, 5, 2),
+        )
+        self.assertFalse(
+            Mentorship.objects.exclude(
+                start_date__range=(date(2019, 6, 2), date(2020, 6, 1)),
+            ).exists()
+        )
+        self.assertFalse(
+            Event.objects.exclude(
+                start_date__range=(date(2020, 6, 2), date(2020, 7, 1)),
+            ).exists()
+        )
+        self.assertFalse(
+            Activity.objects.exclude(
+                start_date__range=(date(2020, 6, 2), date(2020, 7, 1)),
+            ).exists()
+        )
+
+    def test_seed_already_generated(self):
+        """
+        A network cannot be generated twice with the same seed.
+        """
+        generate()
+
+        with self.assertRaisesMessage(CommandError, "already generated with seed 0"):
+            generate()
+
+    def test_not_enough_profiles(self):
+        """
+        Every group needs its own leader.
+        """
+        with self.assertRaisesMessage(
+            CommandError,
+            "A tree of 7 groups needs more than 5 profiles.",
+        ):
+            call_command(
+                "generate_synthetic_network",
+                profiles=5,
+                depth=3,
+                fan_out=2,
+            )
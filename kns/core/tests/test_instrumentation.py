@@ -0,0 +1,83 @@
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.template import engines
+from django.template.loader import render_to_string
+from django.test import RequestFactory, TestCase
+
+from ..instrumentation import InstrumentedTemplate, RequestMetrics, current_metrics
+from ..models import FAQ
+
+
+class TestRequestMetrics(TestCase):
+    def test_queries(self):
+        """
+        Queries are counted, and repeating a query with the same
+        parameters counts as a duplicate.
+        """
+        faq = FAQ.objects.create(question="Question?", answer="Answer")
+        metrics = RequestMetrics()
+
+        with connection.execute_wrapper(metrics):
+            FAQ.objects.get(pk=faq.pk)
+            FAQ.objects.get(pk=faq.pk)
+            FAQ.objects.count()
+
+        self.assertEqual(metrics.query_count, 3)
+        self.assertEqual(metrics.duplicate_query_count, 1)
+        self.assertGreater(metrics.timings["db"], 0)
+
+    def test_nested_measure(self):
+        """
+        Nested blocks of a timing are only counted once.
+        """
+        metrics = RequestMetrics()
+
+        with metrics.measure("template"):
+            with metrics.measure("template"):
+                pass
+
+            outer = metrics.timings["template"]
+
+        self.assertEqual(outer, 0)
+        self.assertGreater(metrics.timings["template"], 0)
+
+
+class TestInstrumentedDjangoTemplates(TestCase):
+    def setUp(self):
+        self.request = RequestFactory().get("/")
+        self.request.user = AnonymousUser()
+
+    def render(self):
+        template = engines["django"].from_string("{{ value }}")
+
+        self.assertIsInstance(template, InstrumentedTemplate)
+        self.assertEqual(template.render({"value": 1}), "1")
+
+    def test_outside_of_requests(self):
+        """
+        Templates render normally when no request is measured.
+        """
+        self.render()
+
+    def test_measured(self):
+        """
+        Templates and context processors are measured while a request is.
+        """
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+
+        try:
+            self.render()
+            template_time = metrics.timings["template"]
+
+            render_to_string("core/pages/about.html", request=self.request)
+        finally:
+            current_metrics.reset(token)
+
+        self.assertGreater(template_time, 0)
+        self.assertGreater(metrics.timings["template"], template_time)
+        self.assertGreater(metrics.timings["context_processors"], 0)
+        self.assertLess(
+            metrics.timings["context_processors"],
+            metrics.timings["template"],
+        )
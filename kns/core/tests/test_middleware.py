@@ -0,0 +1,128 @@
+from django.shortcuts import reverse
+from django.test import TestCase, override_settings
+
+from kns.custom_user.models import User
+
+from ..middleware import RequestInstrumentationMiddleware
+from ..models import FAQ, Setting
+
+LOGGER = "kns.core.middleware"
+
+
+class TestRequestInstrumentationMiddleware(TestCase):
+    def setUp(self):
+        FAQ.objects.create(
+            question="What is the Kingdom Nurturing Suite (KNS)?",
+            answer="A comprehensive collection of tools for DMM.",
+        )
+
+    def enable(self, sample_percent=100):
+        setting = Setting.get_or_create_setting()
+        setting.request_instrumentation_enabled = True
+        setting.request_instrumentation_sample_percent = sample_percent
+        setting.save()
+
+        # Load the new settings, as the next page rendered does
+        Setting.get_cached()
+
+    def log_in_staff(self):
+        user = User.objects.create_user(
+            email="staff@example.com",
+            password="testpass",
+            is_staff=True,
+        )
+        user.profile.is_onboarded = True
+        user.profile.save()
+
+        self.client.force_login(user)
+
+    def test_off_by_default(self):
+        """
+        Requests are not measured unless the instrumentation is turned on.
+        """
+        self.log_in_staff()
+
+        with self.assertNoLogs(LOGGER):
+            response = self.client.get(reverse("core:faqs"))
+
+        self.assertNotIn("Server-Timing", response)
+
+    def test_settings_not_loaded(self):
+        """
+        The settings are not loaded to decide whether to measure a request.
+        """
+        self.enable()
+        Setting.invalidate_cache()
+        middleware = RequestInstrumentationMiddleware(lambda request: None)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(middleware.get_sample_percent(), 0)
+
+        Setting.get_cached()
+
+        self.assertEqual(middleware.get_sample_percent(), 100)
+
+    @override_settings(REQUEST_INSTRUMENTATION=True)
+    def test_environment_variable(self):
+        """
+        The environment variable turns the instrumentation on, and staff
+        users get the timings in a `Server-Timing` header.
+        """
+        self.log_in_staff()
+
+        with self.assertLogs(LOGGER, "INFO") as logs:
+            response = self.client.get(reverse("core:faqs"))
+
+        values = logs.records[0].request_metrics
+
+        self.assertEqual(values["view"], "core:faqs")
+        self.assertEqual(values["method"], "GET")
+        self.assertEqual(values["status"], 200)
+        self.assertGreater(values["queries"], 0)
+        self.assertGreater(values["template_ms"], 0)
+        self.assertGreater(values["context_processors_ms"], 0)
+        self.assertIn("view=core:faqs method=GET status=200", logs.output[0])
+
+        server_timing = response["Server-Timing"]
+
+        self.assertIn("total;dur=", server_timing)
+        self.assertIn(
+            f'queries, {values["duplicate_queries"]} duplicates"', server_timing
+        )
+        self.assertIn("template;dur=", server_timing)
+        self.assertIn("context-processors;dur=", server_timing)
+
+    def test_setting(self):
+        """
+        The instrumentation can be turned on from the settings, and users
+        other than staff do not get the `Server-Timing` header.
+        """
+        self.enable()
+
+        with self.assertLogs(LOGGER, "INFO") as logs:
+            response = self.client.get("/does-not-exist/")
+
+        self.assertEqual(logs.records[0].request_metrics["view"], None)
+        self.assertEqual(logs.records[0].request_metrics["status"], 404)
+        self.assertNotIn("Server-Timing", response)
+
+    @override_settings(DEBUG=True)
+    def test_debug_server_timing(self):
+        """
+        Everyone gets the `Server-Timing` header when `DEBUG` is on.
+        """
+        self.enable()
+
+        with self.assertLogs(LOGGER, "INFO"):
+            response = self.client.get(reverse("core:faqs"))
+
+        self.assertIn("Server-Timing", response)
+
+    def test_sampling(self):
+        """
+        Only the sampled percentage of requests is measured.
+        """
+        self.enable(sample_percent=0)
+
+        with self.assertNoLogs(LOGGER):
+            self.client.get(reverse("core:faqs"))
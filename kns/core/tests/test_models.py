@@ -1,12 +1,15 @@
 from datetime import timedelta
+from unittest.mock import patch
 
 from django.core.exceptions import ValidationError
 from django.test import Client, TestCase
 from django.utils import timezone
 
 from kns.custom_user.models import User
+from kns.groups.tests.factories import GroupFactory
 
-from ..models import Setting
+from .. import cache, constants
+from ..models import NotificationRecipient, Setting
 from .factories import FAQFactory, NotificationFactory, NotificationRecipientFactory
 
 
@@ -83,6 +86,59 @@ class TestSetting(TestCase):
         setting = Setting.get_or_create_setting()
         self.assertEqual(str(setting), "Settings")
 
+    def test_get_cached(self):
+        """
+        Test that the cached setting is only loaded from the database once.
+        """
+        setting = Setting.get_cached()
+
+        with self.assertNumQueries(0):
+            self.assertIs(Setting.get_cached(), setting)
+
+    def test_get_cached_reloaded_after_save(self):
+        """
+        Test that saving the settings invalidates the cached instance.
+        """
+        Setting.get_cached()
+
+        self.setting.adult_age = 21
+        self.setting.save()
+
+        self.assertEqual(Setting.get_cached().adult_age, 21)
+
+    def test_get_cached_reloaded_when_version_changes(self):
+        """
+        Test that a process reloads the setting once its cache timeout has
+        passed and another process has saved the settings.
+        """
+        with patch("kns.core.models.time.monotonic", return_value=1000.0):
+            setting = Setting.get_cached()
+
+        # The timeout passed, but nobody saved the settings
+        with patch("kns.core.models.time.monotonic", return_value=2000.0):
+            with self.assertNumQueries(0):
+                self.assertIs(Setting.get_cached(), setting)
+
+        # Another process saved the settings
+        Setting.objects.filter(pk=self.setting.pk).update(adult_age=21)
+        cache.bump_version(constants.SETTING_CACHE_NAMESPACE)
+
+        with patch("kns.core.models.time.monotonic", return_value=2010.0):
+            self.assertIs(Setting.get_cached(), setting)
+
+        with patch("kns.core.models.time.monotonic", return_value=3000.0):
+            self.assertEqual(Setting.get_cached().adult_age, 21)
+
+    def test_get_cached_invalidated_on_delete(self):
+        """
+        Test that deleting the settings invalidates the cached instance.
+        """
+        setting = Setting.get_cached()
+
+        Setting.objects.all().delete()
+
+        self.assertIsNot(Setting.get_cached(), setting)
+
 
 class TestNotification(TestCase):
     def setUp(self):
@@ -162,6 +218,70 @@ class TestNotification(TestCase):
         recipient_record.refresh_from_db()
         self.assertTrue(recipient_record.is_read)
 
+    def test_add_recipients(self):
+        """
+        Test that `add_recipients` adds every recipient in one query and
+        skips recipients that were already added.
+        """
+        notification = NotificationFactory(sender=self.profile)
+        notification.add_recipient(recipient=self.profile)
+
+        with self.assertNumQueries(1):
+            notification.add_recipients(
+                [self.profile, self.other_profile, self.other_profile]
+            )
+
+        self.assertEqual(
+            set(notification.recipients.values_list("recipient", flat=True)),
+            {self.profile.pk, self.other_profile.pk},
+        )
+
+    def test_add_group_recipients(self):
+        """
+        Test that `add_group_recipients` adds the members and leaders of a
+        group subtree in one query.
+        """
+        leaders = [
+            User.objects.create_user(
+                email=f"leader{number}@example.com",
+                password="password123",
+            ).profile
+            for number in range(3)
+        ]
+        root = GroupFactory(leader=leaders[0])
+        child = GroupFactory(leader=leaders[1], parent=root)
+        other = GroupFactory(leader=leaders[2])
+
+        root.add_member(leaders[1])
+        child.add_member(self.profile)
+        other.add_member(self.other_profile)
+
+        notification = NotificationFactory(sender=self.profile)
+        notification.add_recipient(recipient=self.profile)
+
+        # Creating groups can renumber the trees
+        root.refresh_from_db()
+        child.refresh_from_db()
+
+        with self.assertNumQueries(1):
+            added = notification.add_group_recipients(root)
+
+        self.assertEqual(added, 2)
+        self.assertEqual(
+            set(notification.recipients.values_list("recipient", flat=True)),
+            {leaders[0].pk, leaders[1].pk, self.profile.pk},
+        )
+
+        # Only the group itself
+        notification = NotificationFactory(sender=self.profile)
+
+        notification.add_group_recipients(child, include_descendants=False)
+
+        self.assertEqual(
+            set(notification.recipients.values_list("recipient", flat=True)),
+            {leaders[1].pk, self.profile.pk},
+        )
+
     def test_icon_method(self):
         """
         Test the `icon` method returns the correct icon for the notification type.
@@ -258,6 +378,66 @@ class TestNotificationRecipient(TestCase):
             notification_recipient.read_at
         )  # read_at should be None if not read
 
+    def test_mark_all_as_read(self):
+        """
+        Test that `mark_all_as_read` marks all, or the selected, unread
+        notifications of a profile in a single query.
+        """
+        notifications = [NotificationFactory(sender=self.profile) for _ in range(3)]
+        for notification in notifications:
+            notification.add_recipient(recipient=self.profile)
+        notifications[0].add_recipient(recipient=self.other_profile)
+
+        with self.assertNumQueries(1):
+            marked = NotificationRecipient.mark_all_as_read(
+                self.profile,
+                notification_ids=[notifications[0].pk],
+            )
+
+        self.assertEqual(marked, 1)
+        self.assertEqual(NotificationRecipient.get_unread_count(self.profile), 2)
+
+        self.assertEqual(NotificationRecipient.mark_all_as_read(self.profile), 2)
+        self.assertEqual(NotificationRecipient.mark_all_as_read(self.profile), 0)
+        self.assertEqual(NotificationRecipient.get_unread_count(self.profile), 0)
+        self.assertEqual(NotificationRecipient.get_unread_count(self.other_profile), 1)
+
+    def test_unread_count_is_cached(self):
+        """
+        Test that the unread count is cached until a notification of the
+        profile is created or read.
+        """
+        self.assertEqual(NotificationRecipient.get_unread_count(self.profile), 0)
+
+        with self.assertNumQueries(0):
+            NotificationRecipient.get_unread_count(self.profile)
+
+        # Created one at a time
+        recipient = NotificationRecipientFactory(
+            notification=self.notification,
+            recipient=self.profile,
+        )
+        self.assertEqual(NotificationRecipient.get_unread_count(self.profile), 1)
+
+        # Created in bulk
+        notification = NotificationFactory(sender=self.profile)
+        notification.add_recipients([self.profile])
+        self.assertEqual(NotificationRecipient.get_unread_count(self.profile), 2)
+
+        # Created for a group
+        group = GroupFactory(leader=self.profile)
+        notification = NotificationFactory(sender=self.profile)
+        notification.add_group_recipients(group)
+        self.assertEqual(NotificationRecipient.get_unread_count(self.profile), 3)
+
+        # Read
+        recipient.mark_as_read()
+        self.assertEqual(NotificationRecipient.get_unread_count(self.profile), 2)
+
+        # Deleted
+        notification.delete()
+        self.assertEqual(NotificationRecipient.get_unread_count(self.profile), 1)
+
     def test_str_method(self):
         """
         The __str__ method returns a formatted string for the NotificationRecipient.
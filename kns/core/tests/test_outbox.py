@@ -0,0 +1,251 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from .. import constants
+from ..models import OutboxEmail
+from ..outbox import (
+    claim_queued_emails,
+    get_retry_delay,
+    queue_mail,
+    send_queued_emails,
+)
+
+
+def queue_test_mail(number=1, html_message=None):
+    return queue_mail(
+        subject=f"Subject {number}",
+        message="Message",
+        from_email="kns@example.com",
+        recipient_list=[f"user{number}@example.com"],
+        html_message=html_message,
+    )
+
+
+class TestQueueMail(TestCase):
+    def test_queue_mail_does_not_send(self):
+        """
+        Queued emails are stored as pending instead of being sent.
+        """
+        email = queue_test_mail(html_message="<p>Message</p>")
+
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(email.status, "pending")
+        self.assertEqual(email.recipient_list, ["user1@example.com"])
+        self.assertEqual(email.html_message, "<p>Message</p>")
+        self.assertEqual(str(email), "Subject 1 (pending)")
+
+    @override_settings(OUTBOX_ENABLED=False)
+    def test_queue_mail_sends_when_outbox_disabled(self):
+        """
+        Without the outbox, emails are sent right away instead of queued.
+        """
+        email = queue_test_mail(html_message="<p>Message</p>")
+
+        self.assertIsNone(email)
+        self.assertFalse(OutboxEmail.objects.exists())
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["user1@example.com"])
+        self.assertEqual(mail.outbox[0].alternatives[0][0], "<p>Message</p>")
+
+    def test_to_message(self):
+        """
+        The HTML body is attached as an alternative.
+        """
+        message = queue_test_mail(html_message="<p>Message</p>").to_message()
+
+        self.assertEqual(message.subject, "Subject 1")
+        self.assertEqual(message.to, ["user1@example.com"])
+        self.assertEqual(message.alternatives[0][0], "<p>Message</p>")
+
+        message = queue_test_mail(number=2).to_message()
+
+        self.assertEqual(message.alternatives, [])
+
+
+class TestSendQueuedEmails(TestCase):
+    def test_sends_due_emails_over_one_connection(self):
+        """
+        Due emails are sent in one batch over a single connection.
+        """
+        for number in range(3):
+            queue_test_mail(number)
+
+        with patch(
+            "kns.core.outbox.get_connection",
+            wraps=EmailBackend,
+        ) as get_connection:
+            self.assertEqual(send_queued_emails(), (3, 0))
+
+        get_connection.assert_called_once()
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(
+            OutboxEmail.objects.filter(status="sent", attempts=1).count(),
+            3,
+        )
+
+        # Sent emails are not sent again
+        self.assertEqual(send_queued_emails(), (0, 0))
+        self.assertEqual(len(mail.outbox), 3)
+
+    def test_batch_size(self):
+        """
+        At most `batch_size` emails are sent per call.
+        """
+        for number in range(3):
+            queue_test_mail(number)
+
+        self.assertEqual(send_queued_emails(batch_size=2), (2, 0))
+        self.assertEqual(send_queued_emails(batch_size=2), (1, 0))
+
+    def test_emails_not_due_are_skipped(self):
+        """
+        Emails waiting for a retry are not sent before their next attempt.
+        """
+        email = queue_test_mail()
+        email.next_attempt_at = timezone.now() + timedelta(minutes=5)
+        email.save()
+
+        self.assertEqual(send_queued_emails(), (0, 0))
+
+    def test_failed_email_is_retried_with_backoff(self):
+        """
+        A failed email does not stop the batch and is retried later.
+        """
+        failing = queue_test_mail(1)
+        queue_test_mail(2)
+
+        original_send_messages = EmailBackend.send_messages
+
+        def send_messages(backend, messages):
+            if messages[0].subject == "Subject 1":
+                raise ConnectionError("Connection refused")
+            return original_send_messages(backend, messages)
+
+        with patch.object(EmailBackend, "send_messages", send_messages):
+            self.assertEqual(send_queued_emails(), (1, 1))
+
+        failing.refresh_from_db()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(failing.status, "pending")
+        self.assertEqual(failing.attempts, 1)
+        self.assertEqual(failing.last_error, "Connection refused")
+        self.assertGreater(failing.next_attempt_at, timezone.now())
+
+        # The email is sent once it is due again
+        OutboxEmail.objects.filter(pk=failing.pk).update(
+            next_attempt_at=timezone.now(),
+        )
+
+        self.assertEqual(send_queued_emails(), (1, 0))
+        self.assertEqual(len(mail.outbox), 2)
+
+    def test_email_fails_after_max_attempts(self):
+        """
+        An email is given up on after the maximum number of attempts.
+        """
+        email = queue_test_mail()
+        OutboxEmail.objects.filter(pk=email.pk).update(
+            attempts=constants.OUTBOX_MAX_ATTEMPTS - 1,
+        )
+
+        with patch.object(
+            EmailBackend,
+            "send_messages",
+            side_effect=ConnectionError("Connection refused"),
+        ):
+            self.assertEqual(send_queued_emails(), (0, 1))
+
+        email.refresh_from_db()
+
+        self.assertEqual(email.status, "failed")
+        self.assertEqual(email.attempts, constants.OUTBOX_MAX_ATTEMPTS)
+
+    def test_connection_failure_retries_the_batch(self):
+        """
+        A connection that cannot be opened fails the whole batch, which is
+        retried later.
+        """
+        for number in range(2):
+            queue_test_mail(number)
+
+        with patch.object(
+            EmailBackend,
+            "open",
+            side_effect=ConnectionRefusedError("Connection refused"),
+        ):
+            self.assertEqual(send_queued_emails(), (0, 2))
+
+        self.assertEqual(len(mail.outbox), 0)
+
+        for email in OutboxEmail.objects.all():
+            self.assertEqual(email.status, "pending")
+            self.assertEqual(email.attempts, 1)
+            self.assertEqual(email.last_error, "Connection refused")
+            self.assertGreater(email.next_attempt_at, timezone.now())
+
+    def test_claimed_emails_are_skipped(self):
+        """
+        A claimed batch is not handed out again while it is being sent.
+        """
+        queue_test_mail()
+
+        self.assertEqual(len(claim_queued_emails()), 1)
+        self.assertEqual(claim_queued_emails(), [])
+        self.assertEqual(send_queued_emails(), (0, 0))
+
+        # The emails of a worker that died are due again after the claim
+        OutboxEmail.objects.update(next_attempt_at=timezone.now())
+
+        self.assertEqual(send_queued_emails(), (1, 0))
+
+    def test_retry_delay_doubles(self):
+        """
+        The retry delay doubles with every attempt.
+        """
+        self.assertEqual(
+            get_retry_delay(1),
+            timedelta(seconds=constants.OUTBOX_RETRY_DELAY),
+        )
+        self.assertEqual(get_retry_delay(3), get_retry_delay(1) * 4)
+
+
+class TestRunOutboxCommand(TestCase):
+    def test_sends_every_due_email(self):
+        """
+        The command sends batches until the outbox is empty.
+        """
+        for number in range(5):
+            queue_test_mail(number)
+
+        out = StringIO()
+        call_command("run_outbox", batch_size=2, stdout=out)
+
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertIn("Sent 5 emails, 0 failed.", out.getvalue())
+
+    def test_loop_survives_a_connection_failure(self):
+        """
+        A worker keeps polling when the mail server cannot be reached.
+        """
+        queue_test_mail()
+
+        with (
+            patch.object(EmailBackend, "open", side_effect=ConnectionRefusedError),
+            patch(
+                "kns.core.management.commands.run_outbox.time.sleep",
+                side_effect=KeyboardInterrupt,
+            ) as sleep,
+        ):
+            with self.assertRaises(KeyboardInterrupt):
+                call_command("run_outbox", loop=True, stdout=StringIO())
+
+        sleep.assert_called_once()
+        self.assertEqual(OutboxEmail.objects.get().attempts, 1)
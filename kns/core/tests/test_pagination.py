@@ -0,0 +1,144 @@
+from django.core.cache import caches
+from django.test import RequestFactory, TestCase
+
+from kns.custom_user.models import User
+from kns.profiles.models import Profile
+
+from ..pagination import (
+    DirectoryPaginator,
+    InvalidCursor,
+    encode_value,
+    get_cached_count,
+    get_directory_page,
+)
+
+LAST_NAMES = ["Doe", "Abba", "Doe", "Zed", "Abba", "Doe", "Musa"]
+
+
+class TestDirectoryPaginator(TestCase):
+    def setUp(self):
+        caches["default"].clear()
+
+        for number, last_name in enumerate(LAST_NAMES):
+            profile = User.objects.create_user(
+                email=f"user{number}@example.com",
+                password="testpass",
+            ).profile
+            profile.first_name = "John"
+            profile.last_name = last_name
+            profile.save()
+
+        self.profiles = Profile.objects.all()
+
+    def get_paginator(self, ordering=("-last_name",)):
+        return DirectoryPaginator(self.profiles, 3, ordering)
+
+    def test_cursors_walk_the_numbered_pages(self):
+        """
+        Following the next and previous cursors gives the same pages as the
+        page numbers, including for rows with the same sort value.
+        """
+        paginator = self.get_paginator()
+        numbered_pages = [
+            list(paginator.page(number)) for number in paginator.page_range
+        ]
+
+        self.assertEqual(paginator.ordering, ["-last_name", "-pk"])
+        self.assertIsNone(paginator.page(1).previous_cursor)
+
+        page = paginator.page(1)
+        pages = [list(page)]
+
+        while page.next_cursor:
+            page = self.get_paginator().cursor_page(page.next_cursor)
+            pages.append(list(page))
+
+        self.assertEqual(pages, numbered_pages)
+        self.assertEqual(page.number, 3)
+        self.assertFalse(page.has_next())
+
+        pages = [list(page)]
+
+        while page.previous_cursor:
+            page = self.get_paginator().cursor_page(page.previous_cursor)
+            pages.insert(0, list(page))
+
+        self.assertEqual(pages, numbered_pages)
+        self.assertEqual(page.number, 1)
+        self.assertTrue(page.has_next())
+
+    def test_cursor_page_does_not_count(self):
+        """
+        A cursor page only loads its rows, the total being cached.
+        """
+        cursor = self.get_paginator().page(1).next_cursor
+
+        with self.assertNumQueries(1):
+            page = self.get_paginator().cursor_page(cursor)
+            self.assertEqual(len(page), 3)
+            self.assertEqual(page.paginator.count, len(LAST_NAMES))
+
+    def test_invalid_cursors(self):
+        """
+        Malformed cursors and cursors of another ordering are rejected.
+        """
+        paginator = self.get_paginator()
+        cursor = self.get_paginator(["created_at"]).page(1).next_cursor
+
+        for invalid_cursor in ["", "not a cursor", cursor]:
+            with self.assertRaises(InvalidCursor):
+                paginator.cursor_page(invalid_cursor)
+
+    def test_empty_cursor_page(self):
+        """
+        A cursor past the last row gives an empty page without cursors.
+        """
+        paginator = self.get_paginator()
+        cursor = paginator.page(1).next_cursor
+
+        Profile.objects.filter(last_name__in=["Abba", "Doe"]).delete()
+        page = self.get_paginator().cursor_page(cursor)
+
+        self.assertEqual(list(page), [])
+        self.assertIsNone(page.next_cursor)
+        self.assertIsNone(page.previous_cursor)
+
+    def test_get_directory_page(self):
+        """
+        The page is read from the cursor, or else from the page number.
+        """
+        factory = RequestFactory()
+        paginator = self.get_paginator()
+        cursor = paginator.page(1).next_cursor
+
+        def get_page(**params):
+            return get_directory_page(
+                factory.get("/", params),
+                self.profiles,
+                3,
+                ["-last_name"],
+            )
+
+        self.assertEqual(list(get_page(cursor=cursor)), list(paginator.page(2)))
+        self.assertEqual(get_page(cursor="invalid", page=2).number, 2)
+        self.assertEqual(get_page(page="abc").number, 1)
+        self.assertEqual(get_page(page=99).number, 3)
+
+    def test_cached_count(self):
+        """
+        Counts are cached per query, and empty querysets are not run.
+        """
+        self.assertEqual(get_cached_count(self.profiles), len(LAST_NAMES))
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_cached_count(self.profiles), len(LAST_NAMES))
+            self.assertEqual(get_cached_count(Profile.objects.none()), 0)
+
+        self.assertEqual(get_cached_count(self.profiles.filter(last_name="Doe")), 3)
+
+    def test_encode_value(self):
+        """
+        Only dates are encoded besides the JSON types.
+        """
+        with self.assertRaises(TypeError):
+            encode_value(object())
@@ -0,0 +1,85 @@
+from django.test import TestCase
+
+from ..models import FAQ
+from .query_budget import QueryBudgetMixin, get_query_shape, get_repeated_shapes
+
+
+class TestQueryShape(TestCase):
+    def test_literals_are_replaced(self):
+        """
+        Queries differing only in their parameters share a shape.
+        """
+        self.assertEqual(
+            get_query_shape(
+                "SELECT * FROM faq WHERE id = 12 AND question = 'It''s' "
+                "AND id IN (1, 2, 3)"
+            ),
+            "SELECT * FROM faq WHERE id = ? AND question = ? AND id IN (...)",
+        )
+
+    def test_repeated_shapes(self):
+        """
+        Only shapes run more than the allowed number of times are returned.
+        """
+        queries = [
+            {"sql": "SELECT * FROM faq WHERE id = 1"},
+            {"sql": "SELECT * FROM faq WHERE id = 2"},
+            {"sql": "SELECT COUNT(*) FROM faq"},
+        ]
+
+        self.assertEqual(
+            get_repeated_shapes(queries, max_repeats=1),
+            [("SELECT * FROM faq WHERE id = ?", 2)],
+        )
+        self.assertEqual(get_repeated_shapes(queries, max_repeats=2), [])
+
+
+class TestAssertQueryBudget(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        self.faqs = [
+            FAQ.objects.create(question=f"Question {number}?", answer="Answer")
+            for number in range(3)
+        ]
+
+    def test_within_budget(self):
+        """
+        A block within its budget passes and exposes the captured queries.
+        """
+        with self.assertQueryBudget(1) as context:
+            list(FAQ.objects.all())
+
+        self.assertEqual(len(context), 1)
+
+    def test_over_budget(self):
+        """
+        A block running more queries than its budget fails.
+        """
+        with self.assertRaisesMessage(AssertionError, "2 queries run, budget is 1."):
+            with self.assertQueryBudget(1):
+                FAQ.objects.count()
+                FAQ.objects.exists()
+
+    def test_repeated_queries(self):
+        """
+        Repeating a query shape fails even within the budget, and the
+        report lists the repeated shape.
+        """
+        with self.assertRaises(AssertionError) as error:
+            with self.assertQueryBudget(10):
+                for faq in self.faqs:
+                    FAQ.objects.get(pk=faq.pk)
+
+        self.assertIn("Repeated queries (possible N+1):", str(error.exception))
+        self.assertIn("3x SELECT", str(error.exception))
+
+        with self.assertQueryBudget(10, max_repeats=3):
+            for faq in self.faqs:
+                FAQ.objects.get(pk=faq.pk)
+
+
+def test_query_budget_fixture(query_budget):
+    """
+    The `query_budget` fixture asserts the budget of a block.
+    """
+    with query_budget(1):
+        FAQ.objects.count()
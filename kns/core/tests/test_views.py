@@ -5,6 +5,7 @@ from kns.custom_user.models import User
 from kns.groups.models import Group
 from kns.onboarding.models import ProfileCompletion
 
+from .. import cache
 from ..models import FAQ, Notification, NotificationRecipient
 
 
@@ -282,6 +283,118 @@ class TestNotificationViews(TestCase):
             )}",
         )
 
+    def test_mark_notifications_as_read(self):
+        """
+        All unread notifications are marked as read, and the remaining
+        unread count is returned.
+        """
+        other_notification = Notification.objects.create(
+            notification_type="group_move",
+            message="Another notification.",
+            sender=self.profile,
+        )
+        other_notification.add_recipient(recipient=self.profile)
+
+        response = self.client.post(reverse("core:mark_notifications_as_read"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"marked": 2, "unread_count": 0})
+
+    def test_mark_selected_notifications_as_read(self):
+        """
+        Only the posted notifications are marked as read.
+        """
+        other_notification = Notification.objects.create(
+            notification_type="group_move",
+            message="Another notification.",
+            sender=self.profile,
+        )
+        other_notification.add_recipient(recipient=self.profile)
+
+        response = self.client.post(
+            reverse("core:mark_notifications_as_read"),
+            data={"notification_ids": [self.notification.id]},
+        )
+
+        self.assertEqual(response.json(), {"marked": 1, "unread_count": 1})
+        self.assertFalse(
+            other_notification.recipients.get(recipient=self.profile).is_read
+        )
+
+    def test_mark_notifications_as_read_invalid_ids(self):
+        """
+        Posting ids that are not numbers returns a 400 error.
+        """
+        for notification_id in ["abc", "²"]:
+            response = self.client.post(
+                reverse("core:mark_notifications_as_read"),
+                data={"notification_ids": [notification_id]},
+            )
+
+            self.assertEqual(response.status_code, 400)
+
+    def test_mark_notifications_as_read_requires_post(self):
+        """
+        The notifications can only be marked as read with a POST request.
+        """
+        response = self.client.get(reverse("core:mark_notifications_as_read"))
+
+        self.assertEqual(response.status_code, 405)
+
+    def test_notifications_drawer(self):
+        """
+        The drawer content is returned as JSON.
+        """
+        response = self.client.get(reverse("core:notifications_drawer"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "unread_count": 1,
+                "periods": [
+                    {
+                        "period": "Today",
+                        "notifications": [
+                            {
+                                "id": self.notification.id,
+                                "title": "Group Moved",
+                                "message": self.notification.message,
+                                "icon": "tabler:transfer",
+                                "time_since_created": "0 minutes ago",
+                                "url": reverse(
+                                    "core:mark_notification_and_redirect",
+                                    args=[self.notification.id],
+                                ),
+                            }
+                        ],
+                    }
+                ],
+            },
+        )
+
+    def test_pages_load_the_drawer_from_the_endpoint(self):
+        """
+        Pages render the drawer without its notifications, which are
+        loaded from the drawer endpoint when it is opened.
+        """
+        response = self.client.get(reverse("core:index"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, reverse("core:notifications_drawer"))
+        self.assertNotContains(response, self.notification.message)
+
+    def test_notifications_unread_count(self):
+        """
+        The unread count is returned, and cached between requests.
+        """
+        url = reverse("core:notifications_unread_count")
+
+        self.assertEqual(self.client.get(url).json(), {"unread_count": 1})
+
+        with self.assertNumQueries(0):
+            NotificationRecipient.get_unread_count(self.profile)
+
     def test_mark_nonexistent_notification(self):
         """
         Attempting to mark a nonexistent notification should return a 404 error.
@@ -376,3 +489,48 @@ class TestDismissGettingStartedView(TestCase):
             response,
             f"{reverse('accounts:login')}?next={reverse('core:dismiss_getting_started')}",
         )
+
+
+class TestCacheStatsView(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.url = reverse("core:cache_stats")
+
+        cache.reset_stats()
+
+    def test_requires_staff(self):
+        """
+        Non-staff users are redirected to the admin login.
+        """
+        user = User.objects.create_user(
+            email="member@example.com",
+            password="password123",
+        )
+        self.client.force_login(user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_returns_stats(self):
+        """
+        Staff users get the cache hit and miss counters.
+        """
+        user = User.objects.create_user(
+            email="staff@example.com",
+            password="password123",
+            is_staff=True,
+        )
+        user.profile.is_onboarded = True
+        user.profile.save()
+        self.client.force_login(user)
+
+        cache.get("things", 1)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()["things"],
+            {"hits": 0, "misses": 1, "hit_rate": 0.0},
+        )
@@ -35,9 +35,29 @@ urlpatterns = [
         views.mark_notification_and_redirect,
         name="mark_notification_and_redirect",
     ),
+    path(
+        "notifications/mark-as-read/",
+        views.mark_notifications_as_read,
+        name="mark_notifications_as_read",
+    ),
+    path(
+        "notifications/",
+        views.notifications_drawer,
+        name="notifications_drawer",
+    ),
+    path(
+        "notifications/unread-count/",
+        views.notifications_unread_count,
+        name="notifications_unread_count",
+    ),
     path(
         "contact",
         views.contact_view,
         name="contact",
     ),
+    path(
+        "cache-stats",
+        views.cache_stats_view,
+        name="cache_stats",
+    ),
 ]
@@ -2,6 +2,8 @@
 Util functions for the `core` app.
 """
 
+from collections import defaultdict
+
 from .models import Notification, NotificationRecipient
 
 
@@ -63,3 +65,35 @@ def create_group_change_notification(profile, current_group, target_group):
     )
 
     return notification
+
+
+def get_grouped_unread_notifications(profile, limit=10):
+    """
+    Return the latest unread notifications of a profile, grouped by the
+    time period they were created in.
+
+    Parameters
+    ----------
+    profile : Profile
+        The profile whose notifications are returned.
+    limit : int, optional
+        The maximum number of notifications. Defaults to 10.
+
+    Returns
+    -------
+    dict
+        A mapping of time period (e.g. 'Today', 'Yesterday') to the list
+        of notifications created in it.
+    """
+    unread_notifications = NotificationRecipient.objects.filter(
+        recipient=profile,
+        is_read=False,
+    ).select_related("notification")[:limit]
+
+    grouped_notifications = defaultdict(list)
+
+    for recipient_notification in unread_notifications:
+        notification = recipient_notification.notification
+        grouped_notifications[notification.time_period()].append(notification)
+
+    return dict(grouped_notifications)
@@ -2,16 +2,21 @@
 Views for the core application.
 """
 
+from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import ObjectDoesNotExist
-from django.http import HttpRequest, HttpResponse
+from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
+from django.urls import reverse
+from django.views.decorators.http import require_POST
 
 from kns.groups.models import Group
 from kns.onboarding.models import ProfileCompletion
 from kns.profiles.models import Profile
 
-from .models import FAQ, Notification
+from . import cache
+from .models import FAQ, Notification, NotificationRecipient
+from .utils import get_grouped_unread_notifications
 
 
 def index(request):
@@ -225,6 +230,120 @@ def mark_notification_and_redirect(request, notification_id):
     return redirect(notification.link)
 
 
+@login_required
+@require_POST
+def mark_notifications_as_read(request):
+    """
+    Mark the selected, or all, unread notifications of the logged-in user
+    as read.
+
+    Parameters
+    ----------
+    request : HttpRequest
+        The HTTP request object. `notification_ids` may be posted to only
+        mark those notifications; otherwise every notification is marked.
+
+    Returns
+    -------
+    JsonResponse
+        A JSON response with the number of notifications `marked` and the
+        remaining `unread_count`.
+    """
+    notification_ids = request.POST.getlist("notification_ids")
+
+    if not all(
+        notification_id.isascii() and notification_id.isdecimal()
+        for notification_id in notification_ids
+    ):
+        return JsonResponse({"error": "Invalid notification ids."}, status=400)
+
+    profile = request.user.profile
+    marked = NotificationRecipient.mark_all_as_read(
+        profile,
+        notification_ids=[int(pk) for pk in notification_ids] or None,
+    )
+
+    return JsonResponse(
+        {
+            "marked": marked,
+            "unread_count": NotificationRecipient.get_unread_count(profile),
+        }
+    )
+
+
+@login_required
+def notifications_unread_count(request):
+    """
+    Return the number of unread notifications of the logged-in user.
+
+    Parameters
+    ----------
+    request : HttpRequest
+        The HTTP request object.
+
+    Returns
+    -------
+    JsonResponse
+        A JSON response with the `unread_count`.
+    """
+    return JsonResponse(
+        {
+            "unread_count": NotificationRecipient.get_unread_count(
+                request.user.profile
+            ),
+        }
+    )
+
+
+@login_required
+def notifications_drawer(request):
+    """
+    Return the content of the notification drawer as JSON, so it can be
+    loaded asynchronously instead of on every page render.
+
+    Parameters
+    ----------
+    request : HttpRequest
+        The HTTP request object.
+
+    Returns
+    -------
+    JsonResponse
+        A JSON response with the `unread_count` and the latest unread
+        notifications grouped by time period under `periods`.
+    """
+    profile = request.user.profile
+    grouped_notifications = get_grouped_unread_notifications(profile)
+
+    periods = [
+        {
+            "period": period,
+            "notifications": [
+                {
+                    "id": notification.id,
+                    "title": notification.title,
+                    "message": notification.message,
+                    "icon": notification.icon(),
+                    "time_since_created": notification.time_since_created(),
+                    "url": reverse(
+                        "core:mark_notification_and_redirect",
+                        args=[notification.id],
+                    ),
+                }
+                for notification in notifications
+            ],
+        }
+        for period, notifications in grouped_notifications.items()
+    ]
+
+    return JsonResponse(
+        {
+            "unread_count": NotificationRecipient.get_unread_count(profile),
+            "periods": periods,
+        }
+    )
+
+
 @login_required
 def dismiss_getting_started(request):
     """
@@ -260,3 +379,22 @@ def dismiss_getting_started(request):
 
     # Redirect to the index page
     return redirect("core:index")
+
+
+@staff_member_required
+def cache_stats_view(request):
+    """
+    Return the cache hit and miss counters of the serving process.
+
+    Parameters
+    ----------
+    request : HttpRequest
+        The HTTP request object from a staff user.
+
+    Returns
+    -------
+    JsonResponse
+        A JSON response mapping each cache namespace to its `hits`,
+        `misses` and `hit_rate`.
+    """
+    return JsonResponse(cache.get_stats())
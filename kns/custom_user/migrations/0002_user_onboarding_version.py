@@ -0,0 +1,18 @@
+# Generated by Django 5.1 on 2026-10-16 22:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("custom_user", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="onboarding_version",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
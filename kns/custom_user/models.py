@@ -21,3 +21,7 @@ class User(BaseUser):
     verified = models.BooleanField(default=False)
     is_visitor = models.BooleanField(default=False)
     agreed_to_terms = models.BooleanField(default=False)
+
+    # Bumped whenever the onboarding status of the user's profile changes,
+    # so the status stored in their sessions is refreshed in every process.
+    onboarding_version = models.PositiveIntegerField(default=0, editable=False)
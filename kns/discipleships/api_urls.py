@@ -0,0 +1,19 @@
+"""
+URL configuration for the discipleships API.
+
+URLs:
+    - groups/<int:pk>/discipleship-funnel/ : Counts the disciples at
+    every discipleship stage across a group subtree.
+"""
+
+from django.urls import path
+
+from . import api_views
+
+urlpatterns = [
+    path(
+        "groups/<int:pk>/discipleship-funnel/",
+        api_views.group_discipleship_funnel,
+        name="group_discipleship_funnel",
+    ),
+]
@@ -0,0 +1,54 @@
+"""
+This module contains API views for retrieving discipleship data.
+"""
+
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from kns.groups.models import Group
+
+from .models import DiscipleshipState
+
+
+@api_view(["GET"])
+def group_discipleship_funnel(request, pk):
+    """
+    Count the disciples at every discipleship stage across a group and
+    all its descendants.
+
+    The counts are aggregated from the current discipleship states of
+    the leaders of the groups in the subtree in a single query.
+
+    Parameters
+    ----------
+    request : HttpRequest
+        The request object that provides metadata about the request.
+    pk : int
+        The primary key (ID) of the root group of the subtree.
+
+    Returns
+    -------
+    Response
+        A JSON response with the number of disciples at every stage and
+        their `total`, or an error message with a 404 status if the
+        group does not exist.
+    """
+    try:
+        group = Group.objects.get(pk=pk)
+    except Group.DoesNotExist:
+        return Response(
+            {
+                "detail": "Group not found.",
+            },
+            status=status.HTTP_404_NOT_FOUND,
+        )
+
+    funnel = DiscipleshipState.objects.in_group_subtree(group).funnel()
+
+    return Response(
+        {
+            "group": group.pk,
+            **funnel,
+        }
+    )
@@ -65,7 +65,7 @@ class GroupMemberDiscipleForm(forms.ModelForm):
                 group_in__in=profile.group_led.members.all(),
                 user__verified=True,
                 user__agreed_to_terms=True,
-            )
+            ).select_related("encryption")
 
 
 class DiscipleshipFilterForm(forms.Form):
@@ -0,0 +1,42 @@
+"""
+Django management command to rebuild the current discipleship states.
+
+The `DiscipleshipState` table is maintained by signals on
+`Discipleship`. This command recomputes it from the discipleship history,
+for example after a bulk import or a manual database change.
+
+Usage:
+    python manage.py rebuild_discipleship_states
+"""
+
+from django.core.management.base import BaseCommand
+
+from kns.discipleships.models import DiscipleshipState
+
+
+class Command(BaseCommand):
+    """
+    Django management command that recomputes the current stage of every
+    discipler and disciple pair from the discipleship history.
+    """
+
+    help = "Rebuilds the current discipleship state of every pair."
+
+    def handle(self, *args, **options):
+        """
+        Rebuild every discipleship state in a single transaction.
+
+        Parameters
+        ----------
+        *args
+            Positional arguments passed to the command (not used in this
+            method).
+        **options
+            Keyword arguments passed to the command (not used in this
+            method).
+        """
+        created = DiscipleshipState.objects.rebuild()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Discipleship states rebuilt for {created} pairs."),
+        )
@@ -0,0 +1,46 @@
+# Generated by Django 5.1 on 2026-10-16 21:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("discipleships", "0002_discipleship_completed_at"),
+        ("profiles", "0011_profile_directory_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="discipleship",
+            index=models.Index(fields=["created_at"], name="discipleship_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="discipleship",
+            index=models.Index(
+                fields=["discipler", "group", "created_at"],
+                name="discipleship_discipler_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="discipleship",
+            index=models.Index(
+                fields=["disciple", "discipler", "created_at"],
+                name="discipleship_pair_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="discipleship",
+            index=models.Index(
+                fields=["disciple", "created_at"], name="discipleship_disciple_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="discipleship",
+            index=models.Index(
+                condition=models.Q(("completed_at__isnull", True)),
+                fields=["created_at"],
+                name="discipleship_ongoing_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,110 @@
+# Generated by Django 5.1 on 2026-10-16 22:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_discipleship_states(apps, schema_editor):
+    Discipleship = apps.get_model("discipleships", "Discipleship")
+    DiscipleshipState = apps.get_model("discipleships", "DiscipleshipState")
+
+    latest = {}
+    for discipleship in Discipleship.objects.order_by("created_at", "pk"):
+        latest[(discipleship.discipler_id, discipleship.disciple_id)] = discipleship
+
+    DiscipleshipState.objects.bulk_create(
+        DiscipleshipState(
+            disciple_id=discipleship.disciple_id,
+            discipler_id=discipleship.discipler_id,
+            discipleship=discipleship,
+            group=discipleship.group,
+        )
+        for discipleship in latest.values()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("discipleships", "0003_discipleship_indexes"),
+        ("profiles", "0011_profile_directory_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DiscipleshipState",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "group",
+                    models.CharField(
+                        choices=[
+                            ("group_member", "Group member"),
+                            ("first_12", "First 12"),
+                            ("first_3", "First 3"),
+                            ("sent_forth", "Sent forth"),
+                        ],
+                        help_text="The discipleship stage the disciple is currently at.",
+                        max_length=12,
+                    ),
+                ),
+                (
+                    "disciple",
+                    models.ForeignKey(
+                        help_text="The profile being discipled.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="discipleship_states_where_disciple",
+                        to="profiles.profile",
+                    ),
+                ),
+                (
+                    "discipler",
+                    models.ForeignKey(
+                        help_text="The profile acting as the discipler.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="discipleship_states_where_discipler",
+                        to="profiles.profile",
+                    ),
+                ),
+                (
+                    "discipleship",
+                    models.OneToOneField(
+                        help_text=(
+                            "The latest discipleship between the discipler and disciple."
+                        ),
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="state",
+                        to="discipleships.discipleship",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["discipler", "group"],
+                        name="discipleship_state_stage_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("discipler", "disciple"),
+                        name="discipleship_state_pair_unique",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(
+            populate_discipleship_states,
+            migrations.RunPython.noop,
+        ),
+    ]
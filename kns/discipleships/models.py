@@ -5,7 +5,11 @@ Models for the `discipleships` app.
 from datetime import timedelta
 from uuid import uuid4
 
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery, Window
+from django.db.models.functions import RowNumber
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone
 
 from kns.core import modelmixins
@@ -14,6 +18,94 @@ from kns.profiles.models import Profile
 from . import constants
 
 
+class DiscipleshipQuerySet(models.QuerySet):
+    """
+    Custom queryset for the Discipleship model.
+    """
+
+    def _latest_by(self, *partition_by):
+        """
+        Keep only the latest discipleship of every partition.
+
+        Parameters
+        ----------
+        *partition_by : str
+            The fields the discipleships are partitioned by.
+
+        Returns
+        -------
+        DiscipleshipQuerySet
+            The latest discipleship of every partition in the queryset.
+        """
+        return self.alias(
+            stage_rank=Window(
+                RowNumber(),
+                partition_by=[F(field) for field in partition_by],
+                order_by=[F("created_at").desc(), F("pk").desc()],
+            ),
+        ).filter(stage_rank=1)
+
+    def current(self):
+        """
+        Keep only the latest discipleship of every disciple, i.e. the
+        stage they are currently at.
+
+        The latest discipleships are picked with a `ROW_NUMBER()` window
+        partitioned by disciple, so every stage is fetched in a single
+        pass over the filtered discipleships.
+
+        Returns
+        -------
+        DiscipleshipQuerySet
+            The latest discipleship of every disciple in the queryset.
+        """
+        return self._latest_by("disciple")
+
+    def with_running_times(self):
+        """
+        Annotate every discipleship with the start of its pair's first
+        discipleship and the time the disciple was first sent forth.
+
+        `total_running_time()` reads these annotations instead of
+        querying the discipleships of the pair again.
+
+        Returns
+        -------
+        DiscipleshipQuerySet
+            The queryset annotated with `first_started_at` and
+            `sent_forth_at`.
+        """
+        pair_discipleships = Discipleship.objects.filter(
+            disciple=OuterRef("disciple"),
+            discipler=OuterRef("discipler"),
+        ).order_by("created_at")
+
+        return self.annotate(
+            first_started_at=Subquery(
+                pair_discipleships.values("created_at")[:1],
+            ),
+            sent_forth_at=Subquery(
+                pair_discipleships.filter(
+                    group="sent_forth",
+                ).values(
+                    "created_at"
+                )[:1],
+            ),
+        )
+
+    def current_per_pair(self):
+        """
+        Keep only the latest discipleship of every discipler and disciple
+        pair.
+
+        Returns
+        -------
+        DiscipleshipQuerySet
+            The latest discipleship of every pair in the queryset.
+        """
+        return self._latest_by("discipler", "disciple")
+
+
 class Discipleship(
     modelmixins.TimestampedModel,
     models.Model,
@@ -24,6 +116,26 @@ class Discipleship(
 
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=["created_at"], name="discipleship_created_idx"),
+            models.Index(
+                fields=["discipler", "group", "created_at"],
+                name="discipleship_discipler_idx",
+            ),
+            models.Index(
+                fields=["disciple", "discipler", "created_at"],
+                name="discipleship_pair_idx",
+            ),
+            models.Index(
+                fields=["disciple", "created_at"],
+                name="discipleship_disciple_idx",
+            ),
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(completed_at__isnull=True),
+                name="discipleship_ongoing_idx",
+            ),
+        ]
 
     disciple = models.ForeignKey(
         Profile,
@@ -71,6 +183,8 @@ class Discipleship(
         help_text="A unique identifier for the discipleship instance.",
     )
 
+    objects = DiscipleshipQuerySet.as_manager()
+
     def __str__(self) -> str:
         """
         Return a string representation of the Discipleship instance.
@@ -142,18 +256,28 @@ class Discipleship(
             A string indicating the number of months and weeks the
             discipleship has been running.
         """
-        # Retrieve all discipleships between the same discipler and disciple, ordered by created_at
-        discipleships = Discipleship.objects.filter(
-            disciple=self.disciple, discipler=self.discipler
-        ).order_by("created_at")
-
-        # Get the first discipleship's creation date
-        first_discipleship_date = discipleships.first().created_at
-
-        # Check if there is a 'sent_forth' group discipleship
-        sent_forth_discipleship = discipleships.filter(group="sent_forth").first()
-        if sent_forth_discipleship:
-            end_date = sent_forth_discipleship.created_at
+        if hasattr(self, "first_started_at"):
+            # Loaded through `Discipleship.objects.with_running_times()`
+            first_discipleship_date = self.first_started_at
+            sent_forth_date = self.sent_forth_at
+        else:
+            # Retrieve all discipleships between the same discipler and
+            # disciple, ordered by created_at
+            discipleships = Discipleship.objects.filter(
+                disciple=self.disciple, discipler=self.discipler
+            ).order_by("created_at")
+
+            # Get the first discipleship's creation date
+            first_discipleship_date = discipleships.first().created_at
+
+            # Check if there is a 'sent_forth' group discipleship
+            sent_forth_discipleship = discipleships.filter(group="sent_forth").first()
+            sent_forth_date = (
+                sent_forth_discipleship.created_at if sent_forth_discipleship else None
+            )
+
+        if sent_forth_date:
+            end_date = sent_forth_date
         else:
             # If no 'sent_forth' discipleship, use the current time
             # or the completed_at date
@@ -175,3 +299,224 @@ class Discipleship(
             result.append(f"{total_weeks} week{'s' if total_weeks > 1 else ''}")
 
         return " and ".join(result) if result else "less than a week"
+
+
+class DiscipleshipStateQuerySet(models.QuerySet):
+    """
+    Custom queryset for the DiscipleshipState model.
+    """
+
+    def in_group_subtree(self, group):
+        """
+        Keep the states of disciplers leading a group in the subtree of
+        a group, the group itself included.
+
+        The subtree is matched on the `tree_id`, `lft` and `rght` columns
+        maintained by MPTT, so no descendants need to be fetched first.
+
+        Parameters
+        ----------
+        group : Group
+            The root group of the subtree.
+
+        Returns
+        -------
+        DiscipleshipStateQuerySet
+            The states of the disciplers leading a group in the subtree.
+        """
+        return self.filter(
+            discipler__group_led__tree_id=group.tree_id,
+            discipler__group_led__lft__gte=group.lft,
+            discipler__group_led__lft__lte=group.rght,
+        )
+
+    def funnel(self):
+        """
+        Count the disciples at every discipleship stage.
+
+        Every stage is counted in the same query using conditional
+        aggregation.
+
+        Returns
+        -------
+        dict
+            A mapping of every stage in `DISCIPLESHIP_GROUP_CHOICES` to
+            the number of disciples currently at it, plus `total`.
+        """
+        return self.aggregate(
+            **{
+                stage: Count("id", filter=Q(group=stage))
+                for stage, _ in constants.DISCIPLESHIP_GROUP_CHOICES
+            },
+            total=Count("id"),
+        )
+
+    def rebuild(self):
+        """
+        Rebuild every discipleship state from the discipleship history.
+
+        Returns
+        -------
+        int
+            The number of states created.
+        """
+        with transaction.atomic():
+            DiscipleshipState.objects.all().delete()
+
+            states = DiscipleshipState.objects.bulk_create(
+                DiscipleshipState(
+                    disciple_id=discipleship.disciple_id,
+                    discipler_id=discipleship.discipler_id,
+                    discipleship=discipleship,
+                    group=discipleship.group,
+                )
+                for discipleship in Discipleship.objects.current_per_pair()
+            )
+
+        return len(states)
+
+
+class DiscipleshipState(
+    modelmixins.TimestampedModel,
+    models.Model,
+):
+    """
+    The stage a disciple is currently at with a discipler.
+
+    `Discipleship` is an append-only history. This table keeps one row
+    per discipler and disciple pair pointing at the latest discipleship
+    of the pair, and is maintained by the `Discipleship` signals.
+    """
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["discipler", "disciple"],
+                name="discipleship_state_pair_unique",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["discipler", "group"],
+                name="discipleship_state_stage_idx",
+            ),
+        ]
+
+    disciple = models.ForeignKey(
+        Profile,
+        related_name="discipleship_states_where_disciple",
+        on_delete=models.CASCADE,
+        help_text="The profile being discipled.",
+    )
+
+    discipler = models.ForeignKey(
+        Profile,
+        related_name="discipleship_states_where_discipler",
+        on_delete=models.CASCADE,
+        help_text="The profile acting as the discipler.",
+    )
+
+    discipleship = models.OneToOneField(
+        Discipleship,
+        related_name="state",
+        on_delete=models.CASCADE,
+        help_text="The latest discipleship between the discipler and disciple.",
+    )
+
+    group = models.CharField(
+        max_length=12,
+        choices=constants.DISCIPLESHIP_GROUP_CHOICES,
+        help_text="The discipleship stage the disciple is currently at.",
+    )
+
+    objects = DiscipleshipStateQuerySet.as_manager()
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the DiscipleshipState instance.
+
+        Returns
+        -------
+        str
+            A string showing the current group, disciple, and discipler.
+        """
+        return f"{self.disciple} is {self.group} of {self.discipler}"
+
+
+@receiver(post_save, sender=Discipleship)
+def update_discipleship_state(sender, instance, created, **kwargs):
+    """
+    Point the state of a discipler and disciple pair at a newly created
+    discipleship, or keep its stage in step when the current
+    discipleship is edited.
+
+    Parameters
+    ----------
+    sender : type
+        The model class that triggered the signal (Discipleship).
+    instance : Discipleship
+        The instance of the Discipleship model being saved.
+    created : bool
+        A boolean indicating if the Discipleship instance was newly created.
+    **kwargs : dict
+        Additional keyword arguments passed by the signal.
+    """
+    if created:
+        DiscipleshipState.objects.update_or_create(
+            disciple_id=instance.disciple_id,
+            discipler_id=instance.discipler_id,
+            defaults={
+                "discipleship": instance,
+                "group": instance.group,
+            },
+        )
+    else:
+        DiscipleshipState.objects.filter(
+            discipleship=instance,
+        ).exclude(
+            group=instance.group,
+        ).update(
+            group=instance.group,
+        )
+
+
+@receiver(post_delete, sender=Discipleship)
+def restore_discipleship_state(sender, instance, **kwargs):
+    """
+    Point the state of a discipler and disciple pair back at their
+    latest remaining discipleship when the current one is deleted.
+
+    Deleting the current discipleship already deletes the state through
+    the cascade, so the state only has to be recreated from the history.
+
+    Parameters
+    ----------
+    sender : type
+        The model class that triggered the signal (Discipleship).
+    instance : Discipleship
+        The instance of the Discipleship model being deleted.
+    **kwargs : dict
+        Additional keyword arguments passed by the signal.
+    """
+    if DiscipleshipState.objects.filter(
+        disciple_id=instance.disciple_id,
+        discipler_id=instance.discipler_id,
+    ).exists():
+        return
+
+    latest = (
+        Discipleship.objects.filter(
+            disciple_id=instance.disciple_id,
+            discipler_id=instance.discipler_id,
+        )
+        .order_by("-created_at", "-pk")
+        .first()
+    )
+
+    if latest is not None:
+        DiscipleshipState.objects.create(
+            disciple_id=latest.disciple_id,
+            discipler_id=latest.discipler_id,
+            discipleship=latest,
+            group=latest.group,
+        )
@@ -0,0 +1,117 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from kns.core.tests.query_budget import QueryBudgetMixin
+from kns.custom_user.models import User
+from kns.discipleships.models import Discipleship
+from kns.groups.models import Group
+
+
+class TestGroupDiscipleshipFunnelAPI(QueryBudgetMixin, APITestCase):
+    def setUp(self):
+        """
+        Set up a parent and a child group whose leaders disciple people.
+        """
+        self.client = APIClient()
+
+        self.parent_leader = User.objects.create_user(
+            email="parentleader@example.com",
+            password="password123",
+        ).profile
+        self.child_leader = User.objects.create_user(
+            email="childleader@example.com",
+            password="password123",
+        ).profile
+
+        self.parent_group = Group.objects.create(
+            leader=self.parent_leader,
+            name="Parent Group",
+            description="This is the parent group.",
+        )
+        self.child_group = Group.objects.create(
+            leader=self.child_leader,
+            name="Child Group",
+            description="This is a child group.",
+            parent=self.parent_group,
+        )
+
+        for number, (leader, stages) in enumerate(
+            [
+                (self.parent_leader, ["group_member", "first_12"]),
+                (self.parent_leader, ["group_member"]),
+                (self.child_leader, ["group_member", "first_12", "first_3"]),
+            ]
+        ):
+            disciple = User.objects.create_user(
+                email=f"disciple{number}@example.com",
+                password="password123",
+            ).profile
+
+            for stage in stages:
+                Discipleship.objects.create(
+                    disciple=disciple,
+                    discipler=leader,
+                    author=leader,
+                    group=stage,
+                )
+
+    def test_group_discipleship_funnel_over_the_subtree(self):
+        """
+        The funnel counts the current stage of the disciples of every
+        leader in the subtree in a fixed number of queries.
+        """
+        url = reverse(
+            "api:group_discipleship_funnel",
+            kwargs={
+                "pk": self.parent_group.pk,
+            },
+        )
+
+        with self.assertQueryBudget(2):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data,
+            {
+                "group": self.parent_group.pk,
+                "group_member": 1,
+                "first_12": 1,
+                "first_3": 1,
+                "sent_forth": 0,
+                "total": 3,
+            },
+        )
+
+    def test_group_discipleship_funnel_excludes_ancestors(self):
+        """
+        Disciples of the leaders of ancestor groups are not counted.
+        """
+        url = reverse(
+            "api:group_discipleship_funnel",
+            kwargs={
+                "pk": self.child_group.pk,
+            },
+        )
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.data["first_3"], 1)
+        self.assertEqual(response.data["total"], 1)
+
+    def test_group_discipleship_funnel_invalid_group(self):
+        """
+        Test retrieving the funnel of a group that does not exist.
+        """
+        url = reverse(
+            "api:group_discipleship_funnel",
+            kwargs={
+                "pk": 9999,
+            },
+        )
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data["detail"], "Group not found.")
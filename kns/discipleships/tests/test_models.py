@@ -1,10 +1,13 @@
 from datetime import timedelta
+from io import StringIO
 
+from django.core.management import call_command
 from django.test import TestCase
 from django.utils import timezone
 
 from kns.custom_user.models import User
-from kns.discipleships.models import Discipleship
+from kns.discipleships.models import Discipleship, DiscipleshipState
+from kns.groups.models import Group
 from kns.profiles.models import Profile  # Assuming you have a Profile model
 
 
@@ -117,3 +120,271 @@ class TestDiscipleshipMethods(TestCase):
             self.discipleship.total_running_time(),
             "1 week",
         )
+
+
+class TestDiscipleshipQuerySet(TestCase):
+    def setUp(self):
+        self.discipler = User.objects.create_user(
+            email="discipler@example.com",
+            password="password123",
+        ).profile
+        self.other_discipler = User.objects.create_user(
+            email="otherdiscipler@example.com",
+            password="password123",
+        ).profile
+        self.disciple = User.objects.create_user(
+            email="disciple@example.com",
+            password="password123",
+        ).profile
+        self.disciple2 = User.objects.create_user(
+            email="disciple2@example.com",
+            password="password123",
+        ).profile
+
+    def test_current_keeps_the_latest_stage_of_every_disciple(self):
+        Discipleship.objects.create(
+            disciple=self.disciple,
+            discipler=self.discipler,
+            author=self.discipler,
+            group="group_member",
+        )
+        latest = Discipleship.objects.create(
+            disciple=self.disciple,
+            discipler=self.discipler,
+            author=self.discipler,
+            group="first_12",
+        )
+        other = Discipleship.objects.create(
+            disciple=self.disciple2,
+            discipler=self.discipler,
+            author=self.discipler,
+            group="group_member",
+        )
+
+        current = Discipleship.objects.filter(discipler=self.discipler).current()
+
+        self.assertCountEqual(current, [latest, other])
+
+    def test_current_is_scoped_to_the_filtered_discipleships(self):
+        own = Discipleship.objects.create(
+            disciple=self.disciple,
+            discipler=self.discipler,
+            author=self.discipler,
+            group="first_3",
+        )
+        Discipleship.objects.create(
+            disciple=self.disciple,
+            discipler=self.other_discipler,
+            author=self.other_discipler,
+            group="group_member",
+        )
+
+        current = Discipleship.objects.filter(discipler=self.discipler).current()
+
+        self.assertEqual(list(current), [own])
+
+
+class TestDiscipleshipState(TestCase):
+    def setUp(self):
+        self.discipler = User.objects.create_user(
+            email="discipler@example.com",
+            password="password123",
+        ).profile
+        self.disciple = User.objects.create_user(
+            email="disciple@example.com",
+            password="password123",
+        ).profile
+
+        self.discipleship = Discipleship.objects.create(
+            disciple=self.disciple,
+            discipler=self.discipler,
+            author=self.discipler,
+            group="group_member",
+        )
+
+    def get_state(self):
+        return DiscipleshipState.objects.get(
+            disciple=self.disciple,
+            discipler=self.discipler,
+        )
+
+    def test_str_representation(self):
+        self.assertEqual(
+            str(self.get_state()),
+            f"{self.disciple} is group_member of {self.discipler}",
+        )
+
+    def test_state_is_created_with_the_discipleship(self):
+        state = self.get_state()
+
+        self.assertEqual(state.discipleship, self.discipleship)
+        self.assertEqual(state.group, "group_member")
+
+    def test_state_follows_the_latest_discipleship(self):
+        latest = Discipleship.objects.create(
+            disciple=self.disciple,
+            discipler=self.discipler,
+            author=self.discipler,
+            group="first_12",
+        )
+
+        state = self.get_state()
+
+        self.assertEqual(DiscipleshipState.objects.count(), 1)
+        self.assertEqual(state.discipleship, latest)
+        self.assertEqual(state.group, "first_12")
+
+    def test_state_follows_an_edited_current_discipleship(self):
+        self.discipleship.group = "first_3"
+        self.discipleship.save()
+
+        self.assertEqual(self.get_state().group, "first_3")
+
+    def test_state_is_restored_when_the_current_discipleship_is_deleted(self):
+        latest = Discipleship.objects.create(
+            disciple=self.disciple,
+            discipler=self.discipler,
+            author=self.discipler,
+            group="first_12",
+        )
+
+        latest.delete()
+
+        state = self.get_state()
+
+        self.assertEqual(state.discipleship, self.discipleship)
+        self.assertEqual(state.group, "group_member")
+
+    def test_state_is_kept_when_an_older_discipleship_is_deleted(self):
+        latest = Discipleship.objects.create(
+            disciple=self.disciple,
+            discipler=self.discipler,
+            author=self.discipler,
+            group="first_12",
+        )
+
+        self.discipleship.delete()
+
+        self.assertEqual(self.get_state().discipleship, latest)
+
+    def test_state_is_deleted_with_the_last_discipleship(self):
+        self.discipleship.delete()
+
+        self.assertFalse(DiscipleshipState.objects.exists())
+
+    def test_rebuild_discipleship_states_command(self):
+        latest = Discipleship.objects.create(
+            disciple=self.disciple,
+            discipler=self.discipler,
+            author=self.discipler,
+            group="first_3",
+        )
+        DiscipleshipState.objects.all().delete()
+
+        out = StringIO()
+        call_command("rebuild_discipleship_states", stdout=out)
+
+        self.assertIn("Discipleship states rebuilt for 1 pairs.", out.getvalue())
+        self.assertEqual(self.get_state().discipleship, latest)
+
+    def test_funnel_over_a_group_subtree(self):
+        parent_group = Group.objects.create(
+            leader=self.discipler,
+            name="Parent Group",
+            description="This is the parent group.",
+        )
+        child_leader = User.objects.create_user(
+            email="childleader@example.com",
+            password="password123",
+        ).profile
+        Group.objects.create(
+            leader=child_leader,
+            name="Child Group",
+            description="This is a child group.",
+            parent=parent_group,
+        )
+        Discipleship.objects.create(
+            disciple=User.objects.create_user(
+                email="childdisciple@example.com",
+                password="password123",
+            ).profile,
+            discipler=child_leader,
+            author=child_leader,
+            group="sent_forth",
+        )
+
+        with self.assertNumQueries(1):
+            funnel = DiscipleshipState.objects.in_group_subtree(parent_group).funnel()
+
+        self.assertEqual(
+            funnel,
+            {
+                "group_member": 1,
+                "first_12": 0,
+                "first_3": 0,
+                "sent_forth": 1,
+                "total": 2,
+            },
+        )
+
+
+class TestDiscipleshipRunningTimes(TestCase):
+    def setUp(self):
+        self.discipler = User.objects.create_user(
+            email="discipler@example.com",
+            password="password123",
+        ).profile
+        self.disciple = User.objects.create_user(
+            email="disciple@example.com",
+            password="password123",
+        ).profile
+
+        self.first = Discipleship.objects.create(
+            disciple=self.disciple,
+            discipler=self.discipler,
+            author=self.discipler,
+            group="group_member",
+        )
+        Discipleship.objects.filter(pk=self.first.pk).update(
+            created_at=timezone.now() - timedelta(days=60),
+        )
+
+        self.sent_forth = Discipleship.objects.create(
+            disciple=self.disciple,
+            discipler=self.discipler,
+            author=self.discipler,
+            group="sent_forth",
+        )
+        Discipleship.objects.filter(pk=self.sent_forth.pk).update(
+            created_at=timezone.now() - timedelta(days=25),
+        )
+
+    def test_with_running_times_annotates_the_pair_dates(self):
+        discipleship = Discipleship.objects.with_running_times().get(
+            pk=self.sent_forth.pk,
+        )
+        self.first.refresh_from_db()
+        self.sent_forth.refresh_from_db()
+
+        self.assertEqual(discipleship.first_started_at, self.first.created_at)
+        self.assertEqual(discipleship.sent_forth_at, self.sent_forth.created_at)
+
+    def test_total_running_time_uses_the_annotations(self):
+        discipleships = list(
+            Discipleship.objects.with_running_times().order_by("created_at")
+        )
+
+        with self.assertNumQueries(0):
+            running_times = [
+                discipleship.total_running_time() for discipleship in discipleships
+            ]
+
+        self.assertEqual(running_times, ["1 month"] * 2)
+
+    def test_total_running_time_matches_without_the_annotations(self):
+        self.assertEqual(
+            Discipleship.objects.get(pk=self.first.pk).total_running_time(),
+            Discipleship.objects.with_running_times()
+            .get(pk=self.first.pk)
+            .total_running_time(),
+        )
@@ -1,8 +1,11 @@
 from django.contrib.messages import get_messages
+from django.db import connection
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
+from kns.core.tests.query_budget import QueryBudgetMixin
 from kns.custom_user.models import User
 from kns.discipleships.models import Discipleship
 from kns.groups.models import Group
@@ -227,6 +230,98 @@ class TestIndexView(TestCase):
         paginator = response.context["page_obj"].paginator
         self.assertEqual(paginator.num_pages, 3)
 
+    def test_index_view_cursor_pagination(self):
+        """
+        Test that the previous and next links use cursors, keep the filters
+        and give the same pages as the page numbers.
+        """
+        for i in range(8):
+            user = User.objects.create_user(
+                email=f"testuser{i}@example.com",
+                password="testpassword",
+            )
+            self.group.add_member(user.profile)
+
+            Discipleship.objects.create(
+                disciple=user.profile,
+                discipler=self.profile,
+                group="group_member",
+                author=self.profile,
+            )
+
+        url = reverse("discipleships:index")
+        params = {"filter_status": "ongoing"}
+        response = self.client.get(url, params)
+        cursor = response.context["page_obj"].next_cursor
+
+        self.assertContains(response, f"?filter_status=ongoing&amp;cursor={cursor}")
+
+        response = self.client.get(url, {**params, "cursor": cursor})
+        page_obj = response.context["page_obj"]
+
+        self.assertEqual(page_obj.number, 2)
+        self.assertEqual(
+            list(page_obj),
+            list(self.client.get(url, {**params, "page": 2}).context["page_obj"]),
+        )
+        self.assertIsNone(page_obj.next_cursor)
+        self.assertContains(response, "?filter_status=ongoing&amp;page=1")
+
+
+class TestIndexViewQueryBudget(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        """
+        Set up a leader discipling the members of their group.
+        """
+        self.user = User.objects.create_user(
+            email="leader@example.com",
+            password="password123",
+        )
+        self.profile = self.user.profile
+        self.profile.is_onboarded = True
+        self.profile.save()
+
+        self.group = Group.objects.create(
+            leader=self.profile,
+            name="Test Group",
+            description="A test group",
+        )
+
+        for number in range(5):
+            member = User.objects.create_user(
+                email=f"member{number}@example.com",
+                password="password123",
+            ).profile
+
+            self.group.add_member(member)
+
+            Discipleship.objects.create(
+                disciple=member,
+                discipler=self.profile,
+                group="group_member",
+                author=self.profile,
+            )
+
+        self.client.login(
+            email="leader@example.com",
+            password="password123",
+        )
+
+    def test_index_query_budget(self):
+        """
+        The number of queries does not depend on the number of
+        discipleships listed.
+        """
+        url = reverse("discipleships:index")
+
+        # Warm the session and the per-request caches first
+        self.client.get(url)
+
+        with self.assertQueryBudget(9):
+            response = self.client.get(url)
+
+        self.assertEqual(len(response.context["page_obj"]), 5)
+
 
 class TestProfileDiscipleshipsView(TestCase):
     def setUp(self):
@@ -449,6 +544,37 @@ class TestProfileDiscipleshipsView(TestCase):
 
         self.assertEqual(len(messages_list), 0)
 
+    def test_profile_discipleships_view_groups_disciples_by_current_stage(self):
+        """
+        Test that every disciple is only listed under the stage they
+        are currently at.
+        """
+        Discipleship.objects.create(
+            disciple=self.other_profile,
+            discipler=self.profile,
+            group="group_member",
+            author=self.profile,
+        )
+        current = Discipleship.objects.create(
+            disciple=self.other_profile,
+            discipler=self.profile,
+            group="first_12",
+            author=self.profile,
+        )
+
+        url = reverse(
+            "discipleships:profile_discipleships",
+            kwargs={
+                "profile_slug": self.profile.slug,
+            },
+        )
+        response = self.client.get(url)
+
+        self.assertEqual(response.context["group_member_discipleships"], [])
+        self.assertEqual(response.context["first_12_discipleships"], [current])
+        self.assertEqual(response.context["first_3_discipleships"], [])
+        self.assertEqual(response.context["sent_forth_discipleships"], [])
+
 
 class TestMoveDiscipleshipViews(TestCase):
     def setUp(self):
@@ -756,3 +882,32 @@ class TestDiscipleshipHistoryView(TestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 404)
+
+    def test_discipleship_history_query_count_independent_of_history_length(self):
+        """
+        Test that the number of queries does not grow with the history
+        of the discipleship.
+        """
+        url = reverse(
+            "discipleships:discipleship_history",
+            kwargs={"discipleship_slug": self.discipleship.slug},
+        )
+
+        # Warm the session and the per-request caches first
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as short_history:
+            self.client.get(url)
+
+        for group in ["first_3", "sent_forth"]:
+            Discipleship.objects.create(
+                disciple=self.other_profile,
+                discipler=self.profile,
+                author=self.profile,
+                group=group,
+            )
+
+        with self.assertNumQueries(len(short_history)):
+            response = self.client.get(url)
+
+        self.assertEqual(len(response.context["discipleships"]), 4)
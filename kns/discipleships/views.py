@@ -4,13 +4,15 @@ Views for the `discipleships` app.
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
-from django.db.models import Max, Q
+from django.db.models import Q
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils import timezone
 
+from kns.core.pagination import get_directory_page
+from kns.discipleships.constants import DISCIPLESHIP_GROUP_CHOICES
 from kns.discipleships.forms import GroupMemberDiscipleForm
 from kns.discipleships.models import Discipleship
+from kns.profiles.search import get_name_search_filter
 
 from .forms import DiscipleshipFilterForm
 from .models import Profile
@@ -41,8 +43,11 @@ def index(request):
     filter_status = request.GET.get("filter_status", "")
     search_query = request.GET.get("search", "")
 
-    # Query all discipleships
-    discipleships = Discipleship.objects.all()
+    # Query all discipleships along with the profiles shown for each
+    discipleships = Discipleship.objects.select_related(
+        "disciple__encryption",
+        "discipler__encryption",
+    )
 
     if not request.user.is_visitor:
         # Get the current user's group
@@ -73,10 +78,8 @@ def index(request):
     # Apply search filter
     if search_query:
         discipleships = discipleships.filter(
-            Q(disciple__first_name__icontains=search_query)
-            | Q(disciple__last_name__icontains=search_query)
-            | Q(discipler__first_name__icontains=search_query)
-            | Q(discipler__last_name__icontains=search_query)
+            get_name_search_filter(search_query, prefix="disciple__")
+            | get_name_search_filter(search_query, prefix="discipler__")
         )
 
     # Apply group filtering (supporting multiple groups)
@@ -94,16 +97,8 @@ def index(request):
                 completed_at__isnull=False,
             )
 
-    # Pagination
-    paginator = Paginator(discipleships, 6)  # Show 12 discipleships per page
-    page = request.GET.get("page")
-
-    try:
-        page_obj = paginator.page(page)
-    except PageNotAnInteger:
-        page_obj = paginator.page(1)
-    except EmptyPage:  # pragma: no cover
-        page_obj = paginator.page(paginator.num_pages)
+    # Pagination, by cursor for the previous and next pages
+    page_obj = get_directory_page(request, discipleships, 6, ["-created_at"])
 
     # Update the context with the paginated results
     context = {
@@ -144,43 +139,19 @@ def profile_discipleships(request, profile_slug):
     """
     profile = get_object_or_404(Profile, slug=profile_slug)
 
-    # Get the latest created_at for each disciple
-    latest_created_at_for_disciples = Discipleship.objects.values(
-        "disciple",
-    ).annotate(
-        latest_created_at=Max(
-            "created_at",
-        )
-    )
+    # Get the current stage of every disciple of the profile, skipping
+    # discipleships stored with an unknown stage
+    current_discipleships = {group: [] for group, _ in DISCIPLESHIP_GROUP_CHOICES}
 
-    group_member_discipleships = Discipleship.objects.filter(
-        discipler=profile,
-        group="group_member",
-        created_at__in=[
-            entry["latest_created_at"] for entry in latest_created_at_for_disciples
-        ],
-    )
-    first_12_discipleships = Discipleship.objects.filter(
-        discipler=profile,
-        group="first_12",
-        created_at__in=[
-            entry["latest_created_at"] for entry in latest_created_at_for_disciples
-        ],
-    )
-    first_3_discipleships = Discipleship.objects.filter(
-        discipler=profile,
-        group="first_3",
-        created_at__in=[
-            entry["latest_created_at"] for entry in latest_created_at_for_disciples
-        ],
-    )
-    sent_forth_discipleships = Discipleship.objects.filter(
-        discipler=profile,
-        group="sent_forth",
-        created_at__in=[
-            entry["latest_created_at"] for entry in latest_created_at_for_disciples
-        ],
-    )
+    for discipleship in (
+        Discipleship.objects.filter(discipler=profile)
+        .current()
+        .select_related("disciple__encryption", "discipler__encryption")
+    ):
+        stage_discipleships = current_discipleships.get(discipleship.group)
+
+        if stage_discipleships is not None:
+            stage_discipleships.append(discipleship)
 
     group_member_discipleship_form = GroupMemberDiscipleForm(
         request.POST,
@@ -221,10 +192,10 @@ def profile_discipleships(request, profile_slug):
                 )
 
     context = {
-        "group_member_discipleships": group_member_discipleships,
-        "first_12_discipleships": first_12_discipleships,
-        "first_3_discipleships": first_3_discipleships,
-        "sent_forth_discipleships": sent_forth_discipleships,
+        "group_member_discipleships": current_discipleships["group_member"],
+        "first_12_discipleships": current_discipleships["first_12"],
+        "first_3_discipleships": current_discipleships["first_3"],
+        "sent_forth_discipleships": current_discipleships["sent_forth"],
         "group_member_discipleship_form": group_member_discipleship_form,
     }
 
@@ -324,13 +295,20 @@ def discipleship_history(request, discipleship_slug):
         If no Discipleship with the given slug exists.
     """
     discipleship = get_object_or_404(
-        Discipleship,
+        Discipleship.objects.select_related(
+            "disciple__encryption",
+            "discipler__encryption",
+        ),
         slug=discipleship_slug,
     )
 
-    discipleships = Discipleship.objects.filter(
-        disciple=discipleship.disciple, discipler=discipleship.discipler
-    ).order_by("created_at")
+    discipleships = (
+        Discipleship.objects.filter(
+            disciple=discipleship.disciple, discipler=discipleship.discipler
+        )
+        .select_related("disciple__encryption")
+        .order_by("created_at")
+    )
 
     context = {
         "discipleship": discipleship,
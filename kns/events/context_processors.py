@@ -42,7 +42,7 @@ def event_context(request):
             event = get_object_or_404(Event, slug=event_slug)
 
             if request.user and request.user.is_authenticated:
-                can_edit_event = event.can_edit_event(request.user.profile)
+                can_edit_event = event.can_edit_event(request.viewer.profile)
         except Http404:
             # If the event is not found, event will remain None
             event = None
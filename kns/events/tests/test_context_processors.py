@@ -5,6 +5,7 @@ from django.test import RequestFactory, TestCase
 from kns.custom_user.models import User
 from kns.events.context_processors import event_context
 from kns.events.models import Event
+from kns.profiles.viewer import Viewer
 
 
 class TestEventContextProcessor(TestCase):
@@ -43,6 +44,7 @@ class TestEventContextProcessor(TestCase):
             },
         )
         request.user = self.user
+        request.viewer = Viewer.for_user(request.user)
 
         context = event_context(request)
 
@@ -60,6 +62,7 @@ class TestEventContextProcessor(TestCase):
             },
         )
         request.user = MagicMock(is_authenticated=False)
+        request.viewer = Viewer.for_user(request.user)
 
         context = event_context(request)
 
@@ -77,6 +80,7 @@ class TestEventContextProcessor(TestCase):
             },
         )
         request.user = self.user
+        request.viewer = Viewer.for_user(request.user)
 
         with patch(
             "kns.events.models.Event.can_edit_event",
@@ -104,6 +108,7 @@ class TestEventContextProcessor(TestCase):
             },
         )
         request.user = another_user
+        request.viewer = Viewer.for_user(request.user)
 
         with patch(
             "kns.events.models.Event.can_edit_event",
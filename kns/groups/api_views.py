@@ -5,10 +5,30 @@ data.
 
 from rest_framework import status
 from rest_framework.decorators import api_view
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 
 from .models import Group
-from .serializers import GroupSerializer
+from .serializers import (
+    GroupTreeNodeSerializer,
+    get_subtree_nodes,
+    serialize_group_nodes,
+    serialize_group_tree,
+)
+
+
+class GroupTreeCursorPagination(CursorPagination):
+    """
+    Cursor pagination over the nodes of a group subtree.
+
+    Nodes are paged in tree order using their MPTT `lft` value, which is
+    unique within a tree, so every page costs the same to fetch.
+    """
+
+    ordering = "lft"
+    page_size = 50
+    page_size_query_param = "limit"
+    max_page_size = 500
 
 
 @api_view(["GET"])
@@ -16,6 +36,15 @@ def group_descendants(request, pk):
     """
     Retrieve a group and its descendants based on the provided group ID (pk).
 
+    The following query parameters are supported:
+
+    - `max_depth`: the number of levels below the group to include.
+    - `fields`: a comma-separated list of node fields to include. `id`
+      and `children` are always included.
+    - `limit` / `cursor`: return the subtree as a flat, cursor-paginated
+      list of nodes in tree order instead of a nested tree. Each node
+      carries its `parent` id and `level`.
+
     Parameters
     ----------
     request : HttpRequest
@@ -27,7 +56,9 @@ def group_descendants(request, pk):
     -------
     Response
         A JSON response containing the serialized group data if found,
-        or an error message with a 404 status if the group does not exist.
+        an error message with a 400 status if a query parameter is
+        invalid, or an error message with a 404 status if the group does
+        not exist.
     """
     try:
         group = Group.objects.get(pk=pk)
@@ -39,6 +70,48 @@ def group_descendants(request, pk):
             status=status.HTTP_404_NOT_FOUND,
         )
 
+    max_depth = request.query_params.get("max_depth")
+    if max_depth is not None:
+        if not (max_depth.isascii() and max_depth.isdecimal()):
+            return Response(
+                {
+                    "detail": "max_depth must be a non-negative integer.",
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        max_depth = int(max_depth)
+
+    fields = request.query_params.get("fields")
+    if fields is not None:
+        fields = [field.strip() for field in fields.split(",") if field.strip()]
+        invalid_fields = set(fields) - set(GroupTreeNodeSerializer.Meta.fields)
+
+        if invalid_fields:
+            return Response(
+                {
+                    "detail": f"Invalid fields: {', '.join(sorted(invalid_fields))}.",
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+    # Flat, paginated mode for lazily loading large trees
+    if "limit" in request.query_params or "cursor" in request.query_params:
+        paginator = GroupTreeCursorPagination()
+        page = paginator.paginate_queryset(
+            get_subtree_nodes(group, max_depth=max_depth),
+            request,
+        )
+
+        return paginator.get_paginated_response(
+            serialize_group_nodes(page, fields=fields),
+        )
+
     # Serialize the group and its descendants
-    serializer = GroupSerializer(group)
-    return Response(serializer.data)
+    return Response(
+        serialize_group_tree(
+            group,
+            max_depth=max_depth,
+            fields=fields,
+        )
+    )
@@ -4,3 +4,8 @@ Constant definitions for the `groups` app.
 
 GROUP_DESCRIPTION_MIN_LENGTH = 100
 GROUP_DESCRIPTION_MAX_LENGTH = 500
+
+# Subtree roll-ups are invalidated on membership and tree changes, the
+# timeout only bounds staleness from profile edits (role, gender, ...).
+SUBTREE_STATS_CACHE_NAMESPACE = "groups_subtree_stats"
+SUBTREE_STATS_CACHE_TIMEOUT = 60 * 15
@@ -26,12 +26,15 @@ def group_context(request):
     -------
     group : Group
         Group instance.
+    is_group_leader : bool
+        Whether the group is led by the viewer of the page.
     group_form : Form
         Form for editing group.
     """
 
     group = None
     descendants = None
+    is_group_leader = False
     group_slug = (
         request.resolver_match.kwargs.get("group_slug")
         if request.resolver_match
@@ -39,8 +42,21 @@ def group_context(request):
     )
     if group_slug:
         try:
-            group = get_object_or_404(Group, slug=group_slug)
-            descendants = group.get_descendants(include_self=True)
+            group = get_object_or_404(
+                Group.objects.with_member_stats(),
+                slug=group_slug,
+            )
+            descendants = (
+                group.get_descendants(
+                    include_self=True,
+                )
+                .with_member_stats()
+                .select_related("leader__encryption")
+            )
+            is_group_leader = (
+                request.viewer.group_led is not None
+                and request.viewer.group_led.pk == group.pk
+            )
         except Http404:
             # Handle not found case if needed
             group = None
@@ -48,5 +64,6 @@ def group_context(request):
     return {
         "group": group,
         "descendants": descendants,
+        "is_group_leader": is_group_leader,
         "group_settings_form": (GroupForm(instance=group) if group else None),
     }
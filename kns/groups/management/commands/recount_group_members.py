@@ -0,0 +1,42 @@
+"""
+Django management command to rebuild the stored member counts of groups.
+
+The `member_count` column on `Group` is maintained by signals on
+`GroupMember`. This command recomputes it from the membership rows, for
+example after a bulk import or a manual database change.
+
+Usage:
+    python manage.py recount_group_members
+"""
+
+from django.core.management.base import BaseCommand
+
+from kns.groups.models import Group
+
+
+class Command(BaseCommand):
+    """
+    Django management command that recomputes the stored member count
+    of every group from its `GroupMember` rows.
+    """
+
+    help = "Rebuilds the stored member count of every group."
+
+    def handle(self, *args, **options):
+        """
+        Recount the members of every group in a single UPDATE.
+
+        Parameters
+        ----------
+        *args
+            Positional arguments passed to the command (not used in this
+            method).
+        **options
+            Keyword arguments passed to the command (not used in this
+            method).
+        """
+        updated = Group.objects.recount_members()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Member counts rebuilt for {updated} groups."),
+        )
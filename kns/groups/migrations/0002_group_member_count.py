@@ -0,0 +1,40 @@
+# Generated by Django 5.1 on 2026-10-16 19:20
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_member_count(apps, schema_editor):
+    Group = apps.get_model("groups", "Group")
+    GroupMember = apps.get_model("groups", "GroupMember")
+
+    member_counts = (
+        GroupMember.objects.filter(group=OuterRef("pk"))
+        .values("group")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+
+    Group.objects.update(
+        member_count=Coalesce(Subquery(member_counts), 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("groups", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="group",
+            name="member_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(
+            populate_member_count,
+            migrations.RunPython.noop,
+        ),
+    ]
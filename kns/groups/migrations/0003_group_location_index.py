@@ -0,0 +1,20 @@
+# Generated by Django 5.1 on 2026-10-16 21:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("groups", "0002_group_member_count"),
+        ("profiles", "0011_profile_directory_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="group",
+            index=models.Index(
+                fields=["location_country", "location_city"], name="group_location_idx"
+            ),
+        ),
+    ]
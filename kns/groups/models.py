@@ -9,17 +9,152 @@ from uuid import uuid4
 from cloudinary.models import CloudinaryField
 from django.core.validators import MaxLengthValidator, MinLengthValidator
 from django.db import models
-from django.db.models.signals import post_save
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.urls import reverse
+from mptt.managers import TreeManager
 from mptt.models import MPTTModel, TreeForeignKey
+from mptt.querysets import TreeQuerySet
+from mptt.signals import node_moved
 
+from kns.core import cache
 from kns.core.modelmixins import ModelWithLocation, TimestampedModel
 from kns.onboarding.models import ProfileCompletionTask
 from kns.profiles.models import Profile
 
 from . import constants
 
+# Lookups on `GroupMember` for every per-group member statistic. An
+# empty lookup counts every member of the group.
+MEMBER_STATS_LOOKUPS = {
+    "members_total": {},
+    "leaders": {"profile__role": "leader"},
+    "members": {"profile__role": "member"},
+    "external_persons": {"profile__role": "external_person"},
+    "males": {"profile__gender": "male"},
+    "females": {"profile__gender": "female"},
+    "mentors": {"profile__is_mentor": True},
+    "skill_trainers": {"profile__is_skill_training_facilitator": True},
+    "movement_trainers": {"profile__is_movement_training_facilitator": True},
+}
+
+MEMBER_STATS_ANNOTATION_PREFIX = "stats_"
+
+
+def member_stats_aggregates(prefix=""):
+    """
+    Build the conditional `Count` expressions for every member statistic.
+
+    Parameters
+    ----------
+    prefix : str, optional
+        The lookup path from the queried model to `GroupMember`, e.g.
+        `"members__"` when aggregating from `Group`. Defaults to an
+        empty string for queries made directly on `GroupMember`.
+
+    Returns
+    -------
+    dict
+        A mapping of statistic name to `Count` expression.
+    """
+    aggregates = {}
+
+    for key, lookups in MEMBER_STATS_LOOKUPS.items():
+        member_filter = None
+
+        if lookups:
+            member_filter = Q(
+                **{f"{prefix}{lookup}": value for lookup, value in lookups.items()}
+            )
+
+        aggregates[key] = Count(f"{prefix}id", filter=member_filter)
+
+    return aggregates
+
+
+def subtree_stats_version(tree_id):
+    """
+    Return the current cache version of the subtree roll-ups of a tree.
+
+    Parameters
+    ----------
+    tree_id : int
+        The MPTT tree id of the groups.
+
+    Returns
+    -------
+    str
+        The version that subtree roll-up cache keys of the tree must use.
+    """
+    return cache.get_version(constants.SUBTREE_STATS_CACHE_NAMESPACE, tree_id)
+
+
+def invalidate_subtree_stats(tree_id):
+    """
+    Invalidate every cached subtree roll-up of a tree.
+
+    Parameters
+    ----------
+    tree_id : int
+        The MPTT tree id of the groups.
+    """
+    cache.bump_version(constants.SUBTREE_STATS_CACHE_NAMESPACE, tree_id)
+
+
+class GroupQuerySet(TreeQuerySet):
+    """
+    Custom queryset for the Group model.
+    """
+
+    def with_member_stats(self):
+        """
+        Annotate every group with its member statistics.
+
+        All role, gender and facilitator counts are computed in the same
+        query using conditional aggregation. `Group.stats()` and the
+        `*_count()` methods read these annotations instead of querying
+        the database again.
+
+        Returns
+        -------
+        GroupQuerySet
+            The queryset annotated with `stats_<name>` counts.
+        """
+        return self.annotate(
+            **{
+                f"{MEMBER_STATS_ANNOTATION_PREFIX}{key}": aggregate
+                for key, aggregate in member_stats_aggregates("members__").items()
+            }
+        )
+
+    def recount_members(self):
+        """
+        Rebuild the stored `member_count` of every group in the queryset.
+
+        The counts are recomputed from the `GroupMember` rows with a
+        single UPDATE using a correlated subquery.
+
+        Returns
+        -------
+        int
+            The number of groups updated.
+        """
+        member_counts = (
+            GroupMember.objects.filter(group=OuterRef("pk"))
+            .values("group")
+            .annotate(total=Count("id"))
+            .values("total")
+        )
+
+        return self.update(
+            member_count=Coalesce(Subquery(member_counts), 0),
+        )
+
+
+GroupManager = TreeManager.from_queryset(GroupQuerySet)
+
 
 class Group(TimestampedModel, ModelWithLocation, MPTTModel):
     """
@@ -32,6 +167,8 @@ class Group(TimestampedModel, ModelWithLocation, MPTTModel):
         leader (Profile): The profile of the group's leader.
         parent (Group): A reference to a parent group.
         image (CloudinaryField): An optional group image.
+        member_count (int): The stored number of members in the group,
+            maintained by the `GroupMember` signals.
     """
 
     class MPTTMeta:
@@ -49,6 +186,12 @@ class Group(TimestampedModel, ModelWithLocation, MPTTModel):
         verbose_name = "Group"
         verbose_name_plural = "Groups"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["location_country", "location_city"],
+                name="group_location_idx",
+            ),
+        ]
 
     name = models.CharField(max_length=50)
 
@@ -87,6 +230,13 @@ class Group(TimestampedModel, ModelWithLocation, MPTTModel):
         folder="kns/images/groups/",
     )
 
+    member_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+    )
+
+    objects = GroupManager()
+
     def __str__(self) -> str:
         """
         Return the string representation of the group.
@@ -103,6 +253,60 @@ class Group(TimestampedModel, ModelWithLocation, MPTTModel):
 
         return return_str
 
+    def save(self, *args, **kwargs):
+        """
+        Save the group without overwriting its stored member count.
+
+        `member_count` is only ever changed with F-expression updates, so
+        saving an existing group leaves the column out of the UPDATE to
+        avoid writing back a stale in-memory value. When the save moves
+        the group to another tree, the subtree roll-ups of the tree it
+        left are invalidated.
+
+        Parameters
+        ----------
+        *args : tuple
+            Positional arguments passed to the parent save method.
+        **kwargs : dict
+            Keyword arguments passed to the parent save method.
+        """
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "member_count"
+            ]
+
+        old_tree_id = None if self._state.adding else self.tree_id
+
+        super().save(*args, **kwargs)
+
+        if old_tree_id is not None and old_tree_id != self.tree_id:
+            invalidate_subtree_stats(old_tree_id)
+
+    def move_to(self, target, position="first-child"):
+        """
+        Move the group and invalidate the subtree roll-ups of the tree it
+        was moved out of.
+
+        The tree it is moved into is invalidated by the `node_moved`
+        signal.
+
+        Parameters
+        ----------
+        target : Group or None
+            The group the group is moved relative to, or None to make it
+            a root group.
+        position : str, optional
+            The position relative to `target`. Defaults to
+            `"first-child"`.
+        """
+        old_tree_id = self.tree_id
+
+        super().move_to(target, position)
+
+        invalidate_subtree_stats(old_tree_id)
+
     def get_absolute_url(self):
         """
         Return the absolute URL to access a overview view of this group.
@@ -218,6 +422,11 @@ class Group(TimestampedModel, ModelWithLocation, MPTTModel):
                 profile=profile,
                 group=self,
             )
+
+            # Keep the in-memory counter in step with the signal update
+            self.member_count += 1
+            self._clear_member_stats()
+
         return profile
 
     def remove_member(self, profile):
@@ -241,10 +450,142 @@ class Group(TimestampedModel, ModelWithLocation, MPTTModel):
             )
             membership.delete()
 
+            # Keep the in-memory counter in step with the signal update
+            self.member_count = max(self.member_count - 1, 0)
+            self._clear_member_stats()
+
             return True
         except GroupMember.DoesNotExist:
             return False
 
+    def _clear_member_stats(self):
+        """
+        Forget the member statistics loaded on this instance.
+
+        Both the statistics cached by `stats()` and the annotations of
+        `Group.objects.with_member_stats()` are removed, so the next read
+        counts the current members.
+        """
+        self.__dict__.pop("_member_stats", None)
+
+        for key in MEMBER_STATS_LOOKUPS:
+            self.__dict__.pop(f"{MEMBER_STATS_ANNOTATION_PREFIX}{key}", None)
+
+    def _loaded_member_stats(self):
+        """
+        Return the member statistics already loaded on this instance.
+
+        Statistics are loaded either by `stats()` or by fetching the
+        group through `Group.objects.with_member_stats()`.
+
+        Returns
+        -------
+        dict or None
+            The loaded statistics, or None if they have not been loaded.
+        """
+        stats = getattr(self, "_member_stats", None)
+        if stats is not None:
+            return stats
+
+        annotated = {
+            key: getattr(self, f"{MEMBER_STATS_ANNOTATION_PREFIX}{key}", None)
+            for key in MEMBER_STATS_LOOKUPS
+        }
+
+        if None in annotated.values():
+            return None
+
+        self._member_stats = annotated
+        return self._member_stats
+
+    def stats(self):
+        """
+        Return every member statistic of the group.
+
+        The statistics are computed with a single aggregate query and
+        cached on the instance, unless they were already loaded through
+        `Group.objects.with_member_stats()`.
+
+        Returns
+        -------
+        dict
+            A mapping of statistic name (see `MEMBER_STATS_LOOKUPS`) to
+            its count.
+        """
+        stats = self._loaded_member_stats()
+
+        if stats is None:
+            stats = GroupMember.objects.filter(group=self).aggregate(
+                **member_stats_aggregates()
+            )
+            self._member_stats = stats
+
+        return stats
+
+    def subtree_stats(self):
+        """
+        Return the member statistics of the group and all its descendants.
+
+        The whole subtree is summed in one query using the `tree_id`,
+        `lft` and `rght` columns maintained by MPTT. The result is cached
+        until a membership in the tree changes or the tree is restructured
+        (which changes `lft`/`rght` and therefore the cache key).
+
+        Returns
+        -------
+        dict
+            A mapping of statistic name (see `MEMBER_STATS_LOOKUPS`) to
+            its count across the subtree, plus `groups`, the number of
+            groups in the subtree.
+        """
+        cache_key = (
+            constants.SUBTREE_STATS_CACHE_NAMESPACE,
+            self.tree_id,
+            subtree_stats_version(self.tree_id),
+            self.pk,
+            self.lft,
+            self.rght,
+        )
+        stats = cache.get(*cache_key)
+
+        if stats is None:
+            stats = GroupMember.objects.filter(
+                group__tree_id=self.tree_id,
+                group__lft__gte=self.lft,
+                group__lft__lte=self.rght,
+            ).aggregate(**member_stats_aggregates())
+            stats["groups"] = self.get_descendant_count() + 1
+
+            cache.set(
+                *cache_key,
+                value=stats,
+                timeout=constants.SUBTREE_STATS_CACHE_TIMEOUT,
+            )
+
+        return stats
+
+    def _member_stat(self, key):
+        """
+        Return a single member statistic of the group.
+
+        Parameters
+        ----------
+        key : str
+            The name of the statistic in `MEMBER_STATS_LOOKUPS`.
+
+        Returns
+        -------
+        int
+            The loaded statistic if available, otherwise the result of a
+            single count query.
+        """
+        stats = self._loaded_member_stats()
+
+        if stats is not None:
+            return stats[key]
+
+        return self.members.filter(**MEMBER_STATS_LOOKUPS[key]).count()
+
     def leaders_count(self):
         """
         Return the count of leaders in the group.
@@ -254,7 +595,7 @@ class Group(TimestampedModel, ModelWithLocation, MPTTModel):
         int:
             The total number of leaders in the group.
         """
-        return self.members.filter(profile__role="leader").count()
+        return self._member_stat("leaders")
 
     def total_members_count(self):
         """
@@ -266,7 +607,7 @@ class Group(TimestampedModel, ModelWithLocation, MPTTModel):
             The total number of members in the group, including the
             leader.
         """
-        return self.members.count() + 1
+        return self._member_stat("members_total") + 1
 
     def members_count(self):
         """
@@ -277,7 +618,7 @@ class Group(TimestampedModel, ModelWithLocation, MPTTModel):
         int:
             The total number of members with the role 'member'.
         """
-        return self.members.filter(profile__role="member").count()
+        return self._member_stat("members")
 
     def external_persons_count(self):
         """
@@ -288,9 +629,7 @@ class Group(TimestampedModel, ModelWithLocation, MPTTModel):
         int:
             The total number of members with the role 'external_person'.
         """
-        return self.members.filter(
-            profile__role="external_person",
-        ).count()
+        return self._member_stat("external_persons")
 
     def male_count(self):
         """
@@ -301,9 +640,7 @@ class Group(TimestampedModel, ModelWithLocation, MPTTModel):
         int:
             The total number of male members.
         """
-        return self.members.filter(
-            profile__gender="male",
-        ).count()
+        return self._member_stat("males")
 
     def female_count(self):
         """
@@ -314,7 +651,7 @@ class Group(TimestampedModel, ModelWithLocation, MPTTModel):
         int:
             The total number of female members.
         """
-        return self.members.filter(profile__gender="female").count()
+        return self._member_stat("females")
 
     def mentors_count(self):
         """
@@ -325,7 +662,7 @@ class Group(TimestampedModel, ModelWithLocation, MPTTModel):
         int:
             The total number of mentors in the group.
         """
-        return self.members.filter(profile__is_mentor=True).count()
+        return self._member_stat("mentors")
 
     def skill_trainers_count(self):
         """
@@ -336,9 +673,7 @@ class Group(TimestampedModel, ModelWithLocation, MPTTModel):
         int:
             The total number of skill trainers in the group.
         """
-        return self.members.filter(
-            profile__is_skill_training_facilitator=True,
-        ).count()
+        return self._member_stat("skill_trainers")
 
     def movement_trainers_count(self):
         """
@@ -349,9 +684,7 @@ class Group(TimestampedModel, ModelWithLocation, MPTTModel):
         int:
             The total number of movement trainers in the group.
         """
-        return self.members.filter(
-            profile__is_movement_training_facilitator=True,
-        ).count()
+        return self._member_stat("movement_trainers")
 
     def most_common_role(self):
         """
@@ -655,3 +988,125 @@ def mark_register_first_member_complete(sender, instance, created, **kwargs):
 
                 if task:
                     task.mark_complete()
+
+
+@receiver(post_save, sender=GroupMember)
+def increment_group_member_count(sender, instance, created, **kwargs):
+    """
+    Increment the stored member count of a group when a member is added.
+
+    The update is done with an F-expression so concurrent additions
+    cannot overwrite each other.
+
+    Parameters
+    ----------
+    sender : type
+        The model class that triggered the signal (GroupMember).
+    instance : GroupMember
+        The instance of the GroupMember model being saved.
+    created : bool
+        A boolean indicating if the GroupMember instance was newly created.
+    **kwargs : dict
+        Additional keyword arguments passed by the signal.
+    """
+    if created:
+        Group.objects.filter(pk=instance.group_id).update(
+            member_count=F("member_count") + 1,
+        )
+
+
+@receiver(post_delete, sender=GroupMember)
+def decrement_group_member_count(sender, instance, **kwargs):
+    """
+    Decrement the stored member count of a group when a member is removed.
+
+    Parameters
+    ----------
+    sender : type
+        The model class that triggered the signal (GroupMember).
+    instance : GroupMember
+        The instance of the GroupMember model being deleted.
+    **kwargs : dict
+        Additional keyword arguments passed by the signal.
+    """
+    Group.objects.filter(
+        pk=instance.group_id,
+        member_count__gt=0,
+    ).update(
+        member_count=F("member_count") - 1,
+    )
+
+
+@receiver(post_save, sender=GroupMember)
+@receiver(post_delete, sender=GroupMember)
+def invalidate_member_subtree_stats(sender, instance, **kwargs):
+    """
+    Invalidate the cached subtree roll-ups of a group's tree when one of
+    its memberships changes.
+
+    Parameters
+    ----------
+    sender : type
+        The model class that triggered the signal (GroupMember).
+    instance : GroupMember
+        The instance of the GroupMember model being saved or deleted.
+    **kwargs : dict
+        Additional keyword arguments passed by the signal.
+    """
+    if GroupMember.group.is_cached(instance):
+        tree_id = instance.group.tree_id
+    else:
+        tree_id = (
+            Group.objects.filter(pk=instance.group_id)
+            .values_list("tree_id", flat=True)
+            .first()
+        )
+
+    if tree_id is not None:
+        invalidate_subtree_stats(tree_id)
+
+
+@receiver(node_moved, sender=Group)
+def invalidate_moved_subtree_stats(sender, instance, **kwargs):
+    """
+    Invalidate the cached subtree roll-ups of the tree a group was moved
+    into.
+
+    The tree the group was moved out of is invalidated by `Group.save()`
+    and `Group.move_to()`, which still know its id.
+
+    Parameters
+    ----------
+    sender : type
+        The model class that triggered the signal (Group).
+    instance : Group
+        The group that was moved.
+    **kwargs : dict
+        Additional keyword arguments passed by the signal.
+    """
+    invalidate_subtree_stats(instance.tree_id)
+
+
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+def invalidate_group_subtree_stats(sender, instance, **kwargs):
+    """
+    Invalidate the cached subtree roll-ups of a tree when a group is
+    added to it or deleted from it.
+
+    Adding or deleting a group shifts the `lft`/`rght` values of the
+    other groups of the tree, which can give a group the values of an
+    earlier, cached, state of the tree.
+
+    Parameters
+    ----------
+    sender : type
+        The model class that triggered the signal (Group).
+    instance : Group
+        The group being saved or deleted.
+    **kwargs : dict
+        Additional keyword arguments passed by the signal. Only groups
+        that were `created` are handled on save.
+    """
+    if kwargs.get("created", True) and instance.tree_id is not None:
+        invalidate_subtree_stats(instance.tree_id)
@@ -1,5 +1,5 @@
 """
-This module contains the serializer for the Group model.
+This module contains the serializers for the Group model.
 """
 
 from rest_framework import serializers
@@ -16,6 +16,7 @@ class GroupSerializer(serializers.ModelSerializer):
     children = serializers.SerializerMethodField()
     leader_name = serializers.SerializerMethodField()
     member_count = serializers.SerializerMethodField()
+    descendant_count = serializers.SerializerMethodField()
     created_at = serializers.DateTimeField(format="%Y-%m-%d %H:%M:%S")
 
     class Meta:
@@ -30,6 +31,7 @@ class GroupSerializer(serializers.ModelSerializer):
             "leader_name",
             "description",
             "member_count",
+            "descendant_count",
             "location_display",
         ]
 
@@ -80,4 +82,171 @@ class GroupSerializer(serializers.ModelSerializer):
         int
             The number of members in the group.
         """
-        return obj.members.count()
+        return obj.member_count
+
+    def get_descendant_count(self, obj):
+        """
+        Retrieve the number of descendants of the group.
+
+        The count is derived from the MPTT `lft`/`rght` values, so it is
+        available without loading the descendants. Clients use it to tell
+        whether a node cut off by a depth limit has more groups below it.
+
+        Parameters
+        ----------
+        obj : Group
+            The current Group instance.
+
+        Returns
+        -------
+        int
+            The number of descendants of the group.
+        """
+        return obj.get_descendant_count()
+
+
+class GroupTreeNodeSerializer(GroupSerializer):
+    """
+    Serializer for a single node of a group tree. It produces the same
+    data as `GroupSerializer` without recursing into the children, which
+    are attached by `serialize_group_tree`.
+
+    Parameters
+    ----------
+    *args : tuple
+        Positional arguments passed to the parent serializer.
+    fields : list of str, optional
+        The subset of fields to include. Defaults to every field.
+    **kwargs : dict
+        Keyword arguments passed to the parent serializer.
+    """
+
+    children = None
+
+    class Meta(GroupSerializer.Meta):
+        fields = [field for field in GroupSerializer.Meta.fields if field != "children"]
+
+    def __init__(self, *args, fields=None, **kwargs):
+        """
+        Initialize the serializer, dropping the fields not requested.
+
+        Parameters
+        ----------
+        *args : tuple
+            Positional arguments passed to the parent serializer.
+        fields : list of str, optional
+            The subset of fields to include. Defaults to every field.
+        **kwargs : dict
+            Keyword arguments passed to the parent serializer.
+        """
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+
+
+def get_subtree_nodes(group, max_depth=None):
+    """
+    Return the queryset of a group and its descendants, ready to be
+    serialized without further queries.
+
+    Parameters
+    ----------
+    group : Group
+        The root group of the subtree.
+    max_depth : int, optional
+        The number of levels below the group to include. Defaults to the
+        whole subtree.
+
+    Returns
+    -------
+    QuerySet
+        The group and its descendants in tree order.
+    """
+    nodes = group.get_descendants(include_self=True).select_related(
+        "leader",
+        "leader__encryption",
+    )
+
+    if max_depth is not None:
+        nodes = nodes.filter(level__lte=group.level + max_depth)
+
+    return nodes
+
+
+def serialize_group_nodes(nodes, fields=None):
+    """
+    Serialize groups as a flat list of tree nodes.
+
+    Every node carries its `parent` id and `level` so that clients can
+    attach it to the tree they have already loaded.
+
+    Parameters
+    ----------
+    nodes : iterable of Group
+        The groups to serialize.
+    fields : list of str, optional
+        The subset of node fields to include. Defaults to every field.
+
+    Returns
+    -------
+    list of dict
+        The serialized groups, in the order given.
+    """
+    nodes = list(nodes)
+    serialized_nodes = GroupTreeNodeSerializer(
+        nodes,
+        many=True,
+        fields=fields,
+    ).data
+
+    for node, data in zip(nodes, serialized_nodes):
+        data["id"] = node.pk
+        data["parent"] = node.parent_id
+        data["level"] = node.level
+
+    return serialized_nodes
+
+
+def serialize_group_tree(group, max_depth=None, fields=None):
+    """
+    Serialize a group and its descendants as a nested tree.
+
+    The whole subtree is loaded with a single query and nested in memory,
+    so the number of queries does not depend on the size of the tree.
+    Without `max_depth` and `fields` the output matches
+    `GroupSerializer(group).data`.
+
+    Parameters
+    ----------
+    group : Group
+        The root group of the tree to serialize.
+    max_depth : int, optional
+        The number of levels below the group to include. Defaults to the
+        whole subtree.
+    fields : list of str, optional
+        The subset of node fields to include. Defaults to every field.
+
+    Returns
+    -------
+    dict
+        The serialized group with its descendants nested under `children`.
+    """
+    nodes = list(get_subtree_nodes(group, max_depth=max_depth))
+    serialized_nodes = {}
+
+    # Nodes come in tree order, so a parent is always serialized before
+    # its children.
+    for node, data in zip(
+        nodes,
+        GroupTreeNodeSerializer(nodes, many=True, fields=fields).data,
+    ):
+        data["id"] = node.pk
+        data["children"] = []
+        serialized_nodes[node.pk] = data
+
+        if node.pk != group.pk:
+            serialized_nodes[node.parent_id]["children"].append(data)
+
+    return serialized_nodes[group.pk]
@@ -2,12 +2,13 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
 
+from kns.core.tests.query_budget import QueryBudgetMixin
 from kns.custom_user.models import User
 from kns.groups.models import Group
 from kns.groups.serializers import GroupSerializer
 
 
-class TestGroupDescendantsAPI(APITestCase):
+class TestGroupDescendantsAPI(QueryBudgetMixin, APITestCase):
     def setUp(self):
         """
         Set up the test environment by creating users and groups.
@@ -54,6 +55,41 @@ class TestGroupDescendantsAPI(APITestCase):
             parent=self.child_group,
         )
 
+    def test_group_descendants_query_budget(self):
+        """
+        The number of queries does not depend on the size of the subtree,
+        whether it is returned nested or paginated.
+        """
+        for number in range(5):
+            leader = User.objects.create_user(
+                email=f"leader{number}@example.com",
+                password="password123",
+            ).profile
+
+            Group.objects.create(
+                leader=leader,
+                name=f"Child Group {number}",
+                description="This is a child group.",
+                parent=Group.objects.get(pk=self.child_group.pk),
+            )
+
+        url = reverse(
+            "api:group_descendants",
+            kwargs={
+                "pk": self.parent_group.pk,
+            },
+        )
+
+        with self.assertQueryBudget(2):
+            response = self.client.get(url)
+
+        self.assertEqual(len(response.data["children"][0]["children"]), 6)
+
+        with self.assertQueryBudget(2):
+            response = self.client.get(url, {"limit": 5})
+
+        self.assertEqual(len(response.data["results"]), 5)
+
     def test_group_descendants_valid_group(self):
         """
         Test retrieving a group and its descendants with a valid group ID.
@@ -214,3 +250,146 @@ class TestGroupDescendantsAPI(APITestCase):
             response.status_code,
             status.HTTP_200_OK,
         )
+
+    def test_group_descendants_query_count_independent_of_tree_size(self):
+        """
+        Test that the number of queries does not grow with the tree.
+        """
+        url = reverse(
+            "api:group_descendants",
+            kwargs={
+                "pk": self.parent_group.pk,
+            },
+        )
+
+        with self.assertNumQueries(2):
+            self.client.get(url)
+
+        for index in range(3):
+            user = User.objects.create_user(
+                email=f"extrauser{index}@example.com",
+                password="password123",
+            )
+            Group.objects.create(
+                leader=user.profile,
+                name=f"Extra Group {index}",
+                description="This is an extra group.",
+                parent=self.grandchild_group,
+            )
+
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+
+        grandchild = response.data["children"][0]["children"][0]
+        self.assertEqual(len(grandchild["children"]), 3)
+
+    def test_group_descendants_max_depth(self):
+        """
+        Test that max_depth limits the levels of the tree.
+        """
+        url = reverse(
+            "api:group_descendants",
+            kwargs={
+                "pk": self.parent_group.pk,
+            },
+        )
+
+        response = self.client.get(url, {"max_depth": 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        child = response.data["children"][0]
+        self.assertEqual(child["name"], "Child Group")
+        self.assertEqual(child["children"], [])
+        self.assertEqual(child["descendant_count"], 1)
+
+        response = self.client.get(url, {"max_depth": 0})
+        self.assertEqual(response.data["children"], [])
+
+    def test_group_descendants_invalid_max_depth(self):
+        """
+        Test that an invalid max_depth is rejected.
+        """
+        url = reverse(
+            "api:group_descendants",
+            kwargs={
+                "pk": self.parent_group.pk,
+            },
+        )
+
+        for max_depth in ["-1", "²", "١"]:
+            response = self.client.get(url, {"max_depth": max_depth})
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_group_descendants_fields(self):
+        """
+        Test that only the requested fields are returned.
+        """
+        url = reverse(
+            "api:group_descendants",
+            kwargs={
+                "pk": self.parent_group.pk,
+            },
+        )
+
+        response = self.client.get(url, {"fields": "name, member_count"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            set(response.data),
+            {"id", "name", "member_count", "children"},
+        )
+        self.assertEqual(
+            set(response.data["children"][0]),
+            {"id", "name", "member_count", "children"},
+        )
+
+    def test_group_descendants_invalid_fields(self):
+        """
+        Test that unknown fields are rejected.
+        """
+        url = reverse(
+            "api:group_descendants",
+            kwargs={
+                "pk": self.parent_group.pk,
+            },
+        )
+
+        response = self.client.get(url, {"fields": "name,password"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["detail"], "Invalid fields: password.")
+
+    def test_group_descendants_cursor_pagination(self):
+        """
+        Test that the subtree can be paged through with a cursor.
+        """
+        url = reverse(
+            "api:group_descendants",
+            kwargs={
+                "pk": self.parent_group.pk,
+            },
+        )
+
+        response = self.client.get(url, {"limit": 2, "fields": "name"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [node["name"] for node in response.data["results"]],
+            ["Parent Group", "Child Group"],
+        )
+        self.assertEqual(
+            response.data["results"][1]["parent"],
+            self.parent_group.pk,
+        )
+        self.assertEqual(response.data["results"][1]["level"], 1)
+        self.assertIsNotNone(response.data["next"])
+
+        response = self.client.get(response.data["next"])
+
+        self.assertEqual(
+            [node["name"] for node in response.data["results"]],
+            ["Grandchild Group"],
+        )
+        self.assertIsNone(response.data["next"])
@@ -4,6 +4,7 @@ from django.test import Client, TestCase
 from django.urls import reverse
 
 from kns.custom_user.models import User
+from kns.groups.models import Group, GroupMember
 from kns.groups.tests.factories import GroupFactory, GroupMemberFactory
 from kns.onboarding.models import ProfileCompletionTask
 from kns.skills.models import ProfileInterest, ProfileSkill, Skill
@@ -345,6 +346,228 @@ class TestGroupMethods(TestCase):
             1,
         )
 
+    def test_stats(self):
+        self.profile1.role = "leader"
+        self.profile1.is_mentor = True
+        self.profile1.save()
+
+        self.profile2.gender = "female"
+        self.profile2.save()
+
+        with self.assertNumQueries(1):
+            stats = self.group.stats()
+
+        self.assertEqual(stats["members_total"], 3)
+        self.assertEqual(stats["leaders"], 1)
+        self.assertEqual(stats["members"], 2)
+        self.assertEqual(stats["males"], 2)
+        self.assertEqual(stats["females"], 1)
+        self.assertEqual(stats["mentors"], 1)
+        self.assertEqual(stats["skill_trainers"], 0)
+
+    def test_counts_read_from_stats_once_loaded(self):
+        self.group.stats()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.group.total_members_count(), 4)
+            self.assertEqual(self.group.members_count(), 3)
+            self.assertEqual(self.group.leaders_count(), 0)
+
+    def test_with_member_stats(self):
+        self.profile2.is_skill_training_facilitator = True
+        self.profile2.save()
+
+        with self.assertNumQueries(1):
+            groups = {group.pk: group for group in Group.objects.with_member_stats()}
+            group = groups[self.group.pk]
+            child_group = groups[self.child_group_same_city.pk]
+
+            self.assertEqual(group.total_members_count(), 4)
+            self.assertEqual(group.male_count(), 3)
+            self.assertEqual(group.skill_trainers_count(), 1)
+            self.assertEqual(child_group.total_members_count(), 1)
+            self.assertEqual(child_group.stats()["members_total"], 0)
+
+    def test_counts_updated_after_membership_change(self):
+        self.assertEqual(self.group.total_members_count(), 4)
+        self.group.stats()
+
+        self.group.add_member(self.profile4)
+        self.assertEqual(self.group.total_members_count(), 5)
+        self.assertEqual(self.group.stats()["members_total"], 4)
+
+        self.group.remove_member(self.profile4)
+        self.assertEqual(self.group.total_members_count(), 4)
+
+        group = Group.objects.with_member_stats().get(pk=self.group.pk)
+        self.assertEqual(group.male_count(), 3)
+
+        group.add_member(self.profile4)
+        self.assertEqual(group.total_members_count(), 5)
+        self.assertEqual(group.male_count(), 4)
+
+    def test_member_count_maintained_by_signals(self):
+        self.group.refresh_from_db()
+        self.assertEqual(self.group.member_count, 3)
+
+        self.group.remove_member(self.profile3)
+        self.group.refresh_from_db()
+        self.assertEqual(self.group.member_count, 2)
+
+        self.group.add_member(self.profile4)
+        self.group.refresh_from_db()
+        self.assertEqual(self.group.member_count, 3)
+
+    def test_save_does_not_overwrite_member_count(self):
+        stale_group = Group.objects.get(pk=self.group.pk)
+        self.group.add_member(self.profile4)
+
+        stale_group.name = "Renamed Group"
+        stale_group.save()
+
+        self.group.refresh_from_db()
+        self.assertEqual(self.group.name, "Renamed Group")
+        self.assertEqual(self.group.member_count, 4)
+
+    def test_recount_members(self):
+        Group.objects.update(member_count=0)
+
+        self.assertEqual(Group.objects.recount_members(), 4)
+
+        self.group.refresh_from_db()
+        self.child_group_same_city.refresh_from_db()
+        self.assertEqual(self.group.member_count, 3)
+        self.assertEqual(self.child_group_same_city.member_count, 0)
+
+    def test_subtree_stats(self):
+        GroupMemberFactory(
+            profile=self.profile4,
+            group=self.grandchild_group_same_city,
+        )
+
+        stats = self.group.subtree_stats()
+        self.assertEqual(stats["members_total"], 4)
+        self.assertEqual(stats["groups"], 4)
+
+        child_stats = self.child_group_same_city.subtree_stats()
+        self.assertEqual(child_stats["members_total"], 1)
+        self.assertEqual(child_stats["groups"], 2)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.group.subtree_stats(), stats)
+
+    def test_subtree_stats_invalidated_on_member_change(self):
+        self.assertEqual(self.group.subtree_stats()["members_total"], 3)
+
+        self.child_group_different_city.add_member(self.profile4)
+        self.assertEqual(self.group.subtree_stats()["members_total"], 4)
+
+        GroupMember.objects.get(profile=self.profile4).delete()
+        self.assertEqual(self.group.subtree_stats()["members_total"], 3)
+
+    def test_subtree_stats_invalidated_on_move(self):
+        self.grandchild_group_same_city.add_member(self.profile4)
+        self.child_group_same_city.refresh_from_db()
+        self.child_group_different_city.refresh_from_db()
+
+        self.assertEqual(
+            self.child_group_same_city.subtree_stats()["members_total"],
+            1,
+        )
+        self.assertEqual(
+            self.child_group_different_city.subtree_stats()["members_total"],
+            0,
+        )
+
+        self.grandchild_group_same_city.move_to(self.child_group_different_city)
+
+        self.child_group_same_city.refresh_from_db()
+        self.child_group_different_city.refresh_from_db()
+
+        self.assertEqual(
+            self.child_group_same_city.subtree_stats()["members_total"],
+            0,
+        )
+        self.assertEqual(
+            self.child_group_different_city.subtree_stats()["members_total"],
+            1,
+        )
+
+    def test_subtree_stats_invalidated_when_a_tree_returns_to_a_cached_state(self):
+        leaders = [
+            User.objects.create_user(
+                email=f"treeleader{number}@example.com",
+                password="password123",
+            ).profile
+            for number in range(4)
+        ]
+        member = User.objects.create_user(
+            email="treemember@example.com",
+            password="password123",
+        ).profile
+
+        root = GroupFactory(leader=leaders[0], name="Root")
+        child = GroupFactory(leader=leaders[1], name="Child", parent=root)
+        other_root = GroupFactory(leader=leaders[2], name="Other root")
+        child.add_member(member)
+
+        root.refresh_from_db()
+        self.assertEqual(root.subtree_stats()["members_total"], 1)
+        cached_position = (root.tree_id, root.lft, root.rght)
+
+        child.refresh_from_db()
+        child.move_to(other_root)
+
+        # A new child puts the root back at its cached position
+        GroupFactory(leader=leaders[3], name="New child", parent=root)
+        root.refresh_from_db()
+
+        self.assertEqual((root.tree_id, root.lft, root.rght), cached_position)
+        self.assertEqual(root.subtree_stats()["members_total"], 0)
+
+    def test_subtree_stats_invalidated_when_the_parent_is_changed(self):
+        root_leader, child_leader, other_leader = (
+            User.objects.create_user(
+                email=f"{name}@example.com",
+                password="password123",
+            ).profile
+            for name in ["rootleader", "childleader", "otherleader"]
+        )
+
+        root = GroupFactory(leader=root_leader, name="Root")
+        child = GroupFactory(leader=child_leader, name="Child", parent=root)
+        other_root = GroupFactory(leader=other_leader, name="Other root")
+
+        root.refresh_from_db()
+        self.assertEqual(root.subtree_stats()["groups"], 2)
+
+        child.refresh_from_db()
+        child.parent = other_root
+        child.save()
+
+        root.refresh_from_db()
+        self.assertEqual(root.subtree_stats()["groups"], 1)
+
+    def test_subtree_stats_invalidated_when_a_group_is_deleted(self):
+        root_leader, child_leader = (
+            User.objects.create_user(
+                email=f"{name}@example.com",
+                password="password123",
+            ).profile
+            for name in ["rootleader", "childleader"]
+        )
+
+        root = GroupFactory(leader=root_leader, name="Root")
+        self.assertEqual(root.subtree_stats()["groups"], 1)
+
+        child = GroupFactory(leader=child_leader, name="Child", parent=root)
+        root.refresh_from_db()
+        self.assertEqual(root.subtree_stats()["groups"], 2)
+
+        child.delete()
+        root.refresh_from_db()
+        self.assertEqual(root.subtree_stats()["groups"], 1)
+
     def test_most_common_role(self):
         self.assertEqual(
             self.group.most_common_role(),
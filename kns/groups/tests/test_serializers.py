@@ -3,7 +3,7 @@ from rest_framework.exceptions import ValidationError
 
 from kns.custom_user.models import User
 from kns.groups.models import Group
-from kns.groups.serializers import GroupSerializer
+from kns.groups.serializers import GroupSerializer, serialize_group_tree
 
 
 class TestGroupSerializer(TestCase):
@@ -112,3 +112,60 @@ class TestGroupSerializer(TestCase):
         data = serializer.data
 
         self.assertEqual(data["member_count"], 1)
+
+
+class TestSerializeGroupTree(TestCase):
+    def setUp(self):
+        """
+        Set up a small group tree.
+        """
+        self.user1 = User.objects.create_user(
+            email="testuser@example.com",
+            password="password123",
+        )
+        self.user2 = User.objects.create_user(
+            email="testuser2@example.com",
+            password="password123",
+        )
+        self.user3 = User.objects.create_user(
+            email="testuser3@example.com",
+            password="password123",
+        )
+
+        self.parent_group = Group.objects.create(
+            leader=self.user1.profile,
+            name="Parent Group",
+            description="This is the parent group.",
+        )
+        self.child_group_b = Group.objects.create(
+            leader=self.user2.profile,
+            name="B Child Group",
+            description="This is a child group.",
+            parent=self.parent_group,
+        )
+        self.child_group_a = Group.objects.create(
+            leader=self.user3.profile,
+            name="A Child Group",
+            description="This is a child group.",
+            parent=self.parent_group,
+        )
+
+    def test_matches_recursive_serializer(self):
+        """
+        Test that the tree matches the output of the recursive serializer.
+        """
+        self.assertEqual(
+            serialize_group_tree(self.parent_group),
+            GroupSerializer(self.parent_group).data,
+        )
+
+    def test_children_in_tree_order(self):
+        """
+        Test that children are ordered as in the tree.
+        """
+        data = serialize_group_tree(self.parent_group)
+
+        self.assertEqual(
+            [child["name"] for child in data["children"]],
+            ["A Child Group", "B Child Group"],
+        )
@@ -1,10 +1,14 @@
+import re
+
+from django.template.loader import render_to_string
 from django.test import Client, TestCase
 from django.urls import reverse
 
+from kns.core.tests.query_budget import QueryBudgetMixin
 from kns.custom_user.models import User
 from kns.faith_milestones.models import FaithMilestone, GroupFaithMilestone
 from kns.groups.forms import GroupForm
-from kns.groups.models import Group
+from kns.groups.models import Group, GroupMember
 from kns.mentorships.models import MentorshipArea, ProfileMentorshipArea
 from kns.skills.models import ProfileInterest, ProfileSkill, Skill
 from kns.vocations.models import ProfileVocation, Vocation
@@ -68,6 +72,51 @@ class TestGroupViews(TestCase):
             response.content.decode(),
         )
 
+    def test_group_stats_show_members_with_the_member_role(self):
+        """
+        Test that "Members in group" shows the members with the role
+        'member', while "Total people in group" counts every member.
+        """
+        for number, role in enumerate(["member", "leader", "external_person"]):
+            profile = User.objects.create_user(
+                email=f"member{number}@example.com",
+                password="password123",
+            ).profile
+            profile.role = role
+            profile.save()
+            GroupMember.objects.create(group=self.group, profile=profile)
+
+        self.group.refresh_from_db()
+        self.client.login(
+            email="testuser@example.com",
+            password="password123",
+        )
+
+        response = self.client.get(
+            reverse(
+                "groups:group_overview",
+                kwargs={"group_slug": self.group.slug},
+            )
+        )
+        content = response.content.decode()
+
+        for title, value in [("Total people in group", "3"), ("Members in group", "1")]:
+            self.assertRegex(
+                content,
+                rf'text-black-500">\s*{value}\s*</div>\s*<div[^>]*>\s*{title}',
+            )
+
+        tree_stats = render_to_string(
+            "groups/components/group_tree/group_tree_stats.html",
+            {"group": self.group},
+        )
+        members_stat = tree_stats.split('"tooltip-members-count"')[1]
+
+        self.assertEqual(
+            re.search(r'text-black-500">\s*(\d+)', members_stat).group(1),
+            "1",
+        )
+
     def test_group_overview_view_not_found(self):
         """
         Test the group_overview view with a non-existent group slug.
@@ -119,6 +168,44 @@ class TestGroupViews(TestCase):
             response.content.decode(),
         )
 
+    def test_group_members_view_register_member_link(self):
+        """
+        Test that only the leader of an empty group is offered to register
+        a member.
+        """
+        url = reverse(
+            "groups:group_members",
+            kwargs={
+                "group_slug": self.group.slug,
+            },
+        )
+        register_member_url = reverse("profiles:register_member")
+
+        self.client.login(
+            email="testuser@example.com",
+            password="password123",
+        )
+        response = self.client.get(url)
+
+        self.assertTrue(response.context["is_group_leader"])
+        self.assertContains(response, f'href="{register_member_url}"')
+
+        other_user = User.objects.create_user(
+            email="otheruser@example.com",
+            password="password123",
+        )
+        other_user.profile.is_onboarded = True
+        other_user.profile.save()
+
+        self.client.login(
+            email="otheruser@example.com",
+            password="password123",
+        )
+        response = self.client.get(url)
+
+        self.assertFalse(response.context["is_group_leader"])
+        self.assertNotContains(response, f'href="{register_member_url}"')
+
     def test_group_members_view_not_found(self):
         """
         Test the group_members view with a non-existent group slug.
@@ -1169,6 +1256,42 @@ class TestGroupIndexView(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.context["page_obj"]), 5)
 
+    def test_cursor_pagination(self):
+        """
+        Test that the next link uses a cursor, keeps the filters and gives
+        the same page as the page number.
+        """
+        for i in range(9):
+            user = User.objects.create_user(
+                email=f"looptestuser{i}@example.com",
+                password="testpassword",
+            )
+
+            Group.objects.create(
+                leader=user.profile,
+                name=f"Loop Group {i}",
+                parent=self.group1,
+                location_country="NG",
+                location_city="Kaduna",
+                description="Group for gamma members.",
+            )
+
+        url = reverse("groups:index")
+        params = {"location_country": "NG"}
+        response = self.client.get(url, params)
+        cursor = response.context["page_obj"].next_cursor
+
+        self.assertContains(response, f"?location_country=NG&amp;cursor={cursor}")
+
+        response = self.client.get(url, {**params, "cursor": cursor})
+        page_obj = response.context["page_obj"]
+
+        self.assertEqual(page_obj.number, 2)
+        self.assertEqual(
+            list(page_obj),
+            list(self.client.get(url, {**params, "page": 2}).context["page_obj"]),
+        )
+
     def test_empty_form_does_not_filter(self):
         """
         Test that an empty form does not apply any filters.
@@ -2287,3 +2410,93 @@ class TestGroupIndexViewMentorshipAreasFilters(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Group Alpha")
         self.assertNotContains(response, "Group Beta")
+
+
+class TestGroupViewsQueryBudget(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        """
+        Set up a leader's group with members and child groups.
+        """
+        self.user = User.objects.create_user(
+            email="leader@example.com",
+            password="password123",
+        )
+        self.profile = self.user.profile
+        self.profile.is_onboarded = True
+        self.profile.save()
+
+        self.group = Group.objects.create(
+            leader=self.profile,
+            name="Test Group",
+            location_country="NG",
+            location_city="Bauchi",
+            description=test_constants.VALID_GROUP_DESCRIPTION,
+        )
+
+        for number in range(5):
+            member = User.objects.create_user(
+                email=f"member{number}@example.com",
+                password="password123",
+            ).profile
+            member.first_name = f"Member{number}"
+            member.last_name = "Doe"
+            member.save()
+
+            self.group.add_member(member)
+
+            child_leader = User.objects.create_user(
+                email=f"leader{number}@example.com",
+                password="password123",
+            ).profile
+
+            Group.objects.create(
+                leader=child_leader,
+                parent=self.group,
+                name=f"Child Group {number}",
+                location_country="NG",
+                location_city="Jos",
+                description=test_constants.VALID_GROUP_DESCRIPTION,
+            )
+
+        self.group.refresh_from_db()
+
+        self.client.login(
+            email="leader@example.com",
+            password="password123",
+        )
+
+    def test_index_query_budget(self):
+        """
+        The number of queries does not depend on the number of groups
+        listed. The paginator and the statistics both count the groups,
+        and the skills and interests filters both load the skills.
+        """
+        url = reverse("groups:index")
+
+        # Warm the session and the per-request caches first
+        self.client.get(url)
+
+        with self.assertQueryBudget(25, max_repeats=2):
+            response = self.client.get(url)
+
+        self.assertEqual(len(response.context["page_obj"]), 5)
+
+    def test_group_members_query_budget(self):
+        """
+        The number of queries does not depend on the number of members
+        or subgroups of the group.
+        """
+        url = reverse(
+            "groups:group_members",
+            kwargs={
+                "group_slug": self.group.slug,
+            },
+        )
+
+        # Warm the session and the per-request caches first
+        self.client.get(url)
+
+        with self.assertQueryBudget(10):
+            response = self.client.get(url)
+
+        self.assertEqual(len(response.context["members"]), 5)
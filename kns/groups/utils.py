@@ -90,11 +90,7 @@ class GroupStatistics:
         Group or None
             The group object with the most members, or None if no groups exist.
         """
-        return (
-            self.groups.annotate(member_count=Count("members"))
-            .order_by("-member_count")
-            .first()
-        )
+        return self.groups.order_by("-member_count").first()
 
     def get_avg_no_of_members_per_group(self):
         """
@@ -106,10 +102,8 @@ class GroupStatistics:
             The average number of members per group rounded to one
             decimal point, or None if no groups exist.
         """
-        avg_members = self.groups.annotate(
-            member_count=Count("members"),
-        ).aggregate(
-            Avg("member_count")
+        avg_members = self.groups.aggregate(
+            Avg("member_count"),
         )["member_count__avg"]
 
         # Return the average rounded to one decimal place or None if avg_members is None
@@ -126,6 +120,8 @@ class GroupStatistics:
             A list of dictionaries with 'label', 'icon', 'value', and
             'description' keys for each statistic.
         """
+        avg_no_of_members = self.get_avg_no_of_members_per_group()
+
         stats = [
             {
                 "label": "Total Groups",
@@ -137,8 +133,8 @@ class GroupStatistics:
                 "label": "Average Number of Members per Group",
                 "icon": "icon-park-solid:people-unknown",
                 "value": (
-                    f"{self.get_avg_no_of_members_per_group():.1f}"
-                    if self.get_avg_no_of_members_per_group() is not None
+                    f"{avg_no_of_members:.1f}"
+                    if avg_no_of_members is not None
                     else "N/A"
                 ),
                 "description": "Average number of members across all groups.",
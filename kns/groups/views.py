@@ -4,11 +4,11 @@ Views for the `groups` app.
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
 from django.db.models import Count, F, Q
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 
+from kns.core.pagination import get_directory_page
 from kns.faith_milestones.forms import GroupFaithMilestonesForm
 from kns.faith_milestones.models import GroupFaithMilestone
 from kns.groups.forms import (
@@ -22,6 +22,7 @@ from kns.groups.forms import (
 )
 from kns.groups.models import Group, GroupMember
 from kns.profiles.models import Profile
+from kns.profiles.search import get_name_search_filter
 from kns.profiles.utils import name_with_apostrophe
 
 from .utils import GroupStatistics
@@ -113,8 +114,7 @@ def index(request):
                 )
             if leader:
                 groups = groups.filter(
-                    Q(leader__first_name__icontains=leader)
-                    | Q(leader__last_name__icontains=leader)
+                    get_name_search_filter(leader, prefix="leader__"),
                 )
 
         # Apply filters based on GroupMembersFilterForm data
@@ -136,10 +136,8 @@ def index(request):
 
             # Apply filters based on member counts
             if num_members is not None:
-                groups = groups.annotate(
-                    num_members=Count("members"),
-                ).filter(
-                    num_members__gte=num_members,
+                groups = groups.filter(
+                    member_count__gte=num_members,
                 )
 
             if num_leaders is not None:
@@ -361,16 +359,19 @@ def index(request):
     ):
         groups = Group.objects.none()
 
-    # Pagination
-    paginator = Paginator(groups, 5)
-    page = request.GET.get("page")
-
-    try:
-        page_obj = paginator.page(page)
-    except PageNotAnInteger:
-        page_obj = paginator.page(1)
-    except EmptyPage:  # pragma: no cover
-        page_obj = paginator.page(paginator.num_pages)
+    # Pagination, by cursor for the previous and next pages
+    page_obj = get_directory_page(request, groups, 5, ["tree_id", "lft"])
+
+    # Reload the groups on the page with everything their cards show, so
+    # the number of queries does not grow with the page size
+    page_groups = (
+        Group.objects.filter(pk__in=[group.pk for group in page_obj])
+        .with_member_stats()
+        .select_related("leader__encryption")
+        .prefetch_related("members__profile")
+        .in_bulk()
+    )
+    page_obj.object_list = [page_groups[group.pk] for group in page_obj]
 
     # Create an instance of GroupStatistics with the filtered groups
     groups_stats = GroupStatistics(groups).get_all_statistics()
@@ -413,7 +414,7 @@ def group_overview(request, group_slug):
         The rendered template displaying the overviews of the group.
     """
     group = get_object_or_404(
-        Group,
+        Group.objects.with_member_stats(),
         slug=group_slug,
     )
 
@@ -542,12 +543,16 @@ def group_members(request, group_slug):
         The rendered template displaying the members of the group.
     """
     group = get_object_or_404(
-        Group,
+        Group.objects.with_member_stats().select_related("leader__encryption"),
         slug=group_slug,
     )
 
-    group_members_ids = [member.id for member in group.group_members()]
-    members = Profile.objects.filter(pk__in=group_members_ids)
+    members = Profile.objects.filter(group_in__group=group).select_related(
+        "encryption",
+        "consent_form",
+        "group_led",
+        "group_in__group",
+    )
 
     context = {
         "group": group,
@@ -4,10 +4,13 @@ Views for the `levels` apis app.
 
 from django.http import JsonResponse
 
+from kns.core.reference_data import reference_data_view
+
 from .models import Level, Sublevel
 from .serializers import LevelSerializer, SublevelSerializer
 
 
+@reference_data_view("levels")
 def levels_list(request):
     """
     Retrieve a list of all levels and return them as a JSON response.
@@ -39,6 +42,7 @@ def levels_list(request):
     return JsonResponse(data, safe=False)
 
 
+@reference_data_view("levels")
 def level_detail(request, id):
     """
     Retrieve the details of a specific level by its ID and return them as a JSON response.
@@ -67,6 +71,7 @@ def level_detail(request, id):
     return JsonResponse(data, safe=False)
 
 
+@reference_data_view("levels")
 def sublevels_list(request):
     """
     Retrieve a list of all sublevels and return them as a JSON response.
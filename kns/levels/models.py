@@ -5,9 +5,12 @@ Models for the `levels` app.
 from uuid import uuid4
 
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from tinymce import models as tinymce_models
 
 from kns.core.modelmixins import TimestampedModel
+from kns.core.reference_data import bump_reference_data_version
 from kns.profiles.models import Profile
 
 
@@ -208,3 +211,25 @@ class ProfileLevel(TimestampedModel, models.Model):
             return f"{self.profile.get_full_name()} - {self.level} ({self.sublevel})"
 
         return f"{self.profile.get_full_name()} - {self.level.title}"
+
+
+@receiver(post_save, sender=Level)
+@receiver(post_delete, sender=Level)
+@receiver(post_save, sender=Sublevel)
+@receiver(post_delete, sender=Sublevel)
+@receiver(post_save, sender=LevelSublevel)
+@receiver(post_delete, sender=LevelSublevel)
+def bump_levels_version(sender, **kwargs):
+    """
+    Bump the version of the levels reference data when a level,
+    sublevel or link between them is saved or deleted, invalidating the
+    ETags of the levels API.
+
+    Parameters
+    ----------
+    sender : type
+        The model class that triggered the signal.
+    **kwargs : dict
+        Additional keyword arguments passed by the signal.
+    """
+    bump_reference_data_version("levels")
@@ -140,3 +140,35 @@ class LevelViewsTestCase(TestCase):
         sublevel_titles = [sublevel["title"] for sublevel in data["sublevels"]]
         self.assertIn("Sublevel 1", sublevel_titles)
         self.assertIn("Sublevel 2", sublevel_titles)
+
+    def test_levels_list_conditional_get(self):
+        """
+        Test that a request with a matching ETag gets a 304 without
+        querying the database.
+        """
+        url = reverse("api:levels_list")
+        response = self.client.get(url)
+
+        self.assertIn("ETag", response)
+        self.assertIn("Last-Modified", response)
+        self.assertIn("no-cache", response["Cache-Control"])
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_levels_etag_changes_on_save(self):
+        """
+        Test that saving a sublevel invalidates the levels ETag.
+        """
+        url = reverse("api:sublevels_list")
+        etag = self.client.get(url)["ETag"]
+
+        self.sublevel1.title = "Updated Sublevel 1"
+        self.sublevel1.save()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
@@ -85,7 +85,7 @@ class ProfileMentorshipAreasForm(forms.Form):
         cleaned_data = super().clean()
         mentorship_areas = cleaned_data.get("mentorship_areas", [])
 
-        settings = Setting.get_or_create_setting()
+        settings = Setting.get_cached()
 
         # Ensure at least one mentorship area is selected
         if not mentorship_areas:
@@ -139,3 +139,14 @@ TASKS = {
         ),
     },
 }
+
+# The onboarding steps of a profile are cached by profile id.
+ONBOARDING_STEPS_CACHE_NAMESPACE = "onboarding_steps"
+ONBOARDING_STEPS_CACHE_TIMEOUT = 60 * 60
+
+# The onboarding status of the logged in user is kept in their session
+# and checked against the onboarding version of the user, bumped whenever
+# one of ONBOARDING_STATUS_PROFILE_FIELDS or the onboarding progress of the
+# profile changes.
+ONBOARDING_STATUS_SESSION_KEY = "onboarding_status"
+ONBOARDING_STATUS_PROFILE_FIELDS = ["is_onboarded", "role"]
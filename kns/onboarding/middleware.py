@@ -3,16 +3,22 @@ Middlewares for the `onboarding` app.
 """
 
 from django.shortcuts import redirect
-from django.urls import resolve, reverse
+from django.urls import reverse
 
+from .constants import ONBOARDING_STATUS_SESSION_KEY
 from .models import ProfileOnboarding
 
 
 class OnboardingMiddleware:
     """
     Middleware to check if a user has completed the onboarding process.
-    Redirects to the 'onboarding:index' if they haven't completed it yet.
-    It ignores admin, admin honeypot, api, logout, and onboarding routes.
+    Redirects to the user's current onboarding step if they haven't
+    completed it yet. It ignores admin, admin honeypot, api and logout
+    routes.
+
+    The onboarding status is stored in the session, so the database is
+    only queried again when the profile or its onboarding progress
+    changes.
 
     Parameters
     ----------
@@ -20,6 +26,17 @@ class OnboardingMiddleware:
         The next middleware or view in the request/response cycle.
     """
 
+    # Paths that are never redirected, checked before anything is loaded.
+    excluded_paths = [
+        "/admin/",
+        "/control-panel/",
+        "/api/",
+    ]
+
+    excluded_url_names = [
+        "accounts:logout",
+    ]
+
     def __init__(self, get_response):
         """
         Initialize the middleware.
@@ -36,7 +53,8 @@ class OnboardingMiddleware:
         Process the request and handle redirection if necessary.
 
         Checks if the user is authenticated and whether they have completed
-        onboarding. If not, it redirects them to the 'onboarding:index' page.
+        onboarding. If not, it redirects them to their current onboarding
+        step.
 
         Parameters
         ----------
@@ -49,42 +67,82 @@ class OnboardingMiddleware:
             The HTTP response object from the next middleware or a redirect
             to the onboarding step.
         """
-        # Only check for authenticated users
-        if request.user.is_authenticated:
-            # Bypass admin, honeypot, API, logout, and onboarding URLs
-            resolved_url = resolve(request.path_info)
-            excluded_url_names = [
-                "admin:index",
-                "logout",
-            ]
-
-            # Check for URL patterns that start with certain prefixes
-            excluded_paths = [
-                "admin/",
-                "control-panel/",
-                "api/",
-                "onboarding/",
-            ]
-
-            if resolved_url.url_name in excluded_url_names or any(
-                request.path.startswith(p) for p in excluded_paths
-            ):
-                return self.get_response(request)
-
-            # Check if the user has completed onboarding
-            if not request.user.profile.is_onboarded:
-                ProfileOnboarding.objects.get_or_create(profile=request.user.profile)
-
-                profile_onboarding = ProfileOnboarding.objects.get(
-                    profile=request.user.profile
-                )
-
-                current_step = profile_onboarding.get_current_step(request.user.profile)
-                onboarding_url = reverse(current_step["url_name"])
-
-                # If the user is not on their current onboarding step, redirect them
-                if request.path != onboarding_url:
-                    return redirect(onboarding_url)
+        # Only check for authenticated users on routes that are not excluded
+        if request.user.is_authenticated and not self.is_excluded(request.path_info):
+            status = self.get_onboarding_status(request)
+
+            # If the user is not on their current onboarding step, redirect them
+            if not status["is_onboarded"] and request.path != status["url"]:
+                return redirect(status["url"])
 
         # Proceed with the request if onboarding is complete or irrelevant
         return self.get_response(request)
+
+    def is_excluded(self, path):
+        """
+        Return whether a path is never redirected to onboarding.
+
+        Parameters
+        ----------
+        path : str
+            The path of the request, without the script prefix.
+
+        Returns
+        -------
+        bool
+            True if onboarding must not be checked for the path.
+        """
+        if any(path.startswith(prefix) for prefix in self.excluded_paths):
+            return True
+
+        return any(path == reverse(name) for name in self.excluded_url_names)
+
+    def get_onboarding_status(self, request):
+        """
+        Return the onboarding status of the logged in user.
+
+        The status is read from the session while its version matches the
+        onboarding version of the user, which is loaded with the user and
+        bumped in the database, and loaded from the database otherwise.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The HTTP request object of an authenticated user.
+
+        Returns
+        -------
+        dict
+            A dictionary with `is_onboarded` and `url`, the URL of the
+            current onboarding step (None for onboarded users).
+        """
+        status = request.session.get(ONBOARDING_STATUS_SESSION_KEY)
+
+        if (
+            status is not None
+            and status["user_id"] == request.user.pk
+            and status["version"] == request.user.onboarding_version
+        ):
+            return status
+
+        profile = request.user.profile
+
+        # The version was loaded with the user, before the data, so a
+        # concurrent change is seen as a newer version on the next request.
+        status = {
+            "user_id": request.user.pk,
+            "version": request.user.onboarding_version,
+            "is_onboarded": profile.is_onboarded,
+            "url": None,
+        }
+
+        if not profile.is_onboarded:
+            profile_onboarding, _ = ProfileOnboarding.objects.get_or_create(
+                profile=profile,
+            )
+            current_step = profile_onboarding.get_current_step(profile)
+            status["url"] = reverse(current_step["url_name"])
+
+        request.session[ONBOARDING_STATUS_SESSION_KEY] = status
+
+        return status
@@ -7,13 +7,23 @@ role and visitor status, and steps can be navigated through the `next` and
 `back` methods.
 """
 
-from django.core.cache import cache
 from django.core.validators import MaxLengthValidator, MinLengthValidator
 from django.db import models
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone
 
+from kns.core import cache
 from kns.core.modelmixins import TimestampedModel
-from kns.onboarding.constants import ONBOARDING_STEPS, TASKS_CHOICES
+from kns.custom_user.models import User
+from kns.onboarding.constants import (
+    ONBOARDING_STATUS_PROFILE_FIELDS,
+    ONBOARDING_STEPS,
+    ONBOARDING_STEPS_CACHE_NAMESPACE,
+    ONBOARDING_STEPS_CACHE_TIMEOUT,
+    TASKS_CHOICES,
+)
 from kns.profiles.models import Profile
 
 
@@ -77,8 +87,7 @@ class ProfileOnboarding(models.Model):
         list
             A list of dictionaries containing the details of each onboarding step.
         """
-        cache_key = f"onboarding_steps_{profile.id}"
-        steps = cache.get(cache_key)
+        steps = cache.get(ONBOARDING_STEPS_CACHE_NAMESPACE, profile.id)
 
         if not steps:
             # Start with the default steps
@@ -107,7 +116,12 @@ class ProfileOnboarding(models.Model):
                     steps.insert(2, ONBOARDING_STEPS["group"])
 
             # Set cache
-            cache.set(cache_key, steps, timeout=3600)
+            cache.set(
+                ONBOARDING_STEPS_CACHE_NAMESPACE,
+                profile.id,
+                value=steps,
+                timeout=ONBOARDING_STEPS_CACHE_TIMEOUT,
+            )
 
         return steps
 
@@ -164,6 +178,96 @@ class ProfileOnboarding(models.Model):
         return f"{self.profile.get_full_name()} - onboarding."
 
 
+def bump_onboarding_version(profile_id, user=None):
+    """
+    Invalidate the onboarding status stored in the sessions of a profile.
+
+    Parameters
+    ----------
+    profile_id : int
+        The id of the profile.
+    user : User, optional
+        The user of the profile already loaded in memory, e.g.
+        `request.user`. Its version is bumped too, so saving it afterwards
+        does not write the old version back.
+    """
+    User.objects.filter(profile=profile_id).update(
+        onboarding_version=F("onboarding_version") + 1,
+    )
+
+    if user is not None:
+        user.onboarding_version += 1
+
+
+def get_loaded_user(profile):
+    """
+    Return the user of a profile if it is already loaded.
+
+    Parameters
+    ----------
+    profile : Profile
+        The profile.
+
+    Returns
+    -------
+    User or None
+        The user loaded with the profile, or None if it has not been
+        loaded.
+    """
+    return profile.user if Profile.user.is_cached(profile) else None
+
+
+@receiver(post_save, sender=Profile)
+def invalidate_profile_onboarding_status(sender, instance, created, **kwargs):
+    """
+    Invalidate the onboarding status stored in the sessions of a profile
+    when a field it depends on changes, e.g. when the profile is marked as
+    onboarded.
+
+    Parameters
+    ----------
+    sender : type
+        The model class that triggered the signal (Profile).
+    instance : Profile
+        The Profile instance being saved.
+    created : bool
+        Whether the profile was created.
+    **kwargs : dict
+        Additional keyword arguments passed by the signal.
+    """
+    changed_fields = instance.get_changed_fields(ONBOARDING_STATUS_PROFILE_FIELDS)
+
+    if kwargs.get("update_fields") is not None:
+        changed_fields &= set(kwargs["update_fields"])
+
+    if created or changed_fields:
+        bump_onboarding_version(instance.pk, get_loaded_user(instance))
+
+
+@receiver(post_save, sender=ProfileOnboarding)
+@receiver(post_delete, sender=ProfileOnboarding)
+def invalidate_onboarding_status(sender, instance, **kwargs):
+    """
+    Invalidate the onboarding status stored in the sessions of a profile
+    when its onboarding progress changes, e.g. through `next` or `back`.
+
+    Parameters
+    ----------
+    sender : type
+        The model class that triggered the signal (ProfileOnboarding).
+    instance : ProfileOnboarding
+        The ProfileOnboarding instance being saved or deleted.
+    **kwargs : dict
+        Additional keyword arguments passed by the signal.
+    """
+    user = None
+
+    if ProfileOnboarding.profile.is_cached(instance):
+        user = get_loaded_user(instance.profile)
+
+    bump_onboarding_version(instance.profile_id, user)
+
+
 class ProfileCompletionTask(TimestampedModel, models.Model):
     """
     Represent a task that a profile needs to complete for profile integration.
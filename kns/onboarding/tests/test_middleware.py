@@ -1,5 +1,7 @@
 from unittest.mock import MagicMock, patch
 
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.cache import caches
 from django.http import HttpResponse
 from django.test import RequestFactory, TestCase
 from django.urls import reverse
@@ -116,3 +118,175 @@ class OnboardingMiddlewareTestCase(TestCase):
             response.status_code,
             302,
         )
+
+
+class OnboardingMiddlewareSessionTestCase(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.middleware = OnboardingMiddleware(
+            lambda request: HttpResponse(""),
+        )
+
+        self.user = User.objects.create_user(
+            email="testuser@example.com",
+            password="testpass",
+        )
+
+        self.profile = self.user.profile
+        self.profile_onboarding = ProfileOnboarding.objects.create(
+            profile=self.profile,
+            current_step=1,
+        )
+
+        self.session = SessionStore()
+
+    def get(self, path, user=None):
+        """
+        Run the middleware on a GET request by a freshly loaded user,
+        sharing the session between calls.
+        """
+        request = self.factory.get(path)
+        request.user = user or User.objects.get(pk=self.user.pk)
+        request.session = self.session
+
+        return self.middleware(request)
+
+    def test_onboarded_user_makes_no_queries(self):
+        """
+        Once the status is in the session, onboarded users are let through
+        without querying the database.
+        """
+        self.profile.is_onboarded = True
+        self.profile.save()
+
+        self.assertEqual(self.get("/profiles/").status_code, 200)
+
+        user = User.objects.get(pk=self.user.pk)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get("/profiles/", user=user).status_code, 200)
+
+    def test_not_onboarded_user_redirect_is_cached(self):
+        """
+        The current step of users who are not onboarded is also read from
+        the session.
+        """
+        response = self.get("/profiles/")
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.url, reverse("onboarding:index"))
+
+        user = User.objects.get(pk=self.user.pk)
+
+        with self.assertNumQueries(0):
+            response = self.get("/profiles/", user=user)
+
+        self.assertEqual(response.url, reverse("onboarding:index"))
+
+    def test_status_refreshed_when_step_changes(self):
+        """
+        Moving to another onboarding step refreshes the stored status.
+        """
+        self.get("/profiles/")
+
+        self.profile_onboarding.next(self.profile)
+
+        response = self.get("/profiles/")
+
+        self.assertEqual(response.url, reverse("onboarding:involvement"))
+
+    def test_status_refreshed_when_onboarded(self):
+        """
+        Completing the onboarding refreshes the stored status.
+        """
+        self.assertEqual(self.get("/profiles/").status_code, 302)
+
+        self.profile.is_onboarded = True
+        self.profile.save()
+
+        self.assertEqual(self.get("/profiles/").status_code, 200)
+
+    def test_status_of_another_user_is_ignored(self):
+        """
+        A status stored for another user is not used.
+        """
+        self.profile.is_onboarded = True
+        self.profile.save()
+        self.get("/profiles/")
+
+        other_user = User.objects.create_user(
+            email="otheruser@example.com",
+            password="testpass",
+        )
+
+        response = self.get("/profiles/", user=other_user)
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_excluded_paths_make_no_queries(self):
+        """
+        Excluded paths are let through before anything is loaded.
+        """
+        user = User.objects.get(pk=self.user.pk)
+
+        with self.assertNumQueries(0):
+            for path in ["/api/groups/", "/control-panel/", "/admin/"]:
+                self.assertEqual(self.get(path, user=user).status_code, 200)
+
+            response = self.get(reverse("accounts:logout"), user=user)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_status_does_not_depend_on_the_cache(self):
+        """
+        The version of the stored status is kept in the database, so it is
+        the same in every process whatever their local cache holds.
+        """
+        self.profile.is_onboarded = True
+        self.profile.save()
+        self.get("/profiles/")
+
+        caches["default"].clear()
+        user = User.objects.get(pk=self.user.pk)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get("/profiles/", user=user).status_code, 200)
+
+    def test_version_kept_when_other_profile_fields_change(self):
+        """
+        Saving a profile without changing its onboarding status does not
+        invalidate the stored status.
+        """
+        profile = Profile.objects.get(pk=self.profile.pk)
+        version = User.objects.get(pk=self.user.pk).onboarding_version
+
+        profile.first_name = "Jane"
+        profile.save()
+        profile.role = "leader"
+        profile.save(update_fields=["first_name"])
+
+        self.assertEqual(User.objects.get(pk=self.user.pk).onboarding_version, version)
+
+        profile.save()
+
+        self.assertEqual(
+            User.objects.get(pk=self.user.pk).onboarding_version,
+            version + 1,
+        )
+
+    def test_saving_the_loaded_user_keeps_the_version(self):
+        """
+        Saving the user loaded with the profile after the status changed,
+        as views do with `request.user`, does not bring the old version
+        back.
+        """
+        self.assertEqual(self.get("/profiles/").status_code, 302)
+
+        user = User.objects.get(pk=self.user.pk)
+        user.profile.is_onboarded = True
+        user.profile.save()
+
+        user.agreed_to_terms = True
+        user.save()
+
+        self.assertEqual(self.get("/profiles/").status_code, 200)
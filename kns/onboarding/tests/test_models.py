@@ -1,11 +1,12 @@
 import pytest
 from django.conf import settings
-from django.core.cache import cache
 from django.db import IntegrityError
 from django.test import TestCase
 from django.utils import timezone
 
+from kns.core import cache
 from kns.custom_user.models import User
+from kns.onboarding.constants import ONBOARDING_STEPS_CACHE_NAMESPACE
 from kns.onboarding.models import (
     ProfileCompletion,
     ProfileCompletionTask,
@@ -56,7 +57,7 @@ class TestProfileOnboardingModel(TestCase):
         """
         Clear cache after each test.
         """
-        cache.clear()
+        cache.get_cache().clear()
 
     def test_back_method(self):
         """
@@ -109,7 +110,7 @@ class TestProfileOnboardingModel(TestCase):
         self.profile.save()
 
         # Clear cache to ensure we get the correct steps for the new role
-        cache.delete(f"onboarding_steps_{self.profile.id}")
+        cache.delete(ONBOARDING_STEPS_CACHE_NAMESPACE, self.profile.id)
 
         steps = self.onboarding.get_onboarding_steps_list(self.profile)
 
@@ -1,23 +1,22 @@
 from datetime import date
 
-from django.core.cache import cache
 from django.test import Client, TestCase
 from django.urls import reverse
 
+from kns.core import cache
 from kns.custom_user.models import User
 from kns.groups.forms import GroupForm
 from kns.groups.models import Group
 from kns.groups.tests.test_constants import VALID_GROUP_DESCRIPTION
 from kns.profiles.forms import AgreeToTermsForm, BioDetailsForm, ProfileInvolvementForm
 
+from ..constants import ONBOARDING_STEPS_CACHE_NAMESPACE
 from ..models import ProfileOnboarding
 
 
 def clear_onboarding_cache(profile):
-    cache_key = f"onboarding_steps_{profile.id}"
-
-    # Delete the specific cache key
-    cache.delete(cache_key)
+    # Delete the cached steps of the profile
+    cache.delete(ONBOARDING_STEPS_CACHE_NAMESPACE, profile.id)
 
 
 class TestBackView(TestCase):
@@ -5,8 +5,6 @@ Context processors for the `profiles` app.
 from django.http import Http404
 from django.shortcuts import get_object_or_404
 
-from kns.groups.models import GroupMember
-
 from .forms import ProfileSettingsForm
 from .models import Profile
 
@@ -42,12 +40,8 @@ def profile_context(request):  # pragma: no cover
                 slug=profile_slug,
             )
 
-            # Check if the profile is a member of any of the request user's groups
-            if request.user.is_authenticated:
-                is_member_of_user_group = GroupMember.objects.filter(
-                    profile=profile,
-                    group__leader=request.user.profile,
-                ).exists()
+            # Check if the profile is a member of the request user's group
+            is_member_of_user_group = request.viewer.leads_member(profile)
 
         except Http404:
             # Handle not found case if needed
@@ -4,12 +4,12 @@ Utility functions for sending emails related to user account management.
 
 from django.conf import settings
 from django.contrib.sites.shortcuts import get_current_site
-from django.core.mail import send_mail
 from django.template.loader import render_to_string
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
 
 from kns.accounts.utils import generate_verification_token
+from kns.core.outbox import queue_mail
 
 
 def send_new_leader_email(request, profile, profiles_leader):
@@ -58,8 +58,8 @@ def send_new_leader_email(request, profile, profiles_leader):
         },
     )
 
-    # Send the email
-    send_mail(
+    # Queue the email
+    queue_mail(
         subject=subject,
         message="",
         from_email=settings.DEFAULT_FROM_EMAIL,
@@ -108,8 +108,8 @@ def send_new_member_email(request, profile, profiles_leader):
         },
     )
 
-    # Send the email
-    send_mail(
+    # Queue the email
+    queue_mail(
         subject=subject,
         message="",
         from_email=settings.DEFAULT_FROM_EMAIL,
@@ -154,8 +154,8 @@ def send_new_external_person_email(request, profile, profiles_leader):
         },
     )
 
-    # Send the email
-    send_mail(
+    # Queue the email
+    queue_mail(
         subject=subject,
         message="",
         from_email=settings.DEFAULT_FROM_EMAIL,
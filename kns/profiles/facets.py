@@ -0,0 +1,132 @@
+"""
+Faceted filtering of the profile directory.
+
+A facet is a many-to-many attribute of profiles, such as their skills.
+Profiles match a facet when they have any of its selected values, and
+they must match every facet with a selection. Facets are filtered with
+`EXISTS` subqueries, so combining them adds no joins to the directory
+query and needs no `DISTINCT`.
+
+`get_facet_counts` counts the matching profiles per facet value. The
+counts of a facet ignore its own selection, so every value shows the
+number of profiles the directory would list if it was selected too.
+"""
+
+from django.db.models import Count, Exists, OuterRef, Value
+
+from kns.faith_milestones.models import ProfileFaithMilestone
+from kns.mentorships.models import ProfileMentorshipArea
+from kns.skills.models import ProfileInterest, ProfileSkill
+from kns.vocations.models import ProfileVocation
+
+# The through model and value field of every facet, by facet name. The
+# names match the fields of the profile filter forms.
+FACETS = {
+    "skills": (ProfileSkill, "skill"),
+    "interests": (ProfileInterest, "interest"),
+    "vocations": (ProfileVocation, "vocation"),
+    "mentorship_areas": (ProfileMentorshipArea, "mentorship_area"),
+    "faith_milestones": (ProfileFaithMilestone, "faith_milestone"),
+}
+
+
+def filter_by_facets(profiles, selected, exclude=None):
+    """
+    Filter profiles by the selected facet values.
+
+    Parameters
+    ----------
+    profiles : QuerySet
+        The profiles to filter.
+    selected : dict
+        The selected values (model instances or primary keys) of every
+        facet, by facet name. Facets without values are ignored.
+    exclude : str, optional
+        The name of a facet whose selection is ignored.
+
+    Returns
+    -------
+    QuerySet
+        The profiles matching every facet.
+    """
+    for name, values in selected.items():
+        if not values or name == exclude:
+            continue
+
+        model, field = FACETS[name]
+
+        profiles = profiles.filter(
+            Exists(
+                model.objects.filter(
+                    profile=OuterRef("pk"),
+                    **{f"{field}__in": values},
+                )
+            )
+        )
+
+    return profiles
+
+
+def get_facet_counts(profiles, selected):
+    """
+    Count the profiles matching every facet value.
+
+    The counts of all facets are computed in a single query, a
+    `UNION ALL` of one grouped query per facet.
+
+    Parameters
+    ----------
+    profiles : QuerySet
+        The profiles, filtered by everything but the facets.
+    selected : dict
+        The selected values of every facet, by facet name.
+
+    Returns
+    -------
+    dict
+        The number of matching profiles per value primary key, by facet
+        name. Values without matching profiles are left out.
+    """
+    querysets = []
+
+    for name, (model, field) in FACETS.items():
+        facet_profiles = filter_by_facets(profiles, selected, exclude=name)
+
+        querysets.append(
+            model.objects.filter(profile__in=facet_profiles.values("pk"))
+            .values(field)
+            .annotate(
+                facet=Value(name),
+                count=Count("profile", distinct=True),
+            )
+            .values_list("facet", field, "count")
+            .order_by()
+        )
+
+    counts = {name: {} for name in FACETS}
+
+    for name, value, count in querysets[0].union(*querysets[1:], all=True):
+        counts[name][value] = count
+
+    return counts
+
+
+def add_facet_counts_to_form(form, counts):
+    """
+    Show the facet counts in the choice labels of a filter form, e.g.
+    "Teaching (12)".
+
+    Parameters
+    ----------
+    form : Form
+        A profile filter form.
+    counts : dict
+        The facet counts, as returned by `get_facet_counts`.
+    """
+    for name, field in form.fields.items():
+        if name not in counts:
+            continue
+
+        field.label_from_instance = lambda obj, facet_counts=counts[name]: (
+            f"{obj} ({facet_counts.get(obj.pk, 0)})"
+        )
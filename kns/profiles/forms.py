@@ -168,7 +168,7 @@ class BioDetailsForm(forms.ModelForm):
             If the date of birth does not meet the minimum age requirement.
         """
         date_of_birth = self.cleaned_data.get("date_of_birth")
-        min_registration_age = Setting.get_or_create_setting().min_registration_age
+        min_registration_age = Setting.get_cached().min_registration_age
 
         if date_of_birth:
             min_allowed_date = date.today() - timedelta(
@@ -194,7 +194,7 @@ class BioDetailsForm(forms.ModelForm):
         super(BioDetailsForm, self).__init__(*args, **kwargs)
         self.fields["gender"].choices = profile_constants.GENDER_OPTIONS
 
-        min_registration_age = Setting.get_or_create_setting().min_registration_age
+        min_registration_age = Setting.get_cached().min_registration_age
 
         max_date_of_birth = profile_utils.calculate_max_dob(min_registration_age)
 
@@ -0,0 +1,51 @@
+"""
+Middlewares for the `profiles` app.
+"""
+
+from django.utils.functional import SimpleLazyObject
+
+from .viewer import Viewer
+
+
+class ViewerMiddleware:
+    """
+    Middleware attaching the `Viewer` of the logged in user to the request
+    as `request.viewer`.
+
+    The viewer is created on first access, so requests that never use it
+    do not load the user.
+
+    Parameters
+    ----------
+    get_response : callable
+        The next middleware or view in the request/response cycle.
+    """
+
+    def __init__(self, get_response):
+        """
+        Initialize the middleware.
+
+        Parameters
+        ----------
+        get_response : callable
+            The next middleware or view in the request/response cycle.
+        """
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """
+        Attach the viewer to the request.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The HTTP request object.
+
+        Returns
+        -------
+        HttpResponse
+            The HTTP response object from the next middleware or view.
+        """
+        request.viewer = SimpleLazyObject(lambda: Viewer.for_user(request.user))
+
+        return self.get_response(request)
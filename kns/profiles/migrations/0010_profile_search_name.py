@@ -0,0 +1,85 @@
+# Generated by Django 5.1 on 2026-10-16 20:48
+
+import unicodedata
+
+from django.db import migrations, models
+
+# Trigram indexes serving `LIKE '%term%'` on the search name and the
+# `icontains` lookups on the cities, which compare UPPER(column).
+TRIGRAM_INDEXES = {
+    "profiles_search_name_trgm": "search_name",
+    "profiles_location_city_trgm": "(UPPER(location_city::text))",
+    "profiles_birth_city_trgm": "(UPPER(place_of_birth_city::text))",
+}
+
+
+def normalize_search_text(text):
+    # A copy of kns.profiles.search.normalize_search_text at the time of
+    # this migration, so later changes to it do not change the migration
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+
+    return " ".join(stripped.casefold().split())
+
+
+def populate_search_name(apps, schema_editor):
+    Profile = apps.get_model("profiles", "Profile")
+
+    profiles = Profile.objects.only("first_name", "last_name")
+    batch = []
+
+    for profile in profiles.iterator(chunk_size=1000):
+        profile.search_name = normalize_search_text(
+            f"{profile.first_name or ''} {profile.last_name or ''}",
+        )
+        batch.append(profile)
+
+        if len(batch) == 1000:
+            Profile.objects.bulk_update(batch, ["search_name"])
+            batch = []
+
+    Profile.objects.bulk_update(batch, ["search_name"])
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for name, expression in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON profiles_profile "
+            f"USING gin ({expression} gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for name in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("profiles", "0009_alter_consentform_reject_reason_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="profile",
+            name="search_name",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.RunPython(
+            populate_search_name,
+            migrations.RunPython.noop,
+        ),
+        migrations.RunPython(
+            create_trigram_indexes,
+            drop_trigram_indexes,
+        ),
+    ]
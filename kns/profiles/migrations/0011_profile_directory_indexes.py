@@ -0,0 +1,66 @@
+# Generated by Django 5.1 on 2026-10-16 21:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("profiles", "0010_profile_search_name"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="profile",
+            index=models.Index(
+                fields=["location_country", "role", "created_at"],
+                name="profile_country_role_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profile",
+            index=models.Index(
+                fields=["gender", "date_of_birth"], name="profile_gender_birth_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profile",
+            index=models.Index(fields=["created_at"], name="profile_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="profile",
+            index=models.Index(
+                fields=["last_name", "first_name"], name="profile_last_name_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profile",
+            index=models.Index(
+                fields=["first_name", "last_name"], name="profile_first_name_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profile",
+            index=models.Index(
+                condition=models.Q(("is_mentor", True)),
+                fields=["created_at"],
+                name="profile_mentor_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profile",
+            index=models.Index(
+                condition=models.Q(("is_movement_training_facilitator", True)),
+                fields=["created_at"],
+                name="profile_movement_trainer_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profile",
+            index=models.Index(
+                condition=models.Q(("is_skill_training_facilitator", True)),
+                fields=["created_at"],
+                name="profile_skill_trainer_idx",
+            ),
+        ),
+    ]
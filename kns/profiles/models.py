@@ -20,6 +20,7 @@ from kns.custom_user.models import User
 
 from . import constants, emails
 from . import methods as model_methods
+from .search import normalize_search_text
 
 
 class Profile(
@@ -31,6 +32,43 @@ class Profile(
     Represents a user profile in the system.
     """
 
+    class Meta:
+        # Indexes matching the filters and sorts of the profile directory
+        indexes = [
+            models.Index(
+                fields=["location_country", "role", "created_at"],
+                name="profile_country_role_idx",
+            ),
+            models.Index(
+                fields=["gender", "date_of_birth"],
+                name="profile_gender_birth_idx",
+            ),
+            models.Index(fields=["created_at"], name="profile_created_idx"),
+            models.Index(
+                fields=["last_name", "first_name"],
+                name="profile_last_name_idx",
+            ),
+            models.Index(
+                fields=["first_name", "last_name"],
+                name="profile_first_name_idx",
+            ),
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(is_mentor=True),
+                name="profile_mentor_idx",
+            ),
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(is_movement_training_facilitator=True),
+                name="profile_movement_trainer_idx",
+            ),
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(is_skill_training_facilitator=True),
+                name="profile_skill_trainer_idx",
+            ),
+        ]
+
     user = models.OneToOneField(
         User,
         related_name="profile",
@@ -185,6 +223,14 @@ class Profile(
         folder="kns/images/profiles/",
     )
 
+    # The normalised first and last name, kept up to date on save. It is
+    # not limited in length, as normalising can make a name longer.
+    search_name = models.TextField(
+        default="",
+        blank=True,
+        editable=False,
+    )
+
     def __str__(self):
         """
         Return the full name of the profile as string representation.
@@ -225,6 +271,104 @@ class Profile(
         """
         return f"{self.first_name} {self.last_name}"
 
+    def update_search_name(self):
+        """
+        Set `search_name` from the first and last name.
+
+        `save` calls it, so it only needs to be called directly when
+        saving without `save`, e.g. with `bulk_create`.
+        """
+        self.search_name = normalize_search_text(
+            f"{self.first_name or ''} {self.last_name or ''}",
+        )
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Load a profile, remembering the values loaded from the database.
+
+        Parameters
+        ----------
+        db : str
+            The alias of the database the profile was loaded from.
+        field_names : list of str
+            The names of the loaded fields.
+        values : list
+            The loaded values, in the order of `field_names`.
+
+        Returns
+        -------
+        Profile
+            The loaded profile.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+
+        return instance
+
+    def get_changed_fields(self, field_names):
+        """
+        Return the fields whose value differs from the one in the database.
+
+        The values are compared with those loaded with the profile or
+        written by its last save. Fields that were not loaded, and every
+        field of a profile that was not loaded from the database, count as
+        changed.
+
+        Parameters
+        ----------
+        field_names : iterable of str
+            The names of the fields to compare.
+
+        Returns
+        -------
+        set of str
+            The names of the changed fields.
+        """
+        loaded_values = getattr(self, "_loaded_values", None)
+
+        if loaded_values is None:
+            return set(field_names)
+
+        return {
+            name
+            for name in field_names
+            if name not in loaded_values or loaded_values[name] != getattr(self, name)
+        }
+
+    def save(self, *args, **kwargs):
+        """
+        Save the profile, updating its search name.
+
+        Parameters
+        ----------
+        *args : tuple
+            Positional arguments passed to the parent save method.
+        **kwargs : dict
+            Keyword arguments passed to the parent save method.
+        """
+        self.update_search_name()
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"first_name", "last_name"} & set(
+            update_fields
+        ):
+            kwargs["update_fields"] = {*update_fields, "search_name"}
+
+        super().save(*args, **kwargs)
+
+        saved_fields = kwargs.get("update_fields")
+        deferred_fields = self.get_deferred_fields()
+        self._loaded_values = {
+            **getattr(self, "_loaded_values", {}),
+            **{
+                field.attname: getattr(self, field.attname)
+                for field in self._meta.concrete_fields
+                if field.attname not in deferred_fields
+                and (saved_fields is None or field.name in saved_fields)
+            },
+        }
+
     def is_leading_group(self):
         """
         Check if the profile is leading a group.
@@ -396,7 +540,7 @@ class Profile(
         """
         from kns.core.models import Setting
 
-        settings = Setting.get_or_create_setting()
+        settings = Setting.get_cached()
 
         return model_methods.is_under_age(
             self,
@@ -495,7 +639,7 @@ class Profile(
         if not self.group_led.parent:
             return False
 
-        settings = Setting.get_or_create_setting()
+        settings = Setting.get_cached()
         return settings.change_role_approval_required
 
     def change_role_to_leader(self):
@@ -0,0 +1,63 @@
+"""
+Name search for the `profiles` app.
+
+Profiles store their normalised name in `Profile.search_name`, so a
+search only compares plain lowercase strings. On PostgreSQL the column
+has a trigram index, which `LIKE '%term%'` lookups use. Other databases
+scan the column, which is still cheaper than comparing both name columns
+case-insensitively.
+"""
+
+import unicodedata
+
+from django.db.models import Q
+
+
+def normalize_search_text(text):
+    """
+    Normalise a text for searching.
+
+    The text is lowercased, stripped of accents and its whitespace is
+    collapsed, so that "  José  DOE" becomes "jose doe".
+
+    Parameters
+    ----------
+    text : str or None
+        The text to normalise.
+
+    Returns
+    -------
+    str
+        The normalised text.
+    """
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+
+    return " ".join(stripped.casefold().split())
+
+
+def get_name_search_filter(query, prefix=""):
+    """
+    Return the filter matching the profiles whose name contains every
+    word of a search query.
+
+    Parameters
+    ----------
+    query : str
+        The search query.
+    prefix : str, optional
+        The lookup path to the profile, e.g. "leader__" to search the
+        leaders of groups. Defaults to searching profiles.
+
+    Returns
+    -------
+    Q
+        The filter of the search. It matches everything for an empty
+        query.
+    """
+    search_filter = Q()
+
+    for word in normalize_search_text(query).split():
+        search_filter &= Q(**{f"{prefix}search_name__contains": word})
+
+    return search_filter
@@ -0,0 +1,71 @@
+"""
+Saving of the items selected for a profile in the `profiles` app.
+
+Skills, interests, vocations, mentorship areas and faith milestones are
+all stored as one row per profile and item. When a profile form is
+saved, only the difference between the stored and the selected items is
+written: the new items in one `bulk_create` and the unselected items in
+one filtered `delete`.
+"""
+
+from django.db import transaction
+
+
+def sync_profile_selection(
+    profile,
+    model,
+    field_name,
+    selected,
+    remove_unselected=True,
+):
+    """
+    Make the rows of a profile match the items selected for it.
+
+    The difference is applied in a transaction. When called inside an
+    existing transaction it joins it without a savepoint, so several
+    selections of the same form can be saved atomically together.
+
+    Parameters
+    ----------
+    profile : Profile
+        The profile whose rows are saved.
+    model : type
+        The model linking the profile to the items, e.g. `ProfileSkill`.
+    field_name : str
+        The name of the foreign key from `model` to the item, e.g.
+        `"skill"`.
+    selected : iterable
+        The selected items (model instances).
+    remove_unselected : bool, optional
+        Whether stored items that are not selected are deleted. Defaults
+        to True.
+
+    Returns
+    -------
+    tuple of int
+        The number of rows created and deleted.
+    """
+    item_id_field = f"{field_name}_id"
+    selected_ids = {item.pk for item in selected}
+
+    stored_rows = model.objects.filter(profile=profile)
+    stored_ids = set(stored_rows.values_list(item_id_field, flat=True))
+
+    added_ids = selected_ids - stored_ids
+    removed_ids = stored_ids - selected_ids if remove_unselected else set()
+
+    deleted = 0
+
+    with transaction.atomic(savepoint=False):
+        if removed_ids:
+            deleted, _ = stored_rows.filter(
+                **{f"{item_id_field}__in": removed_ids},
+            ).delete()
+
+        if added_ids:
+            model.objects.bulk_create(
+                model(profile=profile, **{item_id_field: item_id})
+                for item_id in sorted(added_ids)
+            )
+
+    return len(added_ids), deleted
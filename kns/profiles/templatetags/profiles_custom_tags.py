@@ -39,11 +39,11 @@ def get_nth_element(lst, index):
 
 
 @register.filter
-def can_edit_profile(user, profile):
+def can_edit_profile(viewer, profile):
     """
-    Determine if the given user can edit the specified profile.
+    Determine if the given viewer can edit the specified profile.
 
-    This custom template filter checks if the `user` has the permission to edit the `profile`.
+    This custom template filter checks if the `viewer` has the permission to edit the `profile`.
     The user can edit the profile if:
     - The profile belongs to the user.
     - The profile does not belong to a leader with a usable password.
@@ -51,17 +51,18 @@ def can_edit_profile(user, profile):
 
     Parameters
     ----------
-    user : User
-        The user whose permissions are being checked.
+    viewer : Viewer
+        The viewer whose permissions are being checked, usually
+        `request.viewer`.
     profile : Profile
         The profile to be checked for edit permissions.
 
     Returns
     -------
     bool
-        `True` if the user can edit the profile, `False` otherwise.
+        `True` if the viewer can edit the profile, `False` otherwise.
     """
-    if profile == user.profile:
+    if profile == viewer.profile:
         return True
 
     if (
@@ -71,10 +72,7 @@ def can_edit_profile(user, profile):
     ):
         return False
 
-    if not hasattr(user.profile, "group_led"):  # pragma: no cover
-        return False
-
-    return user.profile.group_led.is_member(profile)
+    return viewer.leads_member(profile)
 
 
 @register.filter
@@ -99,21 +97,22 @@ def name_with_apostrophe(name: str):
 
 
 @register.filter
-def is_profiles_group_leader(user, profile):
+def is_profiles_group_leader(viewer, profile):
     """
-    Determine if the given user is the leader of the group to which
+    Determine if the given viewer is the leader of the group to which
     the specified profile belongs.
 
     Parameters
     ----------
-    user : User
-        The user whose leadership status is being checked.
+    viewer : Viewer
+        The viewer whose leadership status is being checked, usually
+        `request.viewer`.
     profile : Profile
-        The profile to be checked against the user's leadership.
+        The profile to be checked against the viewer's leadership.
 
     Returns
     -------
     bool
-        `True` if the user is the leader of the profile's group, `False` otherwise.
+        `True` if the viewer is the leader of the profile's group, `False` otherwise.
     """
-    return profile_utils.is_profiles_group_leader(user, profile)
+    return profile_utils.is_profiles_group_leader(viewer, profile)
@@ -6,6 +6,7 @@ from kns.custom_user.models import User
 from kns.groups.models import GroupMember
 from kns.groups.tests.factories import GroupFactory
 from kns.profiles.context_processors import profile_context
+from kns.profiles.viewer import Viewer
 
 
 class TestContextProcessors(TestCase):
@@ -36,6 +37,7 @@ class TestContextProcessors(TestCase):
     def test_profile_context_profile_does_not_exist(self):
         request = self.factory.get("/")
         request.user = self.user
+        request.viewer = Viewer.for_user(request.user)
 
         # Mock the resolver_match attribute
         request.resolver_match = MagicMock()
@@ -4,6 +4,7 @@ from kns.custom_user.models import User
 from kns.groups.models import Group
 
 from ..templatetags import can_edit_profile, get_nth_element, name_with_apostrophe
+from ..viewer import Viewer
 
 
 class GetNthElementFilterTest(TestCase):
@@ -84,7 +85,7 @@ class CanEditProfileFilterTest(TestCase):
     def test_can_edit_own_profile(self):
         """Test that a user can edit their own profile."""
         self.assertTrue(
-            can_edit_profile(self.user1, self.profile1),
+            can_edit_profile(Viewer.for_user(self.user1), self.profile1),
         )
 
     def test_leader_with_password_cannot_edit_another_leader(self):
@@ -94,7 +95,7 @@ class CanEditProfileFilterTest(TestCase):
 
         self.assertFalse(
             can_edit_profile(
-                self.user1,
+                Viewer.for_user(self.user1),
                 self.profile3,
             ),
         )
@@ -103,7 +104,7 @@ class CanEditProfileFilterTest(TestCase):
         """Test that a user not in the leader's group cannot edit another user's profile."""
         self.assertFalse(
             can_edit_profile(
-                self.user2,
+                Viewer.for_user(self.user2),
                 self.profile3,
             ),
         )
@@ -112,7 +113,7 @@ class CanEditProfileFilterTest(TestCase):
         """Test that a leader can edit a member's profile in their group."""
         self.assertTrue(
             can_edit_profile(
-                self.user1,
+                Viewer.for_user(self.user1),
                 self.profile2,
             ),
         )
@@ -122,7 +123,7 @@ class CanEditProfileFilterTest(TestCase):
         are not in the leader's group."""
         self.assertFalse(
             can_edit_profile(
-                self.user1,
+                Viewer.for_user(self.user1),
                 self.profile3,
             ),
         )
@@ -132,7 +133,7 @@ class CanEditProfileFilterTest(TestCase):
         profile cannot edit another user's profile."""
         self.assertFalse(
             can_edit_profile(
-                self.user2,
+                Viewer.for_user(self.user2),
                 self.profile3,
             ),
         )
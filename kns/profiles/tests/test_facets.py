@@ -0,0 +1,118 @@
+from django.test import TestCase
+
+from kns.custom_user.models import User
+from kns.skills.models import ProfileInterest, ProfileSkill, Skill
+from kns.vocations.models import ProfileVocation, Vocation
+
+from ..facets import add_facet_counts_to_form, filter_by_facets, get_facet_counts
+from ..forms import SkillsFilterForm
+from ..models import Profile
+
+
+class TestProfileFacets(TestCase):
+    def setUp(self):
+        self.anna, self.ben, self.cara = [
+            User.objects.create_user(
+                email=f"{name}@example.com",
+                password="testpass",
+            ).profile
+            for name in ["anna", "ben", "cara"]
+        ]
+
+        self.python, self.django = [
+            Skill.objects.create(
+                title=title,
+                content="This is a sample content",
+                author=self.anna,
+            )
+            for title in ["Python", "Django"]
+        ]
+        self.teacher = Vocation.objects.create(
+            title="Teacher",
+            description="Teaches students.",
+            author=self.anna,
+        )
+
+        # Anna has both skills, Ben only Python, Cara none
+        ProfileSkill.objects.create(profile=self.anna, skill=self.python)
+        ProfileSkill.objects.create(profile=self.anna, skill=self.django)
+        ProfileSkill.objects.create(profile=self.ben, skill=self.python)
+
+        ProfileInterest.objects.create(profile=self.cara, interest=self.django)
+        ProfileVocation.objects.create(profile=self.ben, vocation=self.teacher)
+
+    def test_filter_by_facets(self):
+        """
+        Profiles match any selected value of a facet, and every facet
+        with a selection, without duplicates.
+        """
+        profiles = Profile.objects.all()
+
+        self.assertQuerySetEqual(
+            filter_by_facets(profiles, {"skills": [self.python, self.django]}),
+            [self.anna, self.ben],
+            ordered=False,
+        )
+        self.assertQuerySetEqual(
+            filter_by_facets(
+                profiles,
+                {"skills": [self.python], "vocations": [self.teacher]},
+            ),
+            [self.ben],
+        )
+        self.assertQuerySetEqual(
+            filter_by_facets(profiles, {"skills": [], "vocations": None}),
+            profiles,
+            ordered=False,
+        )
+
+    def test_facet_counts(self):
+        """
+        The counts of a facet apply the selection of the other facets
+        only.
+        """
+        counts = get_facet_counts(
+            Profile.objects.all(),
+            {"skills": [self.django], "vocations": [self.teacher]},
+        )
+
+        # Only Ben has the selected vocation, and he only has Python
+        self.assertEqual(counts["skills"], {self.python.pk: 1})
+        # Only Anna has the selected skill, and she has no vocation
+        self.assertEqual(counts["vocations"], {})
+        # Nobody has both the selected skill and vocation
+        self.assertEqual(counts["interests"], {})
+        self.assertEqual(counts["mentorship_areas"], {})
+        self.assertEqual(counts["faith_milestones"], {})
+
+        counts = get_facet_counts(Profile.objects.all(), {})
+
+        self.assertEqual(
+            counts["skills"],
+            {self.python.pk: 2, self.django.pk: 1},
+        )
+        self.assertEqual(counts["interests"], {self.django.pk: 1})
+
+    def test_add_facet_counts_to_form(self):
+        """
+        The counts are shown in the choice labels of the filter forms.
+        """
+        form = SkillsFilterForm()
+        add_facet_counts_to_form(
+            form,
+            {"skills": {self.python.pk: 2}, "interests": {}},
+        )
+
+        self.assertIn((self.python.pk, "Python (2)"), self.get_choices(form, "skills"))
+        self.assertIn((self.django.pk, "Django (0)"), self.get_choices(form, "skills"))
+        self.assertIn(
+            (self.django.pk, "Django (0)"),
+            self.get_choices(form, "interests"),
+        )
+        self.assertIn(
+            (self.teacher.pk, "Teacher"),
+            self.get_choices(form, "vocations"),
+        )
+
+    def get_choices(self, form, name):
+        return [(choice.value, label) for choice, label in form.fields[name].choices]
@@ -0,0 +1,92 @@
+from django.test import TestCase
+
+from kns.custom_user.models import User
+
+from ..models import Profile
+from ..search import get_name_search_filter, normalize_search_text
+
+
+class TestNormalizeSearchText(TestCase):
+    def test_normalize_search_text(self):
+        """
+        Texts are lowercased, stripped of accents and their whitespace is
+        collapsed.
+        """
+        self.assertEqual(normalize_search_text("  José \t DOE "), "jose doe")
+        self.assertEqual(normalize_search_text("Ådéḿí"), "ademi")
+        self.assertEqual(normalize_search_text(None), "")
+
+
+class TestNameSearch(TestCase):
+    def setUp(self):
+        self.jose = self.create_profile("jose@example.com", "José", "Álvarez")
+        self.john = self.create_profile("john@example.com", "John", "Doe")
+
+    def create_profile(self, email, first_name, last_name):
+        profile = User.objects.create_user(email=email, password="testpass").profile
+        profile.first_name = first_name
+        profile.last_name = last_name
+        profile.save()
+
+        return profile
+
+    def search(self, query):
+        return set(Profile.objects.filter(get_name_search_filter(query)))
+
+    def test_search_name_is_updated_on_save(self):
+        """
+        Saving a profile updates its search name, including when only
+        some fields are saved.
+        """
+        self.assertEqual(self.jose.search_name, "jose alvarez")
+
+        self.john.first_name = "Jon"
+        self.john.save(update_fields=["first_name"])
+        self.john.refresh_from_db()
+
+        self.assertEqual(self.john.search_name, "jon doe")
+
+        # Saving other fields leaves the search name alone
+        self.john.role = "leader"
+        self.john.save(update_fields=["role"])
+
+        self.assertEqual(
+            Profile.objects.get(pk=self.john.pk).search_name,
+            "jon doe",
+        )
+
+    def test_search_name_of_names_that_expand(self):
+        """
+        Names that get longer once normalised are stored in full.
+        """
+        profile = self.create_profile("long@example.com", "ﷺ" * 25, "ß" * 25)
+        profile.refresh_from_db()
+
+        self.assertEqual(len(profile.search_name), 18 * 25 + 1 + 2 * 25)
+        self.assertTrue(profile.search_name.endswith(" " + "ss" * 25))
+
+    def test_search(self):
+        """
+        Profiles match when their name contains every word of the query,
+        ignoring case and accents.
+        """
+        self.assertEqual(self.search("jose"), {self.jose})
+        self.assertEqual(self.search("ALVAREZ"), {self.jose})
+        self.assertEqual(self.search("Álv José"), {self.jose})
+        self.assertEqual(self.search("John Doe"), {self.john})
+        self.assertEqual(self.search("John Álvarez"), set())
+
+    def test_empty_query(self):
+        """
+        An empty query matches every profile.
+        """
+        self.assertEqual(self.search("  "), set(Profile.objects.all()))
+
+    def test_prefix(self):
+        """
+        The search can follow a relation to a profile.
+        """
+        self.assertEqual(
+            str(get_name_search_filter("Doe", prefix="leader__")),
+            "(AND: ('leader__search_name__contains', 'doe'))",
+        )
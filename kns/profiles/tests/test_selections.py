@@ -0,0 +1,105 @@
+from django.test import TestCase
+
+from kns.custom_user.models import User
+from kns.faith_milestones.models import FaithMilestone, ProfileFaithMilestone
+from kns.profiles.selections import sync_profile_selection
+from kns.skills.models import ProfileSkill, Skill
+
+
+class TestSyncProfileSelection(TestCase):
+    def setUp(self):
+        self.profile = User.objects.create_user(
+            email="testuser@example.com",
+            password="password123",
+        ).profile
+
+        self.skills = [
+            Skill.objects.create(
+                title=f"Skill {number}",
+                content="This is a sample content",
+                author=self.profile,
+            )
+            for number in range(4)
+        ]
+
+    def get_skills(self):
+        return set(
+            ProfileSkill.objects.filter(
+                profile=self.profile,
+            ).values_list("skill", flat=True)
+        )
+
+    def test_sync_creates_the_selected_rows(self):
+        result = sync_profile_selection(
+            self.profile,
+            ProfileSkill,
+            "skill",
+            self.skills[:2],
+        )
+
+        self.assertEqual(result, (2, 0))
+        self.assertEqual(self.get_skills(), {skill.pk for skill in self.skills[:2]})
+
+    def test_sync_only_applies_the_difference(self):
+        kept = ProfileSkill.objects.create(profile=self.profile, skill=self.skills[0])
+        ProfileSkill.objects.create(profile=self.profile, skill=self.skills[1])
+
+        result = sync_profile_selection(
+            self.profile,
+            ProfileSkill,
+            "skill",
+            [self.skills[0], self.skills[2]],
+        )
+
+        self.assertEqual(result, (1, 1))
+        self.assertEqual(self.get_skills(), {self.skills[0].pk, self.skills[2].pk})
+        self.assertTrue(ProfileSkill.objects.filter(pk=kept.pk).exists())
+
+    def test_sync_query_count_does_not_depend_on_the_selection(self):
+        ProfileSkill.objects.create(profile=self.profile, skill=self.skills[0])
+
+        # One select, one delete and one insert
+        with self.assertNumQueries(3):
+            sync_profile_selection(
+                self.profile,
+                ProfileSkill,
+                "skill",
+                self.skills[1:],
+            )
+
+        # Nothing changed, so only the stored rows are read
+        with self.assertNumQueries(1):
+            sync_profile_selection(
+                self.profile,
+                ProfileSkill,
+                "skill",
+                self.skills[1:],
+            )
+
+    def test_sync_can_keep_the_unselected_rows(self):
+        milestones = [
+            FaithMilestone.objects.create(
+                title=f"Milestone {number}",
+                description="Sample description for a faith milestone",
+                author=self.profile,
+            )
+            for number in range(2)
+        ]
+        ProfileFaithMilestone.objects.create(
+            profile=self.profile,
+            faith_milestone=milestones[0],
+        )
+
+        result = sync_profile_selection(
+            self.profile,
+            ProfileFaithMilestone,
+            "faith_milestone",
+            [milestones[1]],
+            remove_unselected=False,
+        )
+
+        self.assertEqual(result, (1, 0))
+        self.assertEqual(
+            ProfileFaithMilestone.objects.filter(profile=self.profile).count(),
+            2,
+        )
@@ -15,6 +15,7 @@ from kns.profiles.utils import (
     name_with_apostrophe,
     populate_encryption_reasons,
 )
+from kns.profiles.viewer import Viewer
 
 
 class TestGetProfileSlug(TestCase):
@@ -185,7 +186,7 @@ class TestIsProfilesGroupLeader(TestCase):
         of their own group.
         """
         result = is_profiles_group_leader(
-            self.leader_user,
+            Viewer.for_user(self.leader_user),
             self.leader_profile,
         )
 
@@ -207,7 +208,7 @@ class TestIsProfilesGroupLeader(TestCase):
         new_profile = Profile.objects.create(user=user)
 
         result = is_profiles_group_leader(
-            self.leader_user,
+            Viewer.for_user(self.leader_user),
             new_profile,
         )
 
@@ -224,7 +225,7 @@ class TestIsProfilesGroupLeader(TestCase):
         )
 
         result = is_profiles_group_leader(
-            another_user,
+            Viewer.for_user(another_user),
             self.other_profile,
         )
         self.assertFalse(result)
@@ -235,7 +236,7 @@ class TestIsProfilesGroupLeader(TestCase):
         of the group containing the profile.
         """
         result = is_profiles_group_leader(
-            self.leader_user,
+            Viewer.for_user(self.leader_user),
             self.other_profile,
         )
         self.assertTrue(result)
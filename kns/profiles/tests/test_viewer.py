@@ -0,0 +1,100 @@
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+
+from kns.custom_user.models import User
+from kns.groups.tests.factories import GroupFactory
+
+from ..middleware import ViewerMiddleware
+from ..viewer import Viewer
+
+
+class TestViewer(TestCase):
+    def setUp(self):
+        self.leader = User.objects.create_user(
+            email="leader@example.com",
+            password="password123",
+        )
+        self.member = User.objects.create_user(
+            email="member@example.com",
+            password="password123",
+        )
+        self.outsider = User.objects.create_user(
+            email="outsider@example.com",
+            password="password123",
+        )
+
+        self.group = GroupFactory(leader=self.leader.profile)
+        self.group.add_member(self.member.profile)
+
+    def test_for_user_returns_the_same_viewer(self):
+        """
+        The viewer of a user is created once and shared.
+        """
+        viewer = Viewer.for_user(self.leader)
+
+        self.assertIs(Viewer.for_user(self.leader), viewer)
+        self.assertIsNot(Viewer.for_user(self.member), viewer)
+
+    def test_facts_are_loaded_once(self):
+        """
+        The profile and groups are loaded in one query, the members of the
+        led group in another, and `user.profile` reuses the loaded profile.
+        """
+        user = User.objects.get(pk=self.leader.pk)
+        viewer = Viewer.for_user(user)
+
+        with self.assertNumQueries(2):
+            self.assertEqual(viewer.profile, self.leader.profile)
+            self.assertEqual(viewer.group_led, self.group)
+            self.assertIsNone(viewer.group_in)
+            self.assertTrue(viewer.leads_member(self.member.profile))
+            self.assertFalse(viewer.leads_member(self.outsider.profile))
+            self.assertIs(user.profile, viewer.profile)
+            self.assertEqual(user.profile.group_led, self.group)
+
+    def test_member(self):
+        """
+        A member's viewer has their membership and no led group.
+        """
+        viewer = Viewer.for_user(User.objects.get(pk=self.member.pk))
+
+        self.assertEqual(viewer.group_in.group, self.group)
+        self.assertIsNone(viewer.group_led)
+        self.assertEqual(viewer.led_member_ids, frozenset())
+
+    def test_anonymous_user(self):
+        """
+        An anonymous user's viewer has no profile or groups.
+        """
+        viewer = Viewer.for_user(AnonymousUser())
+
+        with self.assertNumQueries(0):
+            self.assertIsNone(viewer.profile)
+            self.assertIsNone(viewer.group_led)
+            self.assertIsNone(viewer.group_in)
+            self.assertFalse(viewer.leads_member(self.member.profile))
+
+
+class TestViewerMiddleware(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.middleware = ViewerMiddleware(lambda request: HttpResponse(""))
+
+        self.user = User.objects.create_user(
+            email="user@example.com",
+            password="password123",
+        )
+
+    def test_viewer_is_attached_to_the_request(self):
+        """
+        The request's viewer is the viewer of the request's user.
+        """
+        request = self.factory.get("/")
+        request.user = self.user
+
+        self.middleware(request)
+
+        self.assertIs(request.viewer.user, self.user)
+        self.assertEqual(request.viewer.profile, self.user.profile)
+        self.assertIs(request.viewer._wrapped, Viewer.for_user(self.user))
@@ -2,7 +2,9 @@ from datetime import date, timedelta
 
 from django.contrib.messages import get_messages
 from django.core.paginator import Page
+from django.db import connection
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
@@ -13,6 +15,7 @@ from kns.classifications.models import (
     Subclassification,
 )
 from kns.core.models import Setting
+from kns.core.tests.query_budget import QueryBudgetMixin
 from kns.custom_user.models import User
 from kns.faith_milestones.models import FaithMilestone, ProfileFaithMilestone
 from kns.groups.models import Group, GroupMember
@@ -906,6 +909,44 @@ class TestViews(TestCase):
             f"{self.profile.get_full_name()}'s profile updated.",
         )
 
+    def test_edit_profile_skills_query_count_independent_of_selection(self):
+        """
+        Test that saving many skills costs as many queries as saving one.
+        """
+        skills = [
+            Skill.objects.create(
+                title=f"Skill {number}",
+                content="This is a sample content",
+                author=self.profile,
+            )
+            for number in range(self.settings.max_skills_per_user)
+        ]
+
+        url = reverse(
+            "profiles:edit_profile_skills",
+            kwargs={"profile_slug": self.profile.slug},
+        )
+
+        # Warm the session and the per-request caches first
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as few_skills:
+            self.client.post(url, data={"skills": [skills[0].id]})
+
+        ProfileSkill.objects.filter(profile=self.profile).delete()
+
+        with self.assertNumQueries(len(few_skills)):
+            response = self.client.post(
+                url,
+                data={"skills": [skill.id for skill in skills]},
+            )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            ProfileSkill.objects.filter(profile=self.profile).count(),
+            len(skills),
+        )
+
     def test_edit_profile_faith_milestones_get(self):
         """
         Test the GET request to edit_profile_faith_milestones view to
@@ -2226,6 +2267,51 @@ class TestIndexView(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.context["page_obj"]), 3)
 
+    def test_cursor_pagination(self):
+        """
+        Test that the previous and next links use cursors, keep the sorting
+        and give the same pages as the page numbers.
+        """
+        for i in range(15):
+            user_instance = User.objects.create_user(
+                email=f"user{i}@example.com",
+                password="password",
+            )
+
+            profile_instance = user_instance.profile
+
+            profile_instance.first_name = f"Firstname {i}"
+            profile_instance.last_name = f"Lastname {i % 5}"
+            profile_instance.save()
+
+        url = reverse("profiles:index")
+        params = {"sort_by": "last_name", "order": "desc"}
+        response = self.client.get(url, params)
+        cursor = response.context["page_obj"].next_cursor
+
+        self.assertContains(
+            response,
+            f"?sort_by=last_name&amp;order=desc&amp;cursor={cursor}",
+        )
+
+        response = self.client.get(url, {**params, "cursor": cursor})
+        page_obj = response.context["page_obj"]
+
+        self.assertEqual(page_obj.number, 2)
+        self.assertEqual(
+            list(page_obj),
+            list(self.client.get(url, {**params, "page": 2}).context["page_obj"]),
+        )
+        self.assertIsNone(page_obj.next_cursor)
+
+        response = self.client.get(url, {**params, "cursor": page_obj.previous_cursor})
+
+        self.assertEqual(response.context["page_obj"].number, 1)
+        self.assertEqual(
+            list(response.context["page_obj"]),
+            list(self.client.get(url, params).context["page_obj"]),
+        )
+
     def test_empty_form_does_not_filter(self):
         """
         Test that an empty form does not apply any filters.
@@ -2575,6 +2661,47 @@ class TestIndexView(TestCase):
         self.assertNotContains(response, "Jane Smith")
         self.assertNotContains(response, "Jack Reacher")
 
+    def test_view_search_ignores_case_and_accents(self):
+        """
+        Test that the search ignores case and accents.
+        """
+        response = self.client.get(
+            reverse("profiles:index"),
+            {
+                "search": "REACHÉR jäck",
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Jack Reacher")
+        self.assertNotContains(response, "Jane Smith")
+
+    def test_view_facet_counts(self):
+        """
+        Test that the filters show the number of matching profiles of
+        every value.
+        """
+        skill = Skill.objects.create(
+            title="Evangelism",
+            content="This is a sample content",
+            author=self.profile1,
+        )
+        ProfileSkill.objects.create(profile=self.profile1, skill=skill)
+        ProfileSkill.objects.create(profile=self.profile2, skill=skill)
+
+        response = self.client.get(reverse("profiles:index"))
+
+        self.assertContains(response, "Evangelism (2)")
+
+        response = self.client.get(
+            reverse("profiles:index"),
+            {
+                "search": "Jane",
+            },
+        )
+
+        self.assertContains(response, "Evangelism (1)")
+
 
 class TestMakeLeaderPageView(TestCase):
     def setUp(self):
@@ -4073,3 +4200,69 @@ class MoveToChildGroupViewTests(TestCase):
         # Check if the group led by profile2 is now a child of group3
         self.group2.refresh_from_db()
         self.assertEqual(self.group2.parent, self.group3)
+
+
+class TestIndexViewQueryBudget(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        """
+        Set up a leader whose group has members, one of them encrypted.
+        """
+        self.user = User.objects.create_user(
+            email="leader@example.com",
+            password="password123",
+        )
+        self.profile = self.user.profile
+        self.profile.first_name = "Lead"
+        self.profile.last_name = "Er"
+        self.profile.is_onboarded = True
+        self.profile.save()
+
+        self.group = Group.objects.create(
+            leader=self.profile,
+            name="Test Group",
+            description=test_constants.VALID_GROUP_DESCRIPTION,
+        )
+
+        for number in range(5):
+            member = User.objects.create_user(
+                email=f"member{number}@example.com",
+                password="password123",
+            ).profile
+            member.first_name = f"Member{number}"
+            member.last_name = "Doe"
+            member.save()
+
+            self.group.add_member(member)
+
+        ProfileEncryption.objects.create(
+            profile=member,
+            encrypted_by=self.profile,
+            first_name="Encrypted",
+            last_name="Member",
+            encryption_reason=EncryptionReason.objects.create(
+                title="Privacy",
+                description="Random description",
+                author=self.profile,
+            ),
+        )
+
+        self.client.login(
+            email="leader@example.com",
+            password="password123",
+        )
+
+    def test_index_query_budget(self):
+        """
+        The number of queries does not depend on the number of profiles
+        listed. The skills and interests filters both load the skills, and
+        the facet counts take a single query.
+        """
+        url = reverse("profiles:index")
+
+        # Warm the session and the per-request caches first
+        self.client.get(url)
+
+        with self.assertQueryBudget(14, max_repeats=2):
+            response = self.client.get(url)
+
+        self.assertEqual(len(response.context["page_obj"]), 6)
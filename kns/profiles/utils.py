@@ -7,8 +7,6 @@ from datetime import timedelta
 from django.urls import resolve
 from django.utils import timezone
 
-from kns.groups.models import Group, GroupMember
-
 from .models import EncryptionReason, Profile
 
 
@@ -112,42 +110,37 @@ def populate_encryption_reasons(encryption_reasons_data):
             )
 
 
-def is_profiles_group_leader(user, profile):
+def is_profiles_group_leader(viewer, profile):
     """
-    Determine if the given user is the leader of the group to which the specified profile belongs.
+    Determine if the given viewer is the leader of the group to which the
+    specified profile belongs.
 
     Parameters
     ----------
-    user : User
-        The user whose leadership status is being checked.
+    viewer : Viewer
+        The viewer whose leadership status is being checked, usually
+        `request.viewer`.
     profile : Profile
-        The profile to be checked against the user's leadership.
+        The profile to be checked against the viewer's leadership.
 
     Returns
     -------
     bool
-        `True` if the user is the leader of the profile's group, `False` otherwise.
+        `True` if the viewer is the leader of the profile's group, `False` otherwise.
     """
-    users_group_exists = Group.objects.filter(leader=user.profile).exists()
-
-    if not users_group_exists:
+    if viewer.group_led is None:
         return False
 
     # If profile is the leader of their own group
-    if not hasattr(profile, "group_in") and user.profile == profile:
+    if not hasattr(profile, "group_in") and viewer.profile == profile:
         return True
 
     # If the profile is not in any group, return False
     if not hasattr(profile, "group_in"):
         return False
 
-    profile_group_member_exists = GroupMember.objects.filter(
-        profile=profile,
-        group=user.profile.group_led,
-    ).exists()
-
     # Check if the user's profile is the leader of the group the profile belongs to
-    if user.profile == profile.group_in.group.leader:
+    if viewer.profile.pk == profile.group_in.group.leader_id:
         return True
 
-    return profile_group_member_exists
+    return viewer.leads_member(profile)
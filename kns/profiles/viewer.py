@@ -0,0 +1,148 @@
+"""
+Request-scoped access to the logged in user's profile and groups.
+
+Context processors, template tags and views all need the same facts
+about the user viewing a page: their profile, the group they lead, the
+group they are in and the members of the group they lead. A `Viewer`
+loads each of them at most once and is shared by everything handling
+the same request.
+"""
+
+from functools import cached_property
+
+from django.core.exceptions import ObjectDoesNotExist
+
+from kns.groups.models import GroupMember
+
+from .models import Profile
+
+
+class Viewer:
+    """
+    The user viewing a page, with lazily loaded profile and group facts.
+
+    Use `Viewer.for_user` to get the viewer of a user, which returns the
+    same instance for the lifetime of the user object, i.e. the request.
+
+    Parameters
+    ----------
+    user : User or AnonymousUser
+        The user viewing the page.
+    """
+
+    def __init__(self, user):
+        self.user = user
+
+    @classmethod
+    def for_user(cls, user):
+        """
+        Return the viewer of a user, creating it on first use.
+
+        Parameters
+        ----------
+        user : User or AnonymousUser
+            The user viewing the page, usually `request.user`.
+
+        Returns
+        -------
+        Viewer
+            The viewer stored on the user.
+        """
+        viewer = getattr(user, "_viewer", None)
+
+        if viewer is None:
+            viewer = cls(user)
+            user._viewer = viewer
+
+        return viewer
+
+    @cached_property
+    def profile(self):
+        """
+        Return the profile of the user, loaded with the group they are in
+        and the group they lead.
+
+        The profile is also cached on the user, so `user.profile` does not
+        query it again.
+
+        Returns
+        -------
+        Profile or None
+            The profile of the user, or None for anonymous users.
+        """
+        if not self.user.is_authenticated:
+            return None
+
+        profile = Profile.objects.select_related(
+            "group_in__group",
+            "group_led",
+        ).get(user_id=self.user.pk)
+        self.user.profile = profile
+
+        return profile
+
+    @cached_property
+    def group_led(self):
+        """
+        Return the group led by the user.
+
+        Returns
+        -------
+        Group or None
+            The group led by the user, or None if they do not lead one.
+        """
+        try:
+            return self.profile.group_led
+        except (AttributeError, ObjectDoesNotExist):
+            return None
+
+    @cached_property
+    def group_in(self):
+        """
+        Return the group membership of the user.
+
+        Returns
+        -------
+        GroupMember or None
+            The membership of the user, or None if they are not in a group.
+        """
+        try:
+            return self.profile.group_in
+        except (AttributeError, ObjectDoesNotExist):
+            return None
+
+    @cached_property
+    def led_member_ids(self):
+        """
+        Return the ids of the members of the group led by the user.
+
+        Returns
+        -------
+        frozenset of int
+            The profile ids of the members, empty if the user does not
+            lead a group.
+        """
+        if self.group_led is None:
+            return frozenset()
+
+        return frozenset(
+            GroupMember.objects.filter(
+                group=self.group_led,
+            ).values_list("profile_id", flat=True)
+        )
+
+    def leads_member(self, profile):
+        """
+        Return whether a profile is a member of the group led by the user.
+
+        Parameters
+        ----------
+        profile : Profile
+            The profile to check.
+
+        Returns
+        -------
+        bool
+            True if the profile is a member of the user's group.
+        """
+        return profile.pk in self.led_member_ids
@@ -7,8 +7,7 @@ from datetime import date, timedelta
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import ValidationError
-from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
-from django.db.models import Q
+from django.db import transaction
 from django.http import HttpResponseBadRequest
 from django.shortcuts import get_object_or_404, redirect, render
 from faker import Faker
@@ -23,6 +22,7 @@ from kns.classifications.models import (
 )
 from kns.core import emails as core_emails
 from kns.core import utils as core_utils
+from kns.core.pagination import get_directory_page
 from kns.custom_user.models import User
 from kns.faith_milestones.forms import ProfileFaithMilestonesForm
 from kns.faith_milestones.models import ProfileFaithMilestone
@@ -39,7 +39,10 @@ from kns.vocations.models import ProfileVocation
 
 from . import constants as profile_constants
 from . import forms as profile_forms
+from .facets import add_facet_counts_to_form, filter_by_facets, get_facet_counts
 from .models import ConsentForm, EncryptionReason, Profile, ProfileEncryption
+from .search import get_name_search_filter
+from .selections import sync_profile_selection
 from .utils import name_with_apostrophe
 
 
@@ -222,7 +225,12 @@ def index(request):
             first_name="",
             last_name="",
         )
-        .order_by("created_at")
+        .select_related(
+            "encryption",
+            "consent_form",
+            "group_led",
+            "group_in__group",
+        )
     )
 
     # Define a map for sortable fields
@@ -237,9 +245,11 @@ def index(request):
     sort_order = request.GET.get("order", "asc")
 
     # Ensure the requested sort field is valid
+    ordering = ["created_at"]
+
     if sort_by in sortable_fields:
         order_prefix = "-" if sort_order == "desc" else ""
-        profiles = profiles.order_by(f"{order_prefix}{sortable_fields[sort_by]}")
+        ordering = [f"{order_prefix}{sortable_fields[sort_by]}"]
 
     # Get the current user's group
     user_profile = request.user.profile
@@ -278,10 +288,7 @@ def index(request):
         # Search functionality
         search_query = request.GET.get("search")
         if search_query:
-            profiles = profiles.filter(
-                Q(first_name__icontains=search_query)
-                | Q(last_name__icontains=search_query)
-            )
+            profiles = profiles.filter(get_name_search_filter(search_query))
 
         if basic_info_form.is_valid():
             role = basic_info_form.cleaned_data.get("role")
@@ -357,61 +364,36 @@ def index(request):
                     is_mentor=True,
                 )
 
-        if skills_filter_form.is_valid():
-            # Process education and experience filter form data
-            skills = skills_filter_form.cleaned_data.get("skills")
-            interests = skills_filter_form.cleaned_data.get("interests")
-            vocations = skills_filter_form.cleaned_data.get("vocations")
+        # Collect the selected values of the many-to-many facets
+        facets = {}
 
-            if skills:
-                profiles = profiles.filter(
-                    skills__skill__in=skills,
-                ).distinct()
-            if interests:
-                profiles = profiles.filter(
-                    interests__interest__in=interests,
-                ).distinct()
-            if vocations:
-                profiles = profiles.filter(
-                    vocations__vocation__in=vocations,
-                ).distinct()
+        if skills_filter_form.is_valid():
+            for name in ["skills", "interests", "vocations"]:
+                facets[name] = skills_filter_form.cleaned_data.get(name)
 
         if mentorship_form.is_valid():
-            # Process mentorship filter form data
-            mentorship_areas = mentorship_form.cleaned_data.get(
+            facets["mentorship_areas"] = mentorship_form.cleaned_data.get(
                 "mentorship_areas",
             )
 
-            if mentorship_areas:
-                profiles = profiles.filter(
-                    mentorship_areas__mentorship_area__in=mentorship_areas,
-                )
-
         if faith_milestones_form.is_valid():
-            faith_milestones = faith_milestones_form.cleaned_data.get(
+            facets["faith_milestones"] = faith_milestones_form.cleaned_data.get(
                 "faith_milestones",
             )
 
-            if faith_milestones:
-                profiles = profiles.filter(
-                    faith_milestones__faith_milestone__in=faith_milestones,
-                )
+        # Count the results of every facet value before applying the facets
+        facet_counts = get_facet_counts(profiles, facets)
+        profiles = filter_by_facets(profiles, facets)
 
-    # Pagination
-    paginator = Paginator(profiles, 12)
-    page = request.GET.get("page")
+        for form in [skills_filter_form, mentorship_form, faith_milestones_form]:
+            add_facet_counts_to_form(form, facet_counts)
 
-    try:
-        page_obj = paginator.page(page)
-    except PageNotAnInteger:
-        page_obj = paginator.page(1)
-    except EmptyPage:  # pragma: no cover
-        page_obj = paginator.page(paginator.num_pages)
+    # Pagination, by cursor for the previous and next pages
+    page_obj = get_directory_page(request, profiles, 12, ordering)
 
     context = {
         "sort_by": sort_by,
         "page_obj": page_obj,
-        "page_obj": page_obj,
         "sort_order": sort_order,
         "search_query": search_query,
         "basic_info_form": basic_info_form,
@@ -1392,38 +1374,19 @@ def edit_profile_skills(request, profile_slug):
 
     if request.method == "POST":
         if profile_skills_form.is_valid():
-            # Delete all profile skills and interests before saving
-            ProfileSkill.objects.filter(profile=profile).delete()
-            ProfileInterest.objects.filter(profile=profile).delete()
-
             skills = profile_skills_form.cleaned_data.get("skills")
             interests = profile_skills_form.cleaned_data.get("interests")
 
-            for skill in skills:
-                profile_skill_exists = ProfileSkill.objects.filter(
-                    profile=profile,
-                    skill=skill,
+            # Only save the skills and interests that changed
+            with transaction.atomic():
+                sync_profile_selection(profile, ProfileSkill, "skill", skills)
+                sync_profile_selection(
+                    profile,
+                    ProfileInterest,
+                    "interest",
+                    interests,
                 )
 
-                if profile_skill_exists.count() == 0:
-                    profile_skill = ProfileSkill.objects.create(
-                        profile=profile, skill=skill
-                    )
-                    profile_skill.save()
-
-            for interest in interests:
-                profile_interest_exists = ProfileInterest.objects.filter(
-                    profile=profile,
-                    interest=interest,
-                )
-
-                if profile_interest_exists.count() == 0:
-                    profile_interest = ProfileInterest.objects.create(
-                        profile=profile,
-                        interest=interest,
-                    )
-                    profile_interest.save()
-
             messages.success(
                 request,
                 f"{name_with_apostrophe(profile.get_full_name())} profile updated.",
@@ -1480,22 +1443,10 @@ def edit_profile_vocations(request, profile_slug):
 
     if request.method == "POST":
         if profile_vocations_form.is_valid():
-            # Delete all profile vocations before saving
-            ProfileVocation.objects.filter(profile=profile).delete()
-
             vocations = profile_vocations_form.cleaned_data.get("vocations")
 
-            for vocation in vocations:
-                profile_vocation_exists = ProfileVocation.objects.filter(
-                    profile=profile,
-                    vocation=vocation,
-                )
-
-                if profile_vocation_exists.count() == 0:
-                    profile_vocation = ProfileVocation.objects.create(
-                        profile=profile, vocation=vocation
-                    )
-                    profile_vocation.save()
+            # Only save the vocations that changed
+            sync_profile_selection(profile, ProfileVocation, "vocation", vocations)
 
             messages.success(
                 request,
@@ -1677,19 +1628,14 @@ def edit_profile_faith_milestones(request, profile_slug):
                 "faith_milestones"
             )
 
-            for faith_milestone in faith_milestones:
-                profile_faith_milestone_exists = ProfileFaithMilestone.objects.filter(
-                    profile=profile,
-                    faith_milestone=faith_milestone,
-                ).exists()
-
-                if not profile_faith_milestone_exists:
-                    profile_faith_milestone = ProfileFaithMilestone.objects.create(
-                        profile=profile,
-                        faith_milestone=faith_milestone,
-                    )
-
-                    profile_faith_milestone.save()
+            # Faith milestones are only ever added, never removed
+            sync_profile_selection(
+                profile,
+                ProfileFaithMilestone,
+                "faith_milestone",
+                faith_milestones,
+                remove_unselected=False,
+            )
 
             messages.success(
                 request,
@@ -1979,17 +1925,15 @@ def edit_profile_mentorship_areas(request, profile_slug):
 
     if request.method == "POST":
         if profile_mentorship_areas_form.is_valid():
-            ProfileMentorshipArea.objects.filter(profile=profile).delete()
             mentorship_areas = profile_mentorship_areas_form.cleaned_data.get(
                 "mentorship_areas"
             )
-            for mentorship_area in mentorship_areas:
-                if not ProfileMentorshipArea.objects.filter(
-                    profile=profile, mentorship_area=mentorship_area
-                ).exists():
-                    ProfileMentorshipArea.objects.create(
-                        profile=profile, mentorship_area=mentorship_area
-                    )
+            sync_profile_selection(
+                profile,
+                ProfileMentorshipArea,
+                "mentorship_area",
+                mentorship_areas,
+            )
 
             messages.success(
                 request=request,
@@ -2074,9 +2018,9 @@ def move_to_sister_group(request, profile_slug, group_slug):
                 target_group=target_group,
             )
 
-            for recipient in notification_recipients:
-                group_change_notification.add_recipient(recipient=recipient)
+            group_change_notification.add_recipients(notification_recipients)
 
+            for recipient in notification_recipients:
                 # Send email notification
                 core_emails.send_group_change_notification_email(
                     request=request,
@@ -2178,9 +2122,9 @@ def move_to_child_group(request, profile_slug, group_slug):
             )
 
             # Add recipients to the notification and send email notifications
-            for recipient in notification_recipients:
-                group_change_notification.add_recipient(recipient=recipient)
+            group_change_notification.add_recipients(notification_recipients)
 
+            for recipient in notification_recipients:
                 # Send email notification
                 core_emails.send_group_change_notification_email(
                     request=request,
@@ -103,7 +103,7 @@ class ProfileSkillsForm(forms.Form):
         skills = cleaned_data.get("skills", [])
         interests = cleaned_data.get("interests", [])
 
-        settings = Setting.get_or_create_setting()
+        settings = Setting.get_cached()
 
         if len(skills) > settings.max_skills_per_user:
             error_msg = f"You can select up to {settings.max_skills_per_user} skills."
@@ -17,11 +17,100 @@ document.addEventListener('DOMContentLoaded', () => {
 
   const drawer = new Drawer($targetEl, options);
 
-  requestDrawerBtn.addEventListener('click', () => {
+  requestDrawerBtn.addEventListener('click', async () => {
     drawer.show();
+
+    await loadNotifications();
   });
 
   document.getElementById(closeButtonId).addEventListener('click', () => {
     drawer.hide();
   });
 });
+
+async function loadNotifications() {
+  const drawerBody = document.getElementById('requests-drawer-body');
+
+  try {
+    const { unread_count, periods } = await fetchNotifications(drawerBody.dataset.url);
+
+    populateNotifications(drawerBody, periods);
+    updateUnreadCount(unread_count);
+  } catch (error) {
+    console.error(error);
+  }
+}
+
+async function fetchNotifications(apiUrl) {
+  try {
+    const response = await fetch(apiUrl);
+    if (!response.ok) {
+      throw new Error('Failed to fetch notifications');
+    }
+
+    return await response.json();
+  } catch (error) {
+    throw new Error('Error fetching notifications: ' + error.message);
+  }
+}
+
+function createElement(tagName, className, text) {
+  const element = document.createElement(tagName);
+
+  element.className = className;
+  if (text !== undefined) {
+    element.textContent = text;
+  }
+
+  return element;
+}
+
+function createNotificationItem(notification) {
+  const item = createElement('div', 'border border-white shadow-sm rounded-md bg-white p-3 space-y-2');
+
+  const header = createElement('div', 'flex flex-row justify-between items-center');
+  const heading = createElement('div', 'flex justify-start gap-x-1');
+  const icon = createElement('iconify-icon', 'text-xl');
+  icon.setAttribute('icon', notification.icon);
+  heading.append(icon, createElement('h5', 'text-sm font-bold', notification.title));
+  header.append(
+    heading,
+    createElement('div', 'text-xs text-gray-500 font-light', notification.time_since_created),
+  );
+
+  const actions = createElement('div', 'flex items-center justify-start gap-x-2 font-semibold text-sm');
+  const link = createElement('a', 'text-blue-500 hover:text-blue-700', 'View');
+  link.href = notification.url;
+  actions.append(link);
+
+  item.append(header, createElement('p', 'text-xs font-medium text-gray-600', notification.message), actions);
+
+  return item;
+}
+
+function populateNotifications(drawerBody, periods) {
+  drawerBody.replaceChildren();
+
+  if (periods.length === 0) {
+    drawerBody.append(
+      createElement('div', 'p-2 text-sm font-medium bg-gray-200 text-gray-800', 'No pending notifications'),
+    );
+    return;
+  }
+
+  periods.forEach(({ period, notifications }) => {
+    const list = createElement('div', 'space-y-2');
+    list.append(...notifications.map(createNotificationItem));
+
+    drawerBody.append(createElement('p', 'font-medium text-gray-500 text-sm', period), list);
+  });
+}
+
+function updateUnreadCount(unreadCount) {
+  const countBadge = document.getElementById('requests-drawer-count');
+
+  if (!countBadge) return;
+
+  countBadge.textContent = unreadCount;
+  countBadge.classList.toggle('hidden', unreadCount === 0);
+}
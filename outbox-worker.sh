@@ -0,0 +1,6 @@
+#!/usr/bin/env bash
+
+set -o errexit  # exit on error
+
+# Send the emails queued in the outbox until the process is stopped
+python manage.py run_outbox --loop
@@ -60,10 +60,12 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "kns.core.middleware.RequestInstrumentationMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "kns.profiles.middleware.ViewerMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "kns.onboarding.middleware.OnboardingMiddleware",
@@ -73,7 +75,8 @@ ROOT_URLCONF = "project.urls"
 
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "BACKEND": "kns.core.instrumentation.InstrumentedDjangoTemplates",
+        "NAME": "django",
         "DIRS": [os.path.join(BASE_DIR, "kns", "templates")],
         "APP_DIRS": True,
         "OPTIONS": {
@@ -108,6 +111,42 @@ WSGI_APPLICATION = "project.wsgi.application"
 # DATABASES["default"] = dj_database_url.parse(config("DATABASE_URL"))
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/ref/settings/#caches
+
+# The default file-based cache is shared by every worker process on the
+# server, so invalidations reach all of them. Deployments running on more
+# than one server should point CACHE_BACKEND and CACHE_LOCATION at a
+# Redis or Memcached server instead. Bump CACHE_VERSION to discard every
+# cached value on deploy.
+
+CACHES = {
+    "default": {
+        "BACKEND": config(
+            "CACHE_BACKEND",
+            default="django.core.cache.backends.filebased.FileBasedCache",
+        ),
+        "LOCATION": config("CACHE_LOCATION", default=str(BASE_DIR / ".django_cache")),
+        "KEY_PREFIX": config("CACHE_KEY_PREFIX", default="kns"),
+        "VERSION": config("CACHE_VERSION", default=1, cast=int),
+        "TIMEOUT": config("CACHE_TIMEOUT", default=300, cast=int),
+    },
+}
+
+
+# Request instrumentation
+
+# Measures the database, template and context processor time of a sample
+# of the requests. It can also be turned on from the `Setting` model.
+
+REQUEST_INSTRUMENTATION = config("REQUEST_INSTRUMENTATION", default=False, cast=bool)
+REQUEST_INSTRUMENTATION_SAMPLE_PERCENT = config(
+    "REQUEST_INSTRUMENTATION_SAMPLE_PERCENT",
+    default=100,
+    cast=int,
+)
+
+
 # AUTH SETTINGS
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -176,6 +215,11 @@ EMAIL_PORT = config("EMAIL_PORT")
 EMAIL_HOST_USER = config("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = config("EMAIL_HOST_PASSWORD")
 
+# Queue outgoing emails in the outbox instead of sending them during the
+# request. Only enable this where the `run_outbox` worker is running (see
+# the README), otherwise queued emails are never sent.
+OUTBOX_ENABLED = config("OUTBOX_ENABLED", default=False, cast=bool)
+
 # Cloudinary configuration
 
 # flake8: noqa
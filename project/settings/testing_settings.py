@@ -7,8 +7,18 @@ DATABASES = {
     },
 }
 
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "kns-tests",
+        "KEY_PREFIX": "kns-tests",
+    },
+}
+
 EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 
+OUTBOX_ENABLED = True
+
 STORAGES = {
     "default": {
         "BACKEND": "django.core.files.storage.FileSystemStorage",